@@ -0,0 +1,70 @@
+"""
+Usage::
+
+    python -m benchmarks run [-k board.] [-o results.json]
+    python -m benchmarks compare before.json after.json [--threshold 0.1]
+
+``compare`` exits with status 1 if any case got slower by more than the
+threshold (10% by default).
+"""
+import sys
+
+import click
+
+from benchmarks import harness
+from benchmarks.cases import CASES
+
+
+@click.group()
+def cli():
+    pass
+
+
+@cli.command()
+@click.option("-k", "--filter", "pattern", default="", help="Only run cases whose name contains this.")
+@click.option("-o", "--output", type=click.Path(dir_okay=False), help="Where to save the results (JSON).")
+@click.option("--repeat", default=5, show_default=True)
+@click.option("--min-time", default=0.2, show_default=True, help="Minimum seconds per repeat.")
+def run(pattern: str, output: str, repeat: int, min_time: float):
+    names = [name for name in CASES if pattern in name]
+
+    if not names:
+        click.echo(f"No cases match '{pattern}'", err=True)
+        sys.exit(1)
+
+    width = max(map(len, names), default=0)
+
+    def report(name: str, timing: harness.Timing):
+        click.echo(f"{name:<{width}}  {harness.format_time(timing.best):>10}  "
+                   f"(median {harness.format_time(timing.median)}, {timing.calls} calls x {timing.repeat})")
+
+    results = harness.run(names, repeat, min_time, report)
+
+    if output:
+        harness.save(results, output)
+        click.echo(f"Saved to {output}")
+
+
+@cli.command()
+@click.argument("before", type=click.Path(exists=True, dir_okay=False))
+@click.argument("after", type=click.Path(exists=True, dir_okay=False))
+@click.option("--threshold", default=harness.DEFAULT_THRESHOLD, show_default=True,
+              help="Relative change that counts as a regression (or improvement).")
+def compare(before: str, after: str, threshold: float):
+    comparisons = harness.compare(harness.load(before), harness.load(after))
+    width = max((len(c.name) for c in comparisons), default=0)
+
+    for c in comparisons:
+        flag = "REGRESSION" if c.is_regression(threshold) else "improved" if c.is_improvement(threshold) else ""
+        click.echo(f"{c.name:<{width}}  {harness.format_time(c.before):>10} -> "
+                   f"{harness.format_time(c.after):>10}  {c.ratio:5.2f}x  {flag}")
+
+    regressions = [c for c in comparisons if c.is_regression(threshold)]
+
+    if regressions:
+        click.echo(f"{len(regressions)} regression(s) above {threshold:.0%}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    cli()
@@ -0,0 +1,150 @@
+"""
+The micro-benchmarks. Each case is a setup function (run once, untimed) that
+returns the callable to time.
+
+Boards are mutable, so cases that apply moves time a ``copy()`` along with
+the move (``copy`` is benchmarked on its own for reference).
+"""
+import warnings
+from typing import Callable
+
+from checkers.game import Game, default_board
+from checkers.io.archive import parse_games
+from checkers.io.fen import parse_fen, format_fen
+from checkers.io.sample_match import SAMPLE_GAME
+from checkers.logic.max_capture import compute_max_capture
+from checkers.logic.rules import is_valid_king_capture
+from checkers.models import Board, Move, PLAYER_ONE, PLAYER_TWO, capture_series_to_moves
+from checkers.utils.draw import draw_board, BoardRenderer
+from tests.conftest import make_board_1
+
+Case = Callable[[], Callable[[], object]]
+
+CASES: dict[str, Case] = {}
+
+# The sample match has a transcription error at turn 48, so we replay up to it.
+SAMPLE_PLIES = 95
+
+
+def case(name: str) -> Callable[[Case], Case]:
+    def register(setup: Case) -> Case:
+        CASES[name] = setup
+        return setup
+
+    return register
+
+
+def king_endgame() -> Board:
+    """Kings on both sides, where player one's best capture takes three."""
+    return Board([21, 10, 26], [42, 4, 5, 35, 7, 24], kings=[21, 10, 26, 42, 4, 5])
+
+
+def _uncached(board: Board) -> Board:
+    """A copy without the memoized analysis, so we time the actual work."""
+    return board.copy()
+
+
+# -- Models -------------------------------------------------------------------
+
+@case("board.init")
+def _board_init():
+    return lambda: Board(list(range(31, 51)), list(range(1, 21)))
+
+
+@case("board.from_masks")
+def _board_from_masks():
+    masks = default_board().to_masks()
+    return lambda: Board.from_masks(*masks)
+
+
+@case("board.copy")
+def _board_copy():
+    board = default_board()
+    return board.copy
+
+
+@case("board.getitem")
+def _board_getitem():
+    board = default_board()
+    return lambda: board[35]
+
+
+@case("board.apply_step")
+def _board_apply_step():
+    board, move = default_board(), Move(32, 28)
+    return lambda: board.copy().apply_step(move)
+
+
+@case("board.apply_captures")
+def _board_apply_captures():
+    board, moves = make_board_1(), capture_series_to_moves([28, 17, 8, 19])
+    return lambda: board.copy().apply_captures(moves)
+
+
+@case("move.iter")
+def _move_iter():
+    move = Move(46, 5)
+    return lambda: list(move)
+
+
+# -- Rules --------------------------------------------------------------------
+
+@case("rules.is_valid_king_capture")
+def _is_valid_king_capture():
+    board, move = king_endgame(), Move(26, 48)
+    return lambda: is_valid_king_capture(board, move)
+
+
+@case("max_capture.board_1")
+def _max_capture_make_board_1():
+    board = make_board_1()
+    return lambda: compute_max_capture(_uncached(board), PLAYER_ONE)
+
+
+@case("max_capture.king_endgame")
+def _max_capture_king_endgame():
+    board = king_endgame()
+    return lambda: (compute_max_capture(_uncached(board), PLAYER_ONE),
+                    compute_max_capture(_uncached(board), PLAYER_TWO))
+
+
+# -- I/O ----------------------------------------------------------------------
+
+@case("io.replay_sample_match")
+def _replay_sample_match():
+    game, = parse_games(SAMPLE_GAME.split("\n"))
+    moves = game.moves[:SAMPLE_PLIES]
+
+    def replay():
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            g = Game()
+
+            for move in moves:
+                g.play(move)
+
+    return replay
+
+
+@case("io.parse_fen")
+def _parse_fen():
+    fen = format_fen(default_board(), PLAYER_ONE)
+    return lambda: parse_fen(fen)
+
+
+@case("io.draw_board")
+def _draw_board():
+    board = default_board()
+    return lambda: draw_board(board)
+
+
+@case("io.render_diff")
+def _render_diff():
+    renderer = BoardRenderer()
+    before, after = default_board(), default_board().apply_step(Move(32, 28))
+
+    def render():
+        renderer.frame(before)
+        return renderer.update(after)
+
+    return render
@@ -0,0 +1,117 @@
+"""
+Timing, saving and comparing benchmark runs.
+
+Every case is timed with ``timeit``: first we calibrate how many calls take
+at least ``min_time`` seconds, then we time that many calls ``repeat`` times.
+The best repeat is the least disturbed by everything else on the machine, so
+that's what we compare.
+"""
+import datetime
+import json
+import os
+import platform
+import statistics
+import subprocess
+import timeit
+from dataclasses import dataclass, asdict
+from typing import Optional, Iterable, Callable
+
+from benchmarks.cases import CASES
+
+DEFAULT_THRESHOLD = 0.1
+
+
+@dataclass
+class Timing:
+    best: float  # Seconds per call
+    median: float
+    calls: int
+    repeat: int
+
+
+@dataclass
+class Comparison:
+    name: str
+    before: float
+    after: float
+
+    @property
+    def ratio(self) -> float:
+        return self.after / self.before
+
+    def is_regression(self, threshold: float = DEFAULT_THRESHOLD) -> bool:
+        return self.ratio > 1 + threshold
+
+    def is_improvement(self, threshold: float = DEFAULT_THRESHOLD) -> bool:
+        return self.ratio < 1 - threshold
+
+
+def time_case(name: str, repeat: int = 5, min_time: float = 0.2) -> Timing:
+    timer = timeit.Timer(CASES[name]())
+    calls, _ = timer.autorange()
+    calls = max(1, int(calls * min_time / 0.2))
+    times = [t / calls for t in timer.repeat(repeat, calls)]
+
+    return Timing(min(times), statistics.median(times), calls, repeat)
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def get_metadata() -> dict:
+    import numpy
+    import pydantic
+
+    return {
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpus": os.cpu_count(),
+        "packages": {"numpy": numpy.__version__, "pydantic": pydantic.VERSION},
+    }
+
+
+def run(names: Optional[Iterable[str]] = None, repeat: int = 5, min_time: float = 0.2,
+        on_result: Callable[[str, Timing], None] = lambda name, timing: None) -> dict:
+    results = {"metadata": get_metadata(), "results": {}}
+
+    for name in (CASES if names is None else names):
+        timing = time_case(name, repeat, min_time)
+        results["results"][name] = asdict(timing)
+        on_result(name, timing)
+
+    return results
+
+
+def save(results: dict, path: str):
+    with open(path, "w") as f:
+        json.dump(results, f, indent=2)
+
+
+def load(path: str) -> dict:
+    with open(path) as f:
+        return json.load(f)
+
+
+def compare(before: dict, after: dict) -> list[Comparison]:
+    """Compares the best times of the cases in both runs."""
+    return [Comparison(name, before["results"][name]["best"], result["best"])
+            for name, result in after["results"].items()
+            if name in before["results"]]
+
+
+def format_time(seconds: float) -> str:
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("µs", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.2f} {unit}"
+
+    return f"{seconds / 1e-9:.0f} ns"
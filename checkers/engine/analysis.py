@@ -0,0 +1,60 @@
+"""
+Multi-PV analysis: instead of only the best move, rank the top ``k`` candidate
+moves with their scores and principal variations.
+
+All root moves are searched by the same ``Searcher``, so the ``k`` lines (and
+successive depths) share one transposition table. Each root move is searched
+with a window whose lower bound is the ``k``-th best score found so far: moves
+that fail low can't make the top ``k`` and are cut off early, moves that don't
+fail low get an exact score.
+"""
+from dataclasses import dataclass
+from typing import Iterator, Optional
+
+from checkers.engine.search import Searcher, INFINITY
+from checkers.game import format_cmd
+from checkers.logic.legal_moves import LegalMove, get_legal_moves, apply_move
+from checkers.models import Board, Player
+
+
+@dataclass
+class AnalysisLine:
+    move: LegalMove
+    score: int
+    depth: int
+    pv: list[LegalMove]
+
+    @property
+    def notation(self) -> list[str]:
+        return [format_cmd(move) for move in self.pv]
+
+
+def analyse(board: Board, player: Player, k: int = 3, depth: int = 4, *,
+            searcher: Optional[Searcher] = None) -> Iterator[list[AnalysisLine]]:
+    """A generator over the top-``k`` lines (best first) at depth 1, 2, ...,
+    ``depth``, so callers can show progress as the analysis deepens."""
+    searcher = searcher or Searcher()
+    root_moves = get_legal_moves(board, player)
+    children = [apply_move(board, move) for move in root_moves]
+    k = min(k, len(root_moves))
+
+    # The order in which we search the root moves. Best-first makes the
+    # ``k``-th best bound tighter sooner.
+    order = list(range(len(root_moves)))
+
+    for d in range(1, depth + 1):
+        lines: list[AnalysisLine] = []
+
+        for i in order:
+            alpha = lines[k - 1].score if len(lines) >= k else -INFINITY
+            score, pv = searcher.negamax(children[i], not player, d - 1, -INFINITY, -alpha, ply=1)
+            score = -score
+
+            if score > alpha:
+                lines.append(AnalysisLine(root_moves[i], score, d, [root_moves[i], *pv]))
+                lines.sort(key=lambda line: -line.score)
+
+        ranked = [root_moves.index(line.move) for line in lines]
+        order = ranked + [i for i in order if i not in ranked]
+
+        yield lines[:k]
@@ -0,0 +1,45 @@
+"""
+A static evaluation of a board: material, plus a small bonus for advancing
+normal pieces towards coronation (tempo) and for men that still guard their
+own back row (which keeps the opponent from crowning).
+
+Scores are always from the point of view of the player to move ("negamax"
+convention), so a good score for one player is the negation of the score for
+the other.
+"""
+from checkers.logic.legal_moves import LegalMove, get_captured
+from checkers.models import Board, Player, PLAYER_ONE
+from checkers.models.position import row_of
+
+MAN_VALUE = 100
+KING_VALUE = 300
+ADVANCEMENT_VALUE = 2
+BACK_RANK_VALUE = 4
+
+
+def rows_advanced(idx: int, player: Player) -> int:
+    """Player one starts at the bottom (row 9) and moves up."""
+    return 9 - row_of(idx) if player is PLAYER_ONE else row_of(idx)
+
+
+def piece_value(idx: int, player: Player, is_king: bool) -> int:
+    if is_king:
+        return KING_VALUE
+
+    advanced = rows_advanced(idx, player)
+    return MAN_VALUE + ADVANCEMENT_VALUE * advanced + (BACK_RANK_VALUE if advanced == 0 else 0)
+
+
+def evaluate(board: Board, player: Player) -> int:
+    score = 0
+
+    for idx, owner, is_king in board:
+        value = piece_value(idx, owner, is_king)
+        score += value if owner is player else -value
+
+    return score
+
+
+def captured_value(board: Board, move: LegalMove) -> int:
+    """The material ``move`` captures (ignoring advancement)."""
+    return sum(KING_VALUE if board[i].is_king else MAN_VALUE for i in get_captured(board, move))
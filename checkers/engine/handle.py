@@ -0,0 +1,141 @@
+"""
+Running a search in the background under ``SearchLimits``.
+
+:func:`start_search` starts an iterative deepening search in a worker thread
+and returns a :class:`SearchHandle` right away. The handle can be waited on
+(``handle.wait()``), awaited from asyncio (``await handle``) or stopped
+(``handle.stop()``). Stopping (or running into a limit) abandons the current
+iteration at the next node, so the result is the deepest *completed*
+iteration. If not even the first iteration finished, the first legal move is
+returned, so there's always a move to play.
+
+Progress is reported after every completed iteration.
+
+.. NOTE:: ``on_progress`` is called from the worker thread. From asyncio, hand
+   it over with ``loop.call_soon_threadsafe``.
+"""
+import asyncio
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Optional, Callable
+
+from checkers.engine.search import Searcher, SearchResult, SearchStopped, SearchLimits, WIN_SCORE, MAX_DEPTH
+from checkers.logic.legal_moves import LegalMove, get_legal_moves
+from checkers.models import Board, Player
+
+
+@dataclass
+class Progress:
+    depth: int
+    nodes: int
+    seconds: float
+    move: Optional[LegalMove]
+    score: int
+
+    @property
+    def nps(self) -> float:
+        return self.nodes / self.seconds if self.seconds else 0.
+
+
+class SearchHandle:
+    def __init__(self, board: Board, player: Player, limits: SearchLimits = SearchLimits(),
+                 on_progress: Optional[Callable[[Progress], None]] = None, *, searcher: Optional[Searcher] = None):
+        self.board = board
+        self.player = player
+        self.limits = limits
+        self.on_progress = on_progress
+        self.searcher = searcher or Searcher()
+        self.result: Optional[SearchResult] = None  # The deepest completed iteration
+        self._future: Future[SearchResult] = Future()
+        self._lock = threading.Lock()  # Guards swapping the searcher's limits
+        self._previous_limits = self.searcher.limits  # Restored when the search ends
+        self._running = True
+        self.searcher.limits = limits
+        self.searcher.nodes = 0
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _search(self):
+        start = time.perf_counter()
+
+        try:
+            for result in self.searcher.iterate(self.board, self.player, self.limits.depth):
+                self.result = result
+
+                if self.on_progress is not None:
+                    self.on_progress(Progress(result.depth, result.nodes, time.perf_counter() - start,
+                                              result.move, result.score))
+
+                # No moves, or a forced win/loss: searching deeper won't change anything
+                if result.move is None or abs(result.score) >= WIN_SCORE - MAX_DEPTH:
+                    break
+        except SearchStopped:
+            pass
+
+    def _run(self):
+        error = None
+
+        try:
+            self._search()
+        except Exception as e:
+            error = e
+        finally:
+            # The searcher may be the caller's, so it gets its own limits back
+            with self._lock:
+                self.searcher.limits = self._previous_limits
+                self._running = False
+
+        if error is not None:
+            self._future.set_exception(error)
+            return
+
+        if self.result is None:
+            moves = get_legal_moves(self.board, self.player)
+            self.result = SearchResult(moves[0] if moves else None, 0, 0, self.searcher.nodes, moves[:1])
+
+        self._future.set_result(self.result)
+
+    @property
+    def done(self) -> bool:
+        return self._future.done()
+
+    def wait(self, timeout: Optional[float] = None) -> SearchResult:
+        return self._future.result(timeout)
+
+    def set_limits(self, limits: SearchLimits):
+        """Replaces the limits of the running search (e.g., to put a clock on
+        a search that started out pondering). The depth limit stays as it was."""
+        with self._lock:
+            self.limits = limits
+
+            if self._running:
+                self.searcher.limits = limits
+
+    def add_done_callback(self, fn: Callable[[SearchResult], None]):
+        """Calls ``fn`` with the result when the search is done (right away if
+        it already is). Like ``on_progress``, this runs in the worker thread."""
+        def callback(future: Future[SearchResult]):
+            if future.exception() is None:
+                fn(future.result())
+
+        self._future.add_done_callback(callback)
+
+    def stop(self, timeout: Optional[float] = None) -> SearchResult:
+        """Stops the search and returns its result."""
+        self.searcher.stop_event.set()
+
+        try:
+            return self.wait(timeout)
+        finally:
+            if self.done:
+                self.searcher.stop_event.clear()
+
+    def __await__(self):
+        return asyncio.wrap_future(self._future).__await__()
+
+
+def start_search(board: Board, player: Player, limits: SearchLimits = SearchLimits(),
+                 on_progress: Optional[Callable[[Progress], None]] = None) -> SearchHandle:
+    return SearchHandle(board, player, limits, on_progress)
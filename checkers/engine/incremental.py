@@ -0,0 +1,133 @@
+"""
+An evaluation that's kept up to date as pieces move, instead of rescanning the
+board at every leaf.
+
+:class:`IncrementalEvaluation` tracks a board (see ``Board.track``): every
+piece that's put on or taken off the board adds or subtracts its entry in
+``_TERMS``, so ``apply_step``, ``apply_captures`` and coronation (which
+replaces the piece) cost a couple of table lookups per changed square. Since
+the terms are ints, undoing a move (:func:`checkers.logic.legal_moves.unmake_move`)
+restores them exactly, and copying a tracked board copies its evaluation.
+
+Per player, it keeps:
+
+- ``material``: ``MAN_VALUE`` per man and ``KING_VALUE`` per king,
+- ``tempo``: the total number of rows the men have advanced, and
+- ``back_rank``: the number of men still on their own back row.
+
+:meth:`IncrementalEvaluation.score` weighs them (see :data:`WEIGHTS`) like
+:func:`checkers.engine.evaluation.evaluate` does. With ``debug=True``, every
+call to ``score`` checks all of the terms against a full recompute.
+"""
+from typing import NamedTuple
+
+from checkers.engine.evaluation import evaluate, rows_advanced, MAN_VALUE, KING_VALUE, ADVANCEMENT_VALUE, \
+    BACK_RANK_VALUE
+from checkers.models import Board, Piece, Player, PLAYER_ONE, PLAYER_TWO
+
+
+class Terms(NamedTuple):
+    material: int = 0
+    tempo: int = 0
+    back_rank: int = 0
+
+
+WEIGHTS = Terms(1, ADVANCEMENT_VALUE, BACK_RANK_VALUE)
+
+
+def piece_terms(piece: Piece) -> Terms:
+    if piece.is_king:
+        return Terms(KING_VALUE)
+
+    advanced = rows_advanced(piece.idx, piece.player)
+    return Terms(MAN_VALUE, advanced, int(advanced == 0))
+
+
+# Indexed by ``[player][is_king][idx]`` (like ``board._PIECES``)
+_TERMS = {player: tuple(tuple(piece_terms(Piece(i, player, is_king)) if i else None for i in range(51))
+                        for is_king in (False, True))
+          for player in (PLAYER_ONE, PLAYER_TWO)}
+
+
+class EvaluationMismatch(AssertionError):
+    pass
+
+
+def compute_terms(board: Board, player: Player) -> Terms:
+    """The terms of ``player``'s pieces, from scratch."""
+    totals = [0] * len(Terms._fields)
+
+    for piece in board:
+        if piece.player is player:
+            for k, term in enumerate(_TERMS[player][piece.is_king][piece.idx]):
+                totals[k] += term
+
+    return Terms(*totals)
+
+
+class IncrementalEvaluation:
+    """Tracks the evaluation terms of ``board``. Use :func:`track_evaluation`
+    to set one up."""
+
+    def __init__(self, board: Board, *, debug: bool = False):
+        self.board = board
+        self.debug = debug
+        self._totals = {player: list(compute_terms(board, player)) for player in (PLAYER_ONE, PLAYER_TWO)}
+
+    def add(self, piece: Piece):
+        totals = self._totals[piece.player]
+
+        for k, term in enumerate(_TERMS[piece.player][piece.is_king][piece.idx]):
+            totals[k] += term
+
+    def remove(self, piece: Piece):
+        totals = self._totals[piece.player]
+
+        for k, term in enumerate(_TERMS[piece.player][piece.is_king][piece.idx]):
+            totals[k] -= term
+
+    def copy(self, board: Board) -> 'IncrementalEvaluation':
+        """A copy that tracks ``board`` (a copy of the tracked board)."""
+        evaluation = IncrementalEvaluation.__new__(IncrementalEvaluation)
+        evaluation.board = board
+        evaluation.debug = self.debug
+        evaluation._totals = {player: list(totals) for player, totals in self._totals.items()}
+        return evaluation
+
+    def terms(self, player: Player) -> Terms:
+        return Terms(*self._totals[player])
+
+    def score(self, player: Player) -> int:
+        """Same as ``evaluate(self.board, player)``."""
+        own, other = self._totals[player], self._totals[not player]
+        score = (own[0] - other[0]) * WEIGHTS.material + (own[1] - other[1]) * WEIGHTS.tempo \
+            + (own[2] - other[2]) * WEIGHTS.back_rank
+
+        if self.debug:
+            self.check()
+
+            if score != (expected := evaluate(self.board, player)):
+                raise EvaluationMismatch(f"Incremental score {score} != {expected}")
+
+        return score
+
+    def check(self):
+        """Raises ``EvaluationMismatch`` if any of the terms are off."""
+        for player in (PLAYER_ONE, PLAYER_TWO):
+            if (terms := self.terms(player)) != (expected := compute_terms(self.board, player)):
+                raise EvaluationMismatch(f"Incremental terms {terms} != {expected} for player {player}")
+
+
+def track_evaluation(board: Board, *, debug: bool = False) -> IncrementalEvaluation:
+    """Attaches an :class:`IncrementalEvaluation` to ``board`` (and returns it)."""
+    evaluation = IncrementalEvaluation(board, debug=debug)
+    board.add_tracker(evaluation)
+    return evaluation
+
+
+def get_score(board: Board, player: Player) -> int:
+    """The incremental score if ``board`` is tracked, else ``evaluate``."""
+    if (evaluation := board.find_tracker(IncrementalEvaluation)) is not None:
+        return evaluation.score(player)
+
+    return evaluate(board, player)
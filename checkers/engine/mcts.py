@@ -0,0 +1,352 @@
+"""
+Monte Carlo tree search (UCT) as an alternative to alpha-beta.
+
+The tree is stored in flat arrays (one entry per node) instead of one Python
+object per node:
+
+- ``parent``, ``first_child`` and ``n_children`` describe the shape (the
+  children of a node are contiguous; ``n_children`` is ``UNEXPANDED`` until a
+  node is expanded, or ``FULL`` if the tree had no room for its children),
+- ``moves`` holds the move that leads to the node (see ``encode_move``),
+- ``visits`` and ``wins`` the statistics (from the point of view of the
+  player who made that move).
+
+The tree expands with the exact rules (see
+:func:`checkers.logic.legal_moves.get_legal_moves`). Playouts use a
+cheaper policy on a plain list of squares (with the ray tables from
+:mod:`checkers.logic.batch`): a random capture (continued with random jumps for
+as long as possible) if there is one, else a random step. It ignores the
+maximum capture rule, which is fine for estimating who's better. Playouts
+reuse preallocated buffers (see :class:`_Buffers`).
+"""
+import math
+import random
+import time
+from array import array
+from dataclasses import dataclass
+from typing import Optional
+
+from checkers.logic.batch import RAYS, OFF_BOARD, MAN, KING, EMPTY
+from checkers.logic.legal_moves import LegalMove, apply_move, encode_move, decode_move, get_legal_moves
+from checkers.models import Board, Player, PLAYER_ONE
+
+# Per square (0-based): the rays in every direction, without the off-board padding
+_RAYS = tuple(tuple(tuple(sq for sq in ray if sq != OFF_BOARD) for ray in square_rays)
+              for square_rays in RAYS.tolist())
+_UP, _DOWN = (0, 1), (2, 3)
+
+# ``n_children`` of a node that has yet to be expanded, or can't be because
+# the tree is full (so we don't generate its moves on every visit)
+UNEXPANDED = -1
+FULL = -2
+
+# More moves than a position can have (even with 20 kings)
+_MAX_MOVES = 2048
+
+
+class _Buffers:
+    """Preallocated storage for playouts: the cells, plus the candidate
+    captures and steps of a ply as parallel lists of squares (the squares are
+    small ints, which Python doesn't allocate, so a playout doesn't allocate
+    anything per move)."""
+    __slots__ = ("cells", "cap_start", "cap_taken", "cap_end", "step_start", "step_end")
+
+    def __init__(self):
+        self.cells = [EMPTY] * 50
+        self.cap_start = [0] * _MAX_MOVES
+        self.cap_taken = [0] * _MAX_MOVES
+        self.cap_end = [0] * _MAX_MOVES
+        self.step_start = [0] * _MAX_MOVES
+        self.step_end = [0] * _MAX_MOVES
+
+    def load(self, board: Board) -> list[int]:
+        """Fills ``cells`` with ``board`` (encoded like ``boards_to_array``)."""
+        cells = self.cells
+        cells[:] = _EMPTY_CELLS
+
+        for idx, owner, is_king in board:
+            cells[idx - 1] = (KING if is_king else MAN) * (1 if owner is PLAYER_ONE else -1)
+
+        return cells
+
+
+_EMPTY_CELLS = (EMPTY,) * 50
+
+
+def _playout(cells: list[int], side: int, rng: random.Random, max_plies: int,
+             buffers: Optional[_Buffers] = None) -> float:
+    """Plays random moves on ``cells`` (50 squares, encoded like
+    ``boards_to_array``; ``side`` is 1 for player one, -1 for player two) and
+    returns 1 if player one wins, 0 if player two wins, 0.5 if undecided after
+    ``max_plies``.
+
+    Modifies ``cells`` in place.
+    """
+    buf = buffers or _Buffers()
+    end = 0
+
+    for _ in range(max_plies):
+        n_caps = n_steps = 0
+
+        for sq in range(50):
+            piece = cells[sq] * side
+
+            if piece == MAN:
+                n_caps = _man_captures(cells, side, sq, buf, n_caps)
+
+                for d in (_UP if side == 1 else _DOWN):
+                    if (ray := _RAYS[sq][d]) and cells[ray[0]] == EMPTY:
+                        buf.step_start[n_steps], buf.step_end[n_steps] = sq, ray[0]
+                        n_steps += 1
+            elif piece == KING:
+                n_caps = _king_captures(cells, side, sq, buf, n_caps)
+                n_steps = _king_steps(cells, sq, buf, n_steps)
+
+        if n_caps:
+            k = rng.randrange(n_caps)
+            sq, captured, end = buf.cap_start[k], buf.cap_taken[k], buf.cap_end[k]
+            is_king = cells[sq] * side == KING
+
+            while True:
+                cells[end], cells[sq], cells[captured] = cells[sq], EMPTY, EMPTY
+                sq = end
+
+                if is_king:
+                    n_caps = _king_captures(cells, side, sq, buf, 0)
+                else:
+                    n_caps = _man_captures(cells, side, sq, buf, 0)
+
+                if not n_caps:
+                    break
+
+                k = rng.randrange(n_caps)
+                captured, end = buf.cap_taken[k], buf.cap_end[k]
+        elif n_steps:
+            k = rng.randrange(n_steps)
+            sq, end = buf.step_start[k], buf.step_end[k]
+            cells[end], cells[sq] = cells[sq], EMPTY
+        else:
+            return 0. if side == 1 else 1.  # The side to move loses
+
+        # Coronation
+        if cells[end] * side == MAN and (end < 5 if side == 1 else end >= 45):
+            cells[end] = KING * side
+
+        side = -side
+
+    material = sum(cells)
+    return 1. if material > 0 else 0. if material < 0 else .5
+
+
+def _man_captures(cells: list[int], side: int, sq: int, buf: _Buffers, n: int) -> int:
+    for d in range(4):
+        ray = _RAYS[sq][d]
+
+        if len(ray) > 1 and cells[ray[0]] * side < 0 and cells[ray[1]] == EMPTY:
+            buf.cap_start[n], buf.cap_taken[n], buf.cap_end[n] = sq, ray[0], ray[1]
+            n += 1
+
+    return n
+
+
+def _king_captures(cells: list[int], side: int, sq: int, buf: _Buffers, n: int) -> int:
+    for ray in _RAYS[sq]:
+        for k, target in enumerate(ray):
+            if cells[target] == EMPTY:
+                continue
+
+            if cells[target] * side < 0:
+                for end in ray[k + 1:]:
+                    if cells[end] != EMPTY:
+                        break
+
+                    buf.cap_start[n], buf.cap_taken[n], buf.cap_end[n] = sq, target, end
+                    n += 1
+
+            break
+
+    return n
+
+
+def _king_steps(cells: list[int], sq: int, buf: _Buffers, n: int) -> int:
+    for ray in _RAYS[sq]:
+        for target in ray:
+            if cells[target] != EMPTY:
+                break
+
+            buf.step_start[n], buf.step_end[n] = sq, target
+            n += 1
+
+    return n
+
+
+def _decode(moves: array, long_moves: dict[int, LegalMove], node: int) -> LegalMove:
+    return long_moves[node] if node in long_moves else decode_move(moves[node])
+
+
+@dataclass
+class MCTSResult:
+    move: Optional[LegalMove]
+    visits: int
+    win_rate: float
+    playouts: int
+    seconds: float
+
+    @property
+    def playouts_per_second(self) -> float:
+        return self.playouts / self.seconds if self.seconds else 0.
+
+
+class MCTS:
+    def __init__(self, board: Board, player: Player, *, exploration: float = math.sqrt(2),
+                 max_nodes: int = 1 << 16, max_playout_plies: int = 200, seed: Optional[int] = None):
+        self.exploration = exploration
+        self.max_nodes = max_nodes
+        self.max_playout_plies = max_playout_plies
+        self.random = random.Random(seed)
+        self._buffers = _Buffers()
+        self._reset(board, player)
+
+    def _reset(self, board: Board, player: Player):
+        self.board = board
+        self.player = player
+        self.parent = array("i", [-1])
+        self.first_child = array("i", [0])
+        self.n_children = array("i", [UNEXPANDED])
+        self.moves = array("q", [0])
+        self.visits = array("i", [0])
+        self.wins = array("d", [0.])
+        self._long_moves: dict[int, LegalMove] = {}  # Moves too long for ``encode_move``
+
+    def __len__(self) -> int:
+        return len(self.visits)
+
+    def _move(self, node: int) -> LegalMove:
+        return _decode(self.moves, self._long_moves, node)
+
+    def _add_child(self, parent: int, move: LegalMove):
+        node = len(self.visits)
+
+        try:
+            self.moves.append(encode_move(move))
+        except ValueError:
+            self.moves.append(0)
+            self._long_moves[node] = move
+
+        self.parent.append(parent)
+        self.first_child.append(0)
+        self.n_children.append(UNEXPANDED)
+        self.visits.append(0)
+        self.wins.append(0.)
+
+    def _expand(self, node: int, board: Board, player: Player):
+        moves = get_legal_moves(board, player)
+
+        if len(self) + len(moves) > self.max_nodes:
+            self.n_children[node] = FULL
+            return
+
+        self.first_child[node] = len(self)
+        self.n_children[node] = len(moves)
+
+        for move in moves:
+            self._add_child(node, move)
+
+    def _select(self, node: int) -> int:
+        first, n = self.first_child[node], self.n_children[node]
+        log_visits = math.log(self.visits[node] or 1)
+        best, best_score = first, -1.
+
+        for child in range(first, first + n):
+            if not (visits := self.visits[child]):
+                return child
+
+            score = self.wins[child] / visits + self.exploration * math.sqrt(log_visits / visits)
+
+            if score > best_score:
+                best, best_score = child, score
+
+        return best
+
+    def playout(self):
+        """One iteration: selection, expansion, a playout and backpropagation."""
+        node, board, player = 0, self.board, self.player
+
+        while self.n_children[node] > 0:
+            node = self._select(node)
+            board, player = apply_move(board, self._move(node)), not player
+
+        if self.n_children[node] == UNEXPANDED:
+            self._expand(node, board, player)
+
+            if self.n_children[node] > 0:
+                node = self.first_child[node] + self.random.randrange(self.n_children[node])
+                board, player = apply_move(board, self._move(node)), not player
+
+        if self.n_children[node] == 0:
+            p1_reward = 0. if player is PLAYER_ONE else 1.
+        else:
+            cells = self._buffers.load(board)
+            p1_reward = _playout(cells, 1 if player is PLAYER_ONE else -1, self.random, self.max_playout_plies,
+                                 self._buffers)
+
+        # The reward at each node is for the player who made the move leading to it
+        while node != -1:
+            mover = not player
+            self.visits[node] += 1
+            self.wins[node] += p1_reward if mover is PLAYER_ONE else 1. - p1_reward
+            node, player = self.parent[node], mover
+
+    def run(self, playouts: int = 1000, seconds: Optional[float] = None) -> MCTSResult:
+        """Runs ``playouts`` iterations (or as many as fit in ``seconds``)."""
+        start = time.perf_counter()
+        done = 0
+
+        while done < playouts if seconds is None else time.perf_counter() - start < seconds:
+            self.playout()
+            done += 1
+
+        return self._result(done, time.perf_counter() - start)
+
+    def _result(self, playouts: int, seconds: float) -> MCTSResult:
+        if self.n_children[0] <= 0:
+            return MCTSResult(None, 0, 0., playouts, seconds)
+
+        first = self.first_child[0]
+        best = max(range(first, first + self.n_children[0]), key=lambda c: self.visits[c])
+        visits = self.visits[best]
+
+        return MCTSResult(self._move(best), visits, self.wins[best] / visits if visits else 0., playouts, seconds)
+
+    def advance(self, move: LegalMove):
+        """Play ``move`` at the root, keeping the statistics of its subtree
+        (if it was explored) for the next search."""
+        board = apply_move(self.board, move)
+        children = range(self.first_child[0], self.first_child[0] + max(self.n_children[0], 0))
+        new_root = next((c for c in children if self._move(c) == move), None)
+
+        if new_root is None:
+            return self._reset(board, not self.player)
+
+        old_n_children, old_first_child, old_moves, old_long_moves, old_visits, old_wins = \
+            self.n_children, self.first_child, self.moves, self._long_moves, self.visits, self.wins
+        self._reset(board, not self.player)
+
+        # Copy the subtree breadth-first (so children stay contiguous)
+        self.visits[0], self.wins[0] = old_visits[new_root], old_wins[new_root]
+        queue = [(new_root, 0)]
+
+        for old_node, node in queue:
+            if old_n_children[old_node] <= 0:
+                # There may be room for the children of ``FULL`` nodes now
+                n_children = old_n_children[old_node]
+                self.n_children[node] = UNEXPANDED if n_children == FULL else n_children
+                continue
+
+            self.first_child[node] = len(self)
+            self.n_children[node] = old_n_children[old_node]
+
+            for old_child in range(old_first_child[old_node], old_first_child[old_node] + old_n_children[old_node]):
+                queue.append((old_child, len(self)))
+                self._add_child(node, _decode(old_moves, old_long_moves, old_child))
+                self.visits[-1], self.wins[-1] = old_visits[old_child], old_wins[old_child]
@@ -0,0 +1,204 @@
+"""
+Lazy SMP: a parallel search in which several worker processes search the same
+root position, and only communicate through a shared transposition table.
+
+Workers don't split up the tree. Instead, they all search to the requested
+depth but are nudged to search differently (the helpers shuffle their move
+orderings), so the entries one worker stores let the others skip parts of the
+tree.
+
+The shared table lives in :mod:`multiprocessing.shared_memory`. Entries are
+written without locks: a write that races with another write is detected on
+read (the stored check is ``key ^ data ^ move``) and simply treated as a miss.
+"""
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from multiprocessing.shared_memory import SharedMemory
+from typing import Optional
+
+import numpy as np
+
+from checkers.engine.search import Searcher, SearchResult, TTEntry, Bound, INFINITY
+from checkers.logic.legal_moves import LegalMove, encode_move, decode_move
+from checkers.models import Board, Player
+
+_MASK = 0xFFFFFFFFFFFFFFFF
+_NO_MOVE = 0
+
+ENTRY_DTYPE = np.dtype([("check", np.uint64), ("data", np.uint64), ("move", np.uint64)])
+
+
+def _pack(depth: int, score: int, bound: Bound) -> int:
+    return (score + INFINITY) << 16 | depth << 8 | bound
+
+
+def _unpack(data: int) -> tuple[int, int, Bound]:
+    return (data >> 8) & 0xFF, (data >> 16) - INFINITY, Bound(data & 0xFF)
+
+
+class SharedTranspositionTable:
+    """A fixed-size transposition table (with the same interface as
+    ``TranspositionTable``) in shared memory.
+
+    Create it once (``name=None``), then attach to it from other processes by
+    ``name``. The creator is responsible for calling ``unlink``.
+    """
+
+    def __init__(self, size: int = 1 << 16, *, name: Optional[str] = None):
+        self.size = size
+
+        if name is None:
+            self._shm = SharedMemory(create=True, size=size * ENTRY_DTYPE.itemsize)
+        else:
+            self._shm = SharedMemory(name=name)
+
+        self._entries = np.ndarray((size,), dtype=ENTRY_DTYPE, buffer=self._shm.buf)
+
+        if name is None:
+            self.clear()
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    def get(self, key: int) -> Optional[TTEntry]:
+        key &= _MASK
+        check, data, move = (int(v) for v in self._entries[key % self.size])
+
+        if check == 0 or check ^ data ^ move != key:
+            return None
+
+        return TTEntry(*_unpack(data), decode_move(move) if move != _NO_MOVE else None)
+
+    def store(self, key: int, entry: TTEntry):
+        key &= _MASK
+        slot = self._entries[key % self.size]
+        check, data, move = (int(v) for v in slot)
+
+        # Keep the deeper entry for the same position, but always replace
+        # entries for other positions.
+        if check ^ data ^ move == key and _unpack(data)[0] > entry.depth:
+            return
+
+        try:
+            move = encode_move(entry.move) if entry.move is not None else _NO_MOVE
+        except ValueError:
+            move = _NO_MOVE
+
+        data = _pack(entry.depth, entry.score, entry.bound)
+        self._entries[key % self.size] = (key ^ data ^ move, data, move)
+
+    def clear(self):
+        self._entries[:] = 0
+
+    def __len__(self) -> int:
+        return int(np.count_nonzero(self._entries["check"]))
+
+    def close(self):
+        del self._entries
+        self._shm.close()
+
+    def unlink(self):
+        self._shm.unlink()
+
+
+class _HelperSearcher(Searcher):
+    """Searches the non-TT moves in a (seeded) random order, so that helpers
+    don't all walk the tree in lockstep."""
+
+    def __init__(self, tt: SharedTranspositionTable, seed: int):
+        super().__init__(tt)
+        self.random = random.Random(seed)
+
+    def order_moves(self, moves: list[LegalMove], tt_move: Optional[LegalMove]) -> list[LegalMove]:
+        moves = list(moves)
+        self.random.shuffle(moves)
+        return super().order_moves(moves, tt_move)
+
+
+@dataclass
+class WorkerReport:
+    worker: int
+    depth: int
+    nodes: int
+    seconds: float
+
+    @property
+    def nps(self) -> float:
+        return self.nodes / self.seconds if self.seconds else 0.
+
+
+@dataclass
+class ParallelSearchResult:
+    result: SearchResult
+    workers: list[WorkerReport]
+    seconds: float
+
+    @property
+    def nodes(self) -> int:
+        return sum(w.nodes for w in self.workers)
+
+    @property
+    def nps(self) -> float:
+        return self.nodes / self.seconds if self.seconds else 0.
+
+
+def _search_worker(tt_name: str, tt_size: int, board: Board, player: Player,
+                   depth: int, worker: int) -> tuple[SearchResult, WorkerReport]:
+    tt = SharedTranspositionTable(tt_size, name=tt_name)
+    start = time.perf_counter()
+
+    try:
+        # Worker 0 is the "main" thread of Lazy SMP and uses the regular move
+        # ordering.
+        searcher = Searcher(tt) if worker == 0 else _HelperSearcher(tt, seed=worker)
+        result = None
+
+        for result in searcher.iterate(board, player, depth):
+            pass
+
+        return result, WorkerReport(worker, result.depth, searcher.nodes, time.perf_counter() - start)
+    finally:
+        tt.close()
+
+
+def parallel_search(board: Board, player: Player, depth: int, workers: Optional[int] = None, *,
+                    tt_size: int = 1 << 16, executor: Optional[ProcessPoolExecutor] = None) -> ParallelSearchResult:
+    """Searches ``board`` to ``depth`` with ``workers`` processes (by default:
+    one per CPU) and returns the result of the main worker (worker 0)."""
+    workers = workers or os.cpu_count() or 1
+    tt = SharedTranspositionTable(tt_size)
+    start = time.perf_counter()
+    own_executor = executor is None
+    executor = executor or ProcessPoolExecutor(workers)
+
+    try:
+        futures = [executor.submit(_search_worker, tt.name, tt_size, board.copy(), player, depth, i)
+                   for i in range(workers)]
+        results = [f.result() for f in futures]
+    finally:
+        if own_executor:
+            executor.shutdown()
+
+        tt.close()
+        tt.unlink()
+
+    return ParallelSearchResult(results[0][0], [report for _, report in results], time.perf_counter() - start)
+
+
+def benchmark(board: Board, player: Player, depth: int, worker_counts=(1, 2, 4)) -> dict[int, ParallelSearchResult]:
+    """Runs ``parallel_search`` for each number of workers, so you can compare
+    the throughput (``.nps``) as the number of cores grows."""
+    return {n: parallel_search(board, player, depth, n) for n in worker_counts}
+
+
+if __name__ == "__main__":
+    from checkers.game import default_board
+    from checkers.models import PLAYER_ONE
+
+    for n, r in benchmark(default_board(), PLAYER_ONE, 3, (1, 2, os.cpu_count() or 1)).items():
+        print(f"{n:>3} workers: {r.nodes:>8} nodes in {r.seconds:6.2f}s ({r.nps:8.0f} nodes/s), "
+              f"best move {r.result.move} at depth {r.result.depth}")
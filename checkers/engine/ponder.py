@@ -0,0 +1,96 @@
+"""
+Pondering: thinking on the opponent's time.
+
+After the engine picks a move, its principal variation also predicts the
+opponent's reply. While the opponent is thinking, a worker thread already
+searches the position after that reply:
+
+- If the opponent plays the predicted move (a "ponder hit"), we simply wait for
+  the worker to finish. The work done so far isn't wasted.
+- Otherwise, we stop the worker and search the actual position. (The
+  transposition table is shared, so even a miss isn't a total loss.)
+"""
+import threading
+from typing import Optional
+
+from checkers.engine.search import Searcher, SearchResult, SearchStopped
+from checkers.logic.legal_moves import apply_move
+from checkers.models import Board, Player
+
+
+class _PonderSearch:
+    def __init__(self, searcher: Searcher, board: Board, player: Player, depth: int):
+        self.searcher = searcher
+        self.board = board
+        self.player = player
+        self.result: Optional[SearchResult] = None
+        self.thread = threading.Thread(target=self._run, args=(depth,), daemon=True)
+        self.thread.start()
+
+    def _run(self, depth: int):
+        try:
+            for self.result in self.searcher.iterate(self.board, self.player, depth):
+                pass
+        except SearchStopped:
+            pass
+
+    def is_hit(self, board: Board, player: Player) -> bool:
+        return player is self.player and board == self.board
+
+    def wait(self) -> Optional[SearchResult]:
+        self.thread.join()
+        return self.result
+
+    def cancel(self):
+        self.searcher.stop_event.set()
+        self.thread.join()
+        self.searcher.stop_event.clear()
+
+
+class PonderingEngine:
+    """An engine (that searches to a fixed ``depth``) which keeps searching
+    in the background after returning a move.
+
+    Only one search runs at a time, so the ``Searcher`` (and its
+    transposition table) never has to be shared between threads.
+    """
+
+    def __init__(self, depth: int = 4, *, ponder: bool = True):
+        self.depth = depth
+        self.ponder = ponder
+        self.searcher = Searcher()
+        self.ponder_hits = 0
+        self.ponder_misses = 0
+        self._pondering: Optional[_PonderSearch] = None
+
+    def choose_move(self, board: Board, player: Player) -> SearchResult:
+        result = self._take_ponder_result(board, player) or self._search(board, player)
+
+        if self.ponder and len(result.pv) >= 2:
+            expected = apply_move(apply_move(board, result.pv[0]), result.pv[1])
+            self._pondering = _PonderSearch(self.searcher, expected, player, self.depth)
+
+        return result
+
+    def stop(self):
+        """Cancel any ongoing pondering (e.g., when the game is over)."""
+        if self._pondering is not None:
+            self._pondering.cancel()
+            self._pondering = None
+
+    def _take_ponder_result(self, board: Board, player: Player) -> Optional[SearchResult]:
+        if (pondering := self._pondering) is None:
+            return None
+
+        self._pondering = None
+
+        if pondering.is_hit(board, player):
+            self.ponder_hits += 1
+            return pondering.wait()
+
+        self.ponder_misses += 1
+        pondering.cancel()
+
+    def _search(self, board: Board, player: Player) -> SearchResult:
+        *_, result = self.searcher.iterate(board, player, self.depth)
+        return result
@@ -0,0 +1,257 @@
+"""
+An alpha-beta (negamax) search with a transposition table.
+
+At the nominal depth, the search goes on with a quiescence search: captures
+are forced, so as long as the player to move can capture we keep searching
+(only) the captures. Evaluating in the middle of an exchange would count
+the captured material for one side but not the recapture. Captures that
+can't raise alpha, even if they won ``DELTA_MARGIN`` more than the material
+they take, are pruned ("delta pruning").
+
+Leaves are scored with the incremental evaluation of
+:mod:`checkers.engine.incremental`, which the root board carries down.
+
+The transposition table is keyed by :func:`position_key`, which only depends on
+the pieces and the player to move. Since ``Board.__hash__`` hashes a tuple of
+ints and bools, keys are stable across processes (no hash randomization).
+"""
+import threading
+import time
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Optional, NamedTuple, Iterator
+
+from checkers.engine.evaluation import captured_value, KING_VALUE, MAN_VALUE
+from checkers.engine.incremental import IncrementalEvaluation, get_score, track_evaluation
+from checkers.logic.attacks import get_analysis
+from checkers.logic.legal_moves import LegalMove, get_legal_moves, apply_move, has_legal_moves
+from checkers.logic.move_lists import legal_moves
+from checkers.models import Board, Player
+
+INFINITY = 1_000_000
+WIN_SCORE = 100_000
+MAX_DEPTH = 64
+
+# The most a capture can gain on top of the captured material (a coronation)
+DELTA_MARGIN = KING_VALUE - MAN_VALUE
+
+
+class SearchStopped(Exception):
+    """Raised (and caught by whoever started the search) when a search is
+    cancelled halfway."""
+
+
+class Bound(IntEnum):
+    EXACT = 0
+    LOWER = 1
+    UPPER = 2
+
+
+class TTEntry(NamedTuple):
+    depth: int
+    score: int
+    bound: Bound
+    move: Optional[LegalMove]
+
+
+def position_key(board: Board, player: Player) -> int:
+    return hash((board, player))
+
+
+class TranspositionTable:
+    """A dict of ``TTEntry``'s that keeps the deepest entry per position."""
+
+    def __init__(self):
+        self._entries: dict[int, TTEntry] = {}
+
+    def get(self, key: int) -> Optional[TTEntry]:
+        return self._entries.get(key)
+
+    def store(self, key: int, entry: TTEntry):
+        if (existing := self._entries.get(key)) is None or existing.depth <= entry.depth:
+            self._entries[key] = entry
+
+    def clear(self):
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+@dataclass(frozen=True)
+class SearchLimits:
+    """When a search has to stop: after iterating to ``depth``, at the
+    ``deadline`` (a ``time.monotonic()`` timestamp, see :meth:`within`), after
+    visiting ``nodes`` nodes, or when the (external) ``cancel`` event is set."""
+    depth: int = MAX_DEPTH
+    deadline: Optional[float] = None
+    nodes: Optional[int] = None
+    cancel: Optional[threading.Event] = None
+
+    @classmethod
+    def within(cls, seconds: float, **kwargs) -> 'SearchLimits':
+        return cls(deadline=time.monotonic() + seconds, **kwargs)
+
+    def is_exceeded(self, nodes: int) -> bool:
+        return (self.nodes is not None and nodes >= self.nodes) \
+            or (self.deadline is not None and time.monotonic() >= self.deadline) \
+            or (self.cancel is not None and self.cancel.is_set())
+
+
+NO_LIMITS = SearchLimits()
+
+
+@dataclass
+class SearchResult:
+    move: Optional[LegalMove]
+    score: int
+    depth: int
+    nodes: int
+    pv: list[LegalMove] = field(default_factory=list)
+
+
+class Searcher:
+    """Holds the state shared between (iterations of) searches: the
+    transposition table and a node counter.
+
+    Setting ``stop_event`` (e.g., from another thread) or exceeding the
+    ``limits`` makes the running search raise ``SearchStopped``. (The node
+    limit counts ``nodes``, so reset it before starting a limited search.)
+    """
+
+    def __init__(self, tt: Optional[TranspositionTable] = None, limits: SearchLimits = NO_LIMITS, *,
+                 quiescence: bool = True):
+        self.tt = tt if tt is not None else TranspositionTable()
+        self.nodes = 0
+        self.stop_event = threading.Event()
+        self.limits = limits
+        self.quiescence = quiescence
+
+    def evaluate(self, board: Board, player: Player) -> int:
+        return get_score(board, player)
+
+    def order_moves(self, moves: list[LegalMove], tt_move: Optional[LegalMove]) -> list[LegalMove]:
+        """Try the move the transposition table remembers first."""
+        if tt_move is None:
+            return moves
+
+        return sorted(moves, key=lambda m: m != tt_move)
+
+    def negamax(self, board: Board, player: Player, depth: int,
+                alpha: int = -INFINITY, beta: int = INFINITY, ply: int = 0) -> tuple[int, list[LegalMove]]:
+        """Returns the score of ``board`` for ``player`` and the principal
+        variation that leads to it."""
+        if depth <= 0 and self.quiescence:
+            return self.quiesce(board, player, alpha, beta, ply)
+
+        self._visit()
+
+        if depth <= 0:
+            return self.evaluate(board, player), []
+
+        key = position_key(board, player)
+        entry = self.tt.get(key)
+        alpha_orig = alpha
+
+        if entry is not None and entry.depth >= depth:
+            if entry.bound is Bound.EXACT:
+                return entry.score, [entry.move] if entry.move is not None else []
+            elif entry.bound is Bound.LOWER:
+                alpha = max(alpha, entry.score)
+            else:
+                beta = min(beta, entry.score)
+
+            if alpha >= beta:
+                return entry.score, [entry.move] if entry.move is not None else []
+
+        moves = legal_moves(board, player)
+
+        if not moves:
+            # A player loses if they cannot make any valid moves. (Prefer the
+            # quickest win / slowest loss.)
+            return -WIN_SCORE + ply, []
+
+        best_score, best_pv = -INFINITY, []
+
+        for move in self.order_moves(moves, entry and entry.move):
+            score, pv = self.negamax(apply_move(board, move), not player, depth - 1, -beta, -alpha, ply + 1)
+            score = -score
+
+            if score > best_score:
+                best_score, best_pv = score, [move, *pv]
+
+            alpha = max(alpha, score)
+
+            if alpha >= beta:
+                break
+
+        if best_score <= alpha_orig:
+            bound = Bound.UPPER
+        elif best_score >= beta:
+            bound = Bound.LOWER
+        else:
+            bound = Bound.EXACT
+
+        self.tt.store(key, TTEntry(depth, best_score, bound, best_pv[0]))
+
+        return best_score, best_pv
+
+    def quiesce(self, board: Board, player: Player,
+                alpha: int = -INFINITY, beta: int = INFINITY, ply: int = 0) -> tuple[int, list[LegalMove]]:
+        """Like ``negamax``, but only follows (forced) captures. Positions
+        without captures are evaluated as they are."""
+        self._visit()
+
+        if not get_analysis(board).can_capture(player):
+            if not has_legal_moves(board, player):
+                return -WIN_SCORE + ply, []
+
+            return self.evaluate(board, player), []
+
+        static = self.evaluate(board, player)
+        best_score, best_pv = -INFINITY, []
+
+        for move in get_legal_moves(board, player):
+            if (optimistic := static + captured_value(board, move) + DELTA_MARGIN) <= alpha:
+                best_score = max(best_score, optimistic)
+                continue
+
+            score, pv = self.quiesce(apply_move(board, move), not player, -beta, -alpha, ply + 1)
+            score = -score
+
+            if score > best_score:
+                best_score, best_pv = score, [move, *pv]
+
+            alpha = max(alpha, score)
+
+            if alpha >= beta:
+                break
+
+        return best_score, best_pv
+
+    def _visit(self):
+        self.nodes += 1
+
+        if self.stop_event.is_set() or self.limits.is_exceeded(self.nodes):
+            raise SearchStopped
+
+    def search(self, board: Board, player: Player, depth: int) -> SearchResult:
+        if board.find_tracker(IncrementalEvaluation) is None:
+            # The copies ``apply_move`` makes carry (a copy of) the evaluation
+            board = board.copy()
+            track_evaluation(board)
+
+        score, pv = self.negamax(board, player, depth)
+        return SearchResult(pv[0] if pv else None, score, depth, self.nodes, pv)
+
+    def iterate(self, board: Board, player: Player, max_depth: int) -> Iterator[SearchResult]:
+        """Iterative deepening: search to depth 1, 2, ..., ``max_depth``. Each
+        iteration fills the transposition table with better move orderings for
+        the next."""
+        for depth in range(1, max_depth + 1):
+            yield self.search(board, player, depth)
+
+
+def search(board: Board, player: Player, depth: int) -> SearchResult:
+    *_, result = Searcher().iterate(board, player, depth)
+    return result
@@ -1,22 +1,28 @@
-import re
 from dataclasses import dataclass
-from typing import Union, Optional
-
-from checkers.logic.max_capture import validate_max_capture
+from typing import Union, Optional, TYPE_CHECKING
+
+from checkers.io.notation import parse_move, format_move
+from checkers.logic.adjudication import Adjudicator, GameStatus, ONGOING
+from checkers.logic.cache import PositionCache
+from checkers.logic.legal_moves import get_legal_moves
+from checkers.logic.max_capture import validate_max_capture, compute_max_capture
+from checkers.logic.move_lists import MoveLists, track_move_lists
 from checkers.logic.rules import validate_step, validate_captures
-from checkers.models import Move, Board, capture_series_to_moves, Piece
-from checkers.models.board import InvalidMoveError
+from checkers.models import Move, Board, Piece
+
+if TYPE_CHECKING:
+    from checkers.io.journal import MoveLog  # (journal imports this module)
 
 
-def parse_cmd(cmd) -> Union[Move, list[Move]]:
-    if match := re.search(r"(\d{1,2})\-(\d{1,2})", cmd):
-        start, end = match.group(1), match.group(2)
-        return Move(int(start), int(end))
+def parse_cmd(cmd: str) -> Union[Move, list[Move]]:
+    """See :func:`checkers.io.notation.parse_move` (raises a ``NotationError``
+    for malformed input)."""
+    return parse_move(cmd)
 
-    elif idxs := list(map(int, cmd.split("x"))):
-        return capture_series_to_moves(idxs)
 
-    raise InvalidMoveError(f"Couldn't parse the given move '{cmd}'")
+def format_cmd(move: Union[Move, list[Move]]) -> str:
+    """The inverse of ``parse_cmd``."""
+    return format_move(move)
 
 
 def default_board() -> Board:
@@ -26,8 +32,24 @@ def default_board() -> Board:
 @dataclass(init=False)
 class Game:
     """A proxy for ``Board`` that parses (user-inputted) string commands into
-    moves and validates them before updating the board."""
+    moves and validates them before updating the board.
+
+    It also keeps track of the endgame rules, see ``status``.
+
+    Games can share a ``PositionCache`` to skip recomputing the maximum
+    capture of positions they have in common, and a ``MoveLog`` (see
+    :mod:`checkers.io.journal`) that records every accepted move so the game
+    can be recovered after a crash.
+
+    Moves are checked against the legal moves a :class:`MoveLists` keeps up
+    to date for the board first; only moves that aren't among them go through
+    the validators (which tell what's wrong with them)."""
     board: Board
+    adjudicator: Adjudicator
+    cache: Optional[PositionCache]
+    move_lists: MoveLists
+    log: Optional['MoveLog']
+    game_id: Optional[int]
 
     def play(self, cmd: str):
         if cmd.strip() == "exit":
@@ -35,29 +57,60 @@ class Game:
 
         move = parse_cmd(cmd)
 
+        # The moved piece, as it was before a coronation
         if isinstance(move, Move):
-            piece = self._play_step(move)
+            piece, captures = self._play_step(move), 0
         else:
-            piece = self._play_captures(move)
+            piece, captures = self._play_captures(move), len(move)
 
         if piece.has_reached_end:
             self.board.replace(piece.coronate())
 
+        move_lists, player = self.move_lists, not piece.player
+        self.adjudicator.record_move(piece, captures, move_lists.signature(), move_lists.position_key(player),
+                                     lambda: move_lists.has_legal_moves(player))
+
+        if self.log is not None:
+            self.log.record(self.game_id, self.adjudicator.plies, move)
+
+            if self.status is not ONGOING:
+                self.log.finish(self.game_id)
+
+    @property
+    def status(self) -> GameStatus:
+        return self.adjudicator.status
+
     def play_turn(self, p1_move: str, p2_move: str):
         """Convenience method that plays two moves (a single turn) at once."""
         self.play(p1_move)
         self.play(p2_move)
 
+    def _is_legal(self, move: Union[Move, list[Move]]) -> bool:
+        start = move.start if isinstance(move, Move) else move[0].start
+        generate = self.cache.legal_moves if self.cache is not None else get_legal_moves
+        return start in self.board and move in self.move_lists.legal_moves(self.board[start].player, generate)
+
     def _play_step(self, move: Move) -> Piece:
-        validate_step(self.board, move)  # -> InvalidMoveError
+        if not self._is_legal(move):
+            validate_step(self.board, move)  # -> InvalidMoveError
+
         self.board = self.board.apply_step(move)
         return self.board[move.end]
 
     def _play_captures(self, moves: list[Move]) -> Piece:
-        validate_captures(self.board, moves)  # -> InvalidMoveError
-        validate_max_capture(self.board, moves)
+        if not self._is_legal(moves):
+            validate_captures(self.board, moves)  # -> InvalidMoveError
+            validate_max_capture(self.board, moves,
+                                 self.cache.max_capture if self.cache is not None else compute_max_capture)
+
         self.board = self.board.apply_captures(moves)
         return self.board[moves[-1].end]
 
-    def __init__(self, board: Optional[Board] = None):
+    def __init__(self, board: Optional[Board] = None, cache: Optional[PositionCache] = None,
+                 log: Optional['MoveLog'] = None):
         self.board = board or default_board()
+        self.move_lists = track_move_lists(self.board)
+        self.adjudicator = Adjudicator(self.board)
+        self.cache = cache
+        self.log = log
+        self.game_id = log.start(self.board) if log is not None else None
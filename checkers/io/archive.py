@@ -0,0 +1,99 @@
+"""
+Reading and writing archives of games in a (PDN-like) text format:
+
+.. code::
+
+    [Event "Confederation Cup 2000"]
+    [Result "2-0"]
+
+    1. 32-28 19-23 2. 28x19 14x23 ... 2-0
+
+Headers are optional. A game ends with a result token (``2-0``, ``0-2``,
+``1-1`` or ``*``), a blank line after its moves, or the end of the file. Move
+numbers may be glued to the first move of the turn (``01.32-28``), like in
+:mod:`checkers.io.sample_match` (see :mod:`checkers.io.notation`).
+
+Everything is streamed, so archives never have to fit in memory.
+"""
+import re
+from dataclasses import dataclass, field
+from typing import Iterable, Iterator, Optional
+
+from checkers.io.notation import tokenize, NUMBER, RESULT
+from checkers.models import Player, PLAYER_ONE, PLAYER_TWO
+
+RESULTS: dict[str, Optional[Player]] = {"2-0": PLAYER_ONE, "0-2": PLAYER_TWO, "1-1": None}
+UNKNOWN_RESULT = "*"
+
+_HEADER = re.compile(r'\[(\w+)\s+"([^"]*)"\]')
+
+
+@dataclass
+class ArchivedGame:
+    moves: list[str] = field(default_factory=list)
+    headers: dict[str, str] = field(default_factory=dict)
+
+    @property
+    def result(self) -> str:
+        return self.headers.get("Result", UNKNOWN_RESULT)
+
+    @property
+    def is_decided(self) -> bool:
+        return self.result in RESULTS
+
+    @property
+    def winner(self) -> Optional[Player]:
+        return RESULTS.get(self.result)
+
+
+def parse_games(lines: Iterable[str]) -> Iterator[ArchivedGame]:
+    game = ArchivedGame()
+
+    for line in lines:
+        line = line.strip()
+
+        if line.startswith("["):
+            if game.moves:
+                yield game
+                game = ArchivedGame()
+
+            game.headers.update(_HEADER.findall(line))
+            continue
+
+        if not line:
+            if game.moves:
+                yield game
+                game = ArchivedGame()
+
+            continue
+
+        for kind, token in tokenize(line):
+            if kind == NUMBER or token == "exit":
+                continue
+            elif kind == RESULT:
+                game.headers["Result"] = token
+                yield game
+                game = ArchivedGame()
+            else:
+                game.moves.append(token)
+
+    if game.moves:
+        yield game
+
+
+def read_games(path: str) -> Iterator[ArchivedGame]:
+    with open(path, encoding="utf-8") as f:
+        yield from parse_games(f)
+
+
+def format_game(game: ArchivedGame) -> str:
+    headers = "".join(f'[{k} "{v}"]\n' for k, v in game.headers.items())
+    turns = (f"{i // 2 + 1}. {' '.join(game.moves[i:i + 2])}" for i in range(0, len(game.moves), 2))
+
+    return f"{headers}\n{' '.join(turns)} {game.result}\n"
+
+
+def write_games(path: str, games: Iterable[ArchivedGame]):
+    with open(path, "w", encoding="utf-8") as f:
+        for game in games:
+            f.write(format_game(game) + "\n")
@@ -0,0 +1,129 @@
+"""
+Positions in draughts FEN, e.g.::
+
+    W:W31,32,K45:B1,2
+
+That is: the side to move (``W`` or ``B``), then the pieces of white and
+black, where kings are prefixed with ``K`` and runs of squares may be written
+as ranges (``W31-35``). White is player one (who starts on 31-50 and moves
+first). The order of the two piece lists doesn't matter, and the whole thing
+may be wrapped in quotes or end in a period (as in PDN ``[FEN "..."]`` tags).
+
+Parsing works on bitmasks (see :meth:`checkers.models.Board.from_masks`) with a
+lookup table from tokens to bits, so nothing is validated twice. For bulk
+loading, :func:`load_masks` skips building ``Board``'s altogether.
+"""
+from typing import Iterable, Iterator
+
+import numpy as np
+
+from checkers.models import Board, Player, PLAYER_ONE, PLAYER_TWO
+
+WHITE = "W"
+BLACK = "B"
+KING = "K"
+
+SIDES = {WHITE: PLAYER_ONE, BLACK: PLAYER_TWO}
+
+# Token (e.g. "31" or "K31") -> (bit, is_king)
+_BITS = {**{str(i): (1 << (i - 1), False) for i in range(1, 51)},
+         **{f"{KING}{i}": (1 << (i - 1), True) for i in range(1, 51)}}
+
+Masks = tuple[int, int, int, Player]
+
+
+class FenError(ValueError):
+    pass
+
+
+def _parse_squares(field: str) -> tuple[int, int]:
+    """The mask of the pieces (and of the kings among them) in a field like
+    ``31,32,K45`` (without the colour)."""
+    pieces = kings = 0
+
+    for token in field.split(","):
+        if (entry := _BITS.get(token)) is not None:
+            bit, is_king = entry
+            pieces |= bit
+
+            if is_king:
+                kings |= bit
+        elif "-" in token:
+            is_king = token.startswith(KING)
+            start, _, end = token.lstrip(KING).partition("-")
+
+            try:
+                squares = range(int(start), int(end) + 1)
+            except ValueError:
+                raise FenError(f"Invalid range '{token}'") from None
+
+            if not squares or squares.start < 1 or squares.stop > 51:
+                raise FenError(f"Invalid range '{token}'")
+
+            bits = sum(1 << (i - 1) for i in squares)
+            pieces |= bits
+
+            if is_king:
+                kings |= bits
+        elif token:
+            raise FenError(f"Invalid square '{token}'")
+
+    return pieces, kings
+
+
+def parse_masks(fen: str) -> Masks:
+    """Like :func:`parse_fen`, but returns ``(p1, p2, kings, player)``."""
+    side, *fields = fen.strip().strip('"').rstrip(".").split(":")
+
+    if side not in SIDES or len(fields) > 2:
+        raise FenError(f"Invalid FEN '{fen}'")
+
+    masks = {WHITE: (0, 0), BLACK: (0, 0)}
+
+    for field in fields:
+        if field[:1] not in SIDES:
+            raise FenError(f"Invalid FEN '{fen}'")
+
+        masks[field[0]] = _parse_squares(field[1:])
+
+    (p1, p1_kings), (p2, p2_kings) = masks[WHITE], masks[BLACK]
+
+    if p1 & p2:
+        raise FenError(f"Both players have a piece on the same square in '{fen}'")
+
+    return p1, p2, p1_kings | p2_kings, SIDES[side]
+
+
+def parse_fen(fen: str) -> tuple[Board, Player]:
+    p1, p2, kings, player = parse_masks(fen)
+    return Board.from_masks(p1, p2, kings), player
+
+
+def _format_squares(board: Board, player: Player) -> str:
+    return ",".join(f"{KING if is_king else ''}{idx}" for idx, owner, is_king in board if owner is player)
+
+
+def format_fen(board: Board, player: Player) -> str:
+    side = WHITE if player is PLAYER_ONE else BLACK
+    return f"{side}:{WHITE}{_format_squares(board, PLAYER_ONE)}:{BLACK}{_format_squares(board, PLAYER_TWO)}"
+
+
+def iter_fens(lines: Iterable[str]) -> Iterator[tuple[Board, Player]]:
+    """Parses one position per (non-empty) line."""
+    for line in lines:
+        if line := line.strip():
+            yield parse_fen(line)
+
+
+def load_masks(path: str) -> np.ndarray:
+    """Loads a file with one FEN per line into an ``(N, 4)`` uint64 array of
+    ``(p1, p2, kings, player)`` rows (``player`` is 1 for player one)."""
+    with open(path, encoding="utf-8") as f:
+        rows = [parse_masks(line) for line in f if not line.isspace()]
+
+    return np.array(rows, dtype=np.uint64).reshape(-1, 4)
+
+
+def read_fens(path: str) -> Iterator[tuple[Board, Player]]:
+    with open(path, encoding="utf-8") as f:
+        yield from iter_fens(f)
@@ -0,0 +1,398 @@
+"""
+A front end for GUIs and match servers that speak the (line-based) Hub
+protocol, over stdin/stdout or TCP::
+
+    python -m checkers.io.hub [--port 27531]
+
+Every message is a command followed by ``key=value`` pairs (values with spaces
+are quoted). The GUI sends:
+
+- ``hub``: the engine answers with ``id ...`` and ``wait``,
+- ``init``: ``ready`` once the engine is ready to play,
+- ``new-game``, ``ping`` (answered with ``pong``) and ``quit``,
+- ``pos pos=<position> moves="32-28 19-23"``: set up a position, where the
+  position is ``W`` or ``B`` (the side to move) followed by a character per
+  square (``w``/``b`` for men, ``W``/``B`` for kings, ``e`` for empty), and
+  the moves are in the notation of :func:`checkers.game.parse_cmd`,
+- ``level depth=12``, ``level move-time=1.5``, ``level time=300 inc=2
+  moves=40`` or ``level infinite``: the time control,
+- ``time left=120.5``: the time left on the engine's clock,
+- ``go think``, ``go ponder`` or ``go analyze``: start searching,
+- ``ponder-hit``: the opponent played the move the engine is pondering on, so
+  the clock starts now, and
+- ``stop``: play the best move so far.
+
+The engine reports ``info depth=... score=... nodes=... time=... nps=... pv=...``
+after every iteration and ends every search with ``done move=... ponder=...``.
+While pondering or analysing, it holds on to the result until ``ponder-hit``
+or ``stop``.
+
+One :class:`HubEngine` (and with it the transposition table) lives on across
+games and, for TCP, across connections, so the caches stay warm. Searches run in
+a worker thread (see :mod:`checkers.engine.handle`), so commands like ``ping``
+and ``stop`` are answered right away.
+"""
+import inspect
+import shlex
+import socket
+import sys
+import threading
+from dataclasses import dataclass, replace
+from typing import Callable, Iterable, Optional
+
+import click
+
+from checkers.engine.handle import SearchHandle, Progress
+from checkers.engine.search import Searcher, SearchLimits, SearchResult, MAX_DEPTH
+from checkers.game import default_board
+from checkers.io.notation import NotationError, find_move, format_move
+from checkers.logic.legal_moves import LegalMove, get_legal_moves, apply_move
+from checkers.models import Board, Player, PLAYER_ONE, PLAYER_TWO
+
+NAME = "checkers"
+VERSION = "0.1"
+DEFAULT_PORT = 27531
+
+# Moves left in the time control, if the GUI doesn't say
+DEFAULT_MOVES_TO_GO = 30
+
+_SIDES = {"W": PLAYER_ONE, "B": PLAYER_TWO}
+_SQUARES = {"w": (PLAYER_ONE, False), "b": (PLAYER_TWO, False), "W": (PLAYER_ONE, True), "B": (PLAYER_TWO, True)}
+EMPTY = "e"
+
+THINK = "think"
+PONDER = "ponder"
+ANALYZE = "analyze"
+
+
+class HubError(ValueError):
+    pass
+
+
+def parse_message(line: str) -> tuple[str, dict[str, str]]:
+    """``'pos pos=W... moves="32-28 19-23"'`` -> ``('pos', {'pos': 'W...',
+    'moves': '32-28 19-23'})``. Flags without a value map to ``''``."""
+    try:
+        command, *pairs = shlex.split(line)
+    except ValueError as e:
+        raise HubError(f"Invalid message '{line}': {e}") from None
+
+    return command, dict(pair.partition("=")[::2] for pair in pairs)
+
+
+def format_message(command: str, **args) -> str:
+    """The inverse of ``parse_message`` (arguments that are ``None`` are
+    left out, and underscores in keys become hyphens)."""
+    parts = [command]
+
+    for key, value in args.items():
+        if value is None:
+            continue
+
+        value = str(value)
+        parts.append(f"{key.replace('_', '-')}=" + (f'"{value}"' if " " in value or not value else value))
+
+    return " ".join(parts)
+
+
+def parse_position(position: str) -> tuple[Board, Player]:
+    if len(position) != 51 or position[0] not in _SIDES:
+        raise HubError(f"Invalid position '{position}'")
+
+    p1 = p2 = kings = 0
+
+    for idx, char in enumerate(position[1:], 1):
+        if char == EMPTY:
+            continue
+
+        if char not in _SQUARES:
+            raise HubError(f"Invalid square '{char}' in position '{position}'")
+
+        player, is_king = _SQUARES[char]
+        bit = 1 << (idx - 1)
+
+        if player is PLAYER_ONE:
+            p1 |= bit
+        else:
+            p2 |= bit
+
+        if is_king:
+            kings |= bit
+
+    return Board.from_masks(p1, p2, kings), _SIDES[position[0]]
+
+
+def format_position(board: Board, player: Player) -> str:
+    squares = [EMPTY] * 51
+    squares[0] = "W" if player is PLAYER_ONE else "B"
+
+    for idx, owner, is_king in board:
+        char = "w" if owner is PLAYER_ONE else "b"
+        squares[idx] = char.upper() if is_king else char
+
+    return "".join(squares)
+
+
+def format_line(board: Board, player: Player, moves: list[LegalMove]) -> str:
+    """Formats a series of moves (e.g., a principal variation) starting
+    from ``board``."""
+    cmds = []
+
+    for move in moves:
+        cmds.append(format_move(move, get_legal_moves(board, player)))
+        board, player = apply_move(board, move), not player
+
+    return " ".join(cmds)
+
+
+@dataclass
+class Level:
+    """The time control."""
+    depth: int = MAX_DEPTH
+    move_time: Optional[float] = None  # Seconds per move
+    time: Optional[float] = None  # Seconds left on the clock
+    inc: float = 0.
+    moves: Optional[int] = None  # Moves left until the next time control
+
+    def seconds_for_move(self) -> Optional[float]:
+        if self.move_time is not None:
+            return self.move_time
+
+        if self.time is not None:
+            return max(self.time / (self.moves or DEFAULT_MOVES_TO_GO) + self.inc, 0.)
+
+    def limits(self) -> SearchLimits:
+        if (seconds := self.seconds_for_move()) is not None:
+            return SearchLimits.within(seconds, depth=self.depth)
+
+        return SearchLimits(depth=self.depth)
+
+
+class HubEngine:
+    """Answers Hub messages (see the module docstring) by calling ``send``
+    with each reply line.
+
+    .. NOTE:: ``send`` is also called from the search thread (for ``info`` and
+       ``done``), but never concurrently.
+    """
+
+    def __init__(self, send: Callable[[str], None], searcher: Optional[Searcher] = None):
+        self.send = send
+        self.searcher = searcher or Searcher()
+        self.board, self.player = default_board(), PLAYER_ONE
+        self.level = Level()
+        self._search: Optional[SearchHandle] = None
+        self._mode = THINK
+        self._pending: Optional[SearchResult] = None  # A result that waits for ponder-hit or stop
+        self._lock = threading.RLock()
+
+    def _send(self, command: str, **args):
+        with self._lock:
+            self.send(format_message(command, **args))
+
+    def handle(self, line: str) -> bool:
+        """Handles a single message. Returns ``False`` after ``quit``."""
+        if not line.strip():
+            return True
+
+        try:
+            command, args = parse_message(line)
+
+            if (method := getattr(self, f"_on_{command.replace('-', '_')}", None)) is None:
+                raise HubError(f"Unknown command '{command}'")
+
+            kwargs = {key.replace("-", "_"): value for key, value in args.items()}
+
+            try:
+                inspect.signature(method).bind(**kwargs)
+            except TypeError as e:
+                raise HubError(f"Invalid arguments for '{command}': {e}") from None
+
+            return method(**kwargs) is not False
+        except (HubError, NotationError) as e:
+            self._send("error", message=str(e))
+            return True
+
+    # -- Commands -------------------------------------------------------------
+
+    def _on_hub(self):
+        self._send("id", name=NAME, version=VERSION)
+        self._send("wait")
+
+    def _on_init(self):
+        self._send("ready")
+
+    def _on_ping(self):
+        self._send("pong")
+
+    def _on_quit(self):
+        self._abort()
+        return False
+
+    def _on_new_game(self):
+        self._abort()
+        self.board, self.player = default_board(), PLAYER_ONE
+
+    def _on_pos(self, pos: Optional[str] = None, moves: str = ""):
+        self._abort()
+        board, player = parse_position(pos) if pos else (default_board(), PLAYER_ONE)
+
+        for cmd in moves.split():
+            if (move := find_move(cmd, get_legal_moves(board, player))) is None:
+                raise HubError(f"Illegal move '{cmd}'")
+
+            board, player = apply_move(board, move), not player
+
+        self.board, self.player = board, player
+
+    def _on_level(self, depth: Optional[str] = None, move_time: Optional[str] = None, time: Optional[str] = None,
+                  inc: Optional[str] = None, moves: Optional[str] = None, infinite: Optional[str] = None):
+        level = Level() if infinite is not None else self.level
+
+        try:
+            self.level = Level(
+                depth=int(depth) if depth is not None else level.depth,
+                move_time=float(move_time) if move_time is not None else level.move_time,
+                time=float(time) if time is not None else level.time,
+                inc=float(inc) if inc is not None else level.inc,
+                moves=int(moves) if moves is not None else level.moves,
+            )
+        except ValueError:
+            raise HubError("Invalid level") from None
+
+    def _on_time(self, left: str):
+        try:
+            self.level = replace(self.level, time=float(left))
+        except ValueError:
+            raise HubError(f"Invalid time '{left}'") from None
+
+    def _on_go(self, think: Optional[str] = None, ponder: Optional[str] = None, analyze: Optional[str] = None):
+        self._abort()
+
+        # Hold the lock until ``_search`` is set: the callbacks check it
+        with self._lock:
+            self._mode = PONDER if ponder is not None else ANALYZE if analyze is not None else THINK
+            limits = self.level.limits() if self._mode == THINK else SearchLimits(depth=self.level.depth)
+            self._search = SearchHandle(self.board, self.player, limits, self._on_progress, searcher=self.searcher)
+            self._search.add_done_callback(self._make_done_callback(self._search))
+
+    def _on_ponder_hit(self):
+        with self._lock:
+            if self._search is None or self._mode != PONDER:
+                return
+
+            self._mode = THINK
+
+            if self._pending is not None:
+                self._finish(self._pending)
+            else:
+                self._search.set_limits(replace(self.level.limits(), depth=self._search.limits.depth))
+
+    def _on_stop(self):
+        with self._lock:
+            if (search := self._search) is None:
+                return
+
+            self._mode = THINK
+
+            if self._pending is not None:
+                return self._finish(self._pending)
+
+        search.stop()
+
+    # -- Searching ------------------------------------------------------------
+
+    def _on_progress(self, progress: Progress):
+        with self._lock:
+            if self._search is None:  # Aborted
+                return
+
+            pv = self._search.result.pv if self._search.result is not None else []
+            self._send("info", depth=progress.depth, score=progress.score, nodes=progress.nodes,
+                       time=f"{progress.seconds:.3f}", nps=f"{progress.nps:.0f}",
+                       pv=format_line(self.board, self.player, pv) if pv else None)
+
+    def _make_done_callback(self, search: SearchHandle) -> Callable[[SearchResult], None]:
+        def on_done(result: SearchResult):
+            with self._lock:
+                if search is not self._search:  # Aborted
+                    return
+
+                if self._mode == THINK:
+                    self._finish(result)
+                else:
+                    self._pending = result
+
+        return on_done
+
+    def _finish(self, result: SearchResult):
+        moves = get_legal_moves(self.board, self.player)
+        self._search, self._pending = None, None
+
+        if result.move is None:
+            return self._send("done")
+
+        ponder = None
+
+        if len(result.pv) >= 2:
+            after = apply_move(self.board, result.move)
+            ponder = format_move(result.pv[1], get_legal_moves(after, not self.player))
+
+        self._send("done", move=format_move(result.move, moves), ponder=ponder)
+
+    def _abort(self):
+        """Stops the running search (if any) without sending ``done``."""
+        with self._lock:
+            search, self._search, self._pending = self._search, None, None
+
+        if search is not None:
+            search.stop()
+
+
+def serve(lines: Iterable[str], engine: HubEngine):
+    for line in lines:
+        if not engine.handle(line):
+            break
+
+    engine.handle("quit")
+
+
+def serve_stdio(engine: Optional[HubEngine] = None):
+    def send(line: str):
+        sys.stdout.write(line + "\n")
+        sys.stdout.flush()
+
+    serve(sys.stdin, engine or HubEngine(send))
+
+
+def serve_tcp(host: str = "127.0.0.1", port: int = DEFAULT_PORT, engine: Optional[HubEngine] = None):
+    """Serves one connection at a time, with the same ``engine`` for all of
+    them."""
+    engine = engine or HubEngine(lambda line: None)
+
+    with socket.create_server((host, port)) as server:
+        while True:
+            conn, _ = server.accept()
+
+            with conn, conn.makefile("r", encoding="utf-8") as reader:
+                conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                engine.send = lambda line: conn.sendall((line + "\n").encode("utf-8"))
+
+                try:
+                    serve(reader, engine)
+                except OSError:
+                    engine.handle("quit")
+
+
+@click.command()
+@click.option("--port", type=int, help="Listen on this TCP port instead of stdin/stdout.")
+@click.option("--host", default="127.0.0.1", show_default=True)
+def main(port: Optional[int], host: str):
+    if port is None:
+        serve_stdio()
+    else:
+        serve_tcp(host, port)
+
+
+if __name__ == "__main__":
+    main()
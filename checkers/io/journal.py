@@ -0,0 +1,359 @@
+"""
+A write-ahead log of the moves of live games, so they survive a crash of the
+process that hosts them.
+
+A :class:`MoveLog` lives in a directory of numbered segments and snapshots::
+
+    00000003.snapshot   The live games when segment 3 was started
+    00000003.wal        Every record since
+
+A record is a small binary header (a CRC32 of the rest of the record, the
+length of the payload, the game id, the ply and the kind) followed by the
+payload:
+
+- ``START``: the starting position of a new game (as FEN),
+- ``MOVE``: a move in the compact encoding of
+  :func:`checkers.logic.legal_moves.encode_move` (or, for the rare capture
+  series that don't fit, ``MOVE_TEXT`` with the move in notation), and
+- ``END``: the game is over, so it doesn't need to be recovered.
+
+Logging a move only encodes the record and appends it to a buffer. A
+background thread writes whatever has piled up with a single ``write`` and
+``fsync`` every ``commit_interval`` seconds ("group commit"), so durability
+doesn't add latency per move. :meth:`MoveLog.flush` waits until everything
+logged so far is on disk.
+
+Every ``snapshot_every`` records, the writer starts a new segment with a
+snapshot of the live games and removes the old files. Recovery
+(:func:`recover`) reads the latest snapshot and replays the segment after
+it, up to the first torn or corrupt record (what a crash can leave behind).
+Opening a ``MoveLog`` on an existing directory recovers it first and carries
+the live games over into a new segment.
+"""
+import json
+import os
+import struct
+import threading
+import zlib
+from dataclasses import dataclass, field
+from typing import Optional, Iterator, Union
+
+from checkers.game import Game, format_cmd
+from checkers.io.fen import format_fen, parse_fen
+from checkers.io.notation import format_move, parse_move
+from checkers.logic.legal_moves import LegalMove, encode_move, decode_move
+from checkers.models import Board, PLAYER_ONE
+
+START = 0
+MOVE = 1
+MOVE_TEXT = 2
+END = 3
+
+# The CRC32 of the rest of the record, then: payload length, game id, ply, kind
+_CRC = struct.Struct("<I")
+_HEADER = struct.Struct("<HIHB")
+_MOVE = struct.Struct("<Q")
+
+WAL_SUFFIX = ".wal"
+SNAPSHOT_SUFFIX = ".snapshot"
+
+DEFAULT_COMMIT_INTERVAL = 0.005
+DEFAULT_SNAPSHOT_EVERY = 1 << 16
+
+
+class JournalError(ValueError):
+    pass
+
+
+@dataclass
+class LoggedGame:
+    """What the log knows about a live game: where it started and the moves
+    since (as logged, i.e., encoded moves or notation)."""
+    fen: str
+    moves: list[Union[int, str]] = field(default_factory=list)
+
+    @property
+    def plies(self) -> int:
+        return len(self.moves)
+
+    def legal_moves(self) -> Iterator[LegalMove]:
+        for move in self.moves:
+            yield parse_move(move) if isinstance(move, str) else decode_move(move)
+
+
+@dataclass
+class JournalState:
+    next_id: int = 0
+    games: dict[int, LoggedGame] = field(default_factory=dict)
+
+    def apply(self, game_id: int, ply: int, kind: int, payload: Union[int, str]):
+        if kind == START:
+            self.games[game_id] = LoggedGame(payload)
+            self.next_id = max(self.next_id, game_id + 1)
+        elif kind == END:
+            self.games.pop(game_id, None)
+        elif (game := self.games.get(game_id)) is None or ply != game.plies + 1:
+            raise JournalError(f"Out of order record for game {game_id} (ply {ply})")
+        else:
+            game.moves.append(payload)
+
+
+def encode_record(game_id: int, ply: int, kind: int, payload: Union[int, str]) -> bytes:
+    data = _MOVE.pack(payload) if kind == MOVE else payload.encode("utf-8")
+    body = _HEADER.pack(len(data), game_id, ply, kind) + data
+    return _CRC.pack(zlib.crc32(body)) + body
+
+
+def read_records(data: bytes) -> Iterator[tuple[int, int, int, Union[int, str]]]:
+    """Yields ``(game_id, ply, kind, payload)`` up to the end of ``data`` or
+    the first torn or corrupt record."""
+    offset = 0
+
+    while offset + _CRC.size + _HEADER.size <= len(data):
+        crc, = _CRC.unpack_from(data, offset)
+        length, game_id, ply, kind = _HEADER.unpack_from(data, offset + _CRC.size)
+        start = offset + _CRC.size + _HEADER.size
+        end = start + length
+
+        if end > len(data) or zlib.crc32(data[offset + _CRC.size:end]) != crc:
+            return
+
+        payload = data[start:end]
+        yield game_id, ply, kind, _MOVE.unpack(payload)[0] if kind == MOVE else payload.decode("utf-8")
+        offset = end
+
+
+def _path(directory: str, segment: int, suffix: str) -> str:
+    return os.path.join(directory, f"{segment:08d}{suffix}")
+
+
+def _segments(directory: str, suffix: str) -> list[int]:
+    return sorted(int(name[:-len(suffix)]) for name in os.listdir(directory)
+                  if name.endswith(suffix) and name[:-len(suffix)].isdigit())
+
+
+def _fsync_directory(directory: str):
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:  # E.g., on Windows
+        return
+
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def write_snapshot(directory: str, segment: int, state: JournalState):
+    """Writes the snapshot atomically (to a temporary file that's renamed)."""
+    path = _path(directory, segment, SNAPSHOT_SUFFIX)
+    data = {"next_id": state.next_id,
+            "games": {str(game_id): {"fen": game.fen, "moves": game.moves} for game_id, game in state.games.items()}}
+
+    with open(path + ".tmp", "w", encoding="utf-8") as f:
+        json.dump(data, f)
+        f.flush()
+        os.fsync(f.fileno())
+
+    os.replace(path + ".tmp", path)
+    _fsync_directory(directory)
+
+
+def read_snapshot(path: str) -> JournalState:
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+
+    return JournalState(data["next_id"], {int(game_id): LoggedGame(game["fen"], game["moves"])
+                                          for game_id, game in data["games"].items()})
+
+
+def recover(directory: str) -> tuple[int, JournalState]:
+    """The live games in the log in ``directory``: the latest snapshot, plus
+    every (intact) record logged since. Also returns the number of the last
+    segment (0 for an empty directory)."""
+    snapshots = _segments(directory, SNAPSHOT_SUFFIX)
+
+    if not snapshots:
+        return 0, JournalState()
+
+    segment = snapshots[-1]
+    state = read_snapshot(_path(directory, segment, SNAPSHOT_SUFFIX))
+
+    if os.path.exists(wal := _path(directory, segment, WAL_SUFFIX)):
+        with open(wal, "rb") as f:
+            for record in read_records(f.read()):
+                state.apply(*record)
+
+    return segment, state
+
+
+class MoveLog:
+    """See the module docstring. Use it as a context manager (or call
+    ``close``) to write the last records."""
+
+    def __init__(self, directory: str, *, commit_interval: float = DEFAULT_COMMIT_INTERVAL,
+                 snapshot_every: int = DEFAULT_SNAPSHOT_EVERY):
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.commit_interval = commit_interval
+        self.snapshot_every = snapshot_every
+        self.segment, self.state = recover(directory)
+
+        self._buffer: list[bytes] = []
+        self._logged = 0  # Records appended to the buffer
+        self._durable = 0  # Records written and fsync'ed
+        self._since_snapshot = 0
+        self._error: Optional[BaseException] = None
+        self._closed = False
+        self._lock = threading.Lock()
+        self._wake = threading.Condition(self._lock)
+        self._synced = threading.Condition(self._lock)
+
+        self._file = self._start_segment(self.state)
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    # -- Logging (the hot path) ---------------------------------------------
+
+    def start(self, board: Board) -> int:
+        """Logs a new game (with player one to move) and returns its id."""
+        with self._lock:
+            game_id = self.state.next_id
+            self._append(game_id, 0, START, format_fen(board, PLAYER_ONE))
+            return game_id
+
+    def record(self, game_id: int, ply: int, move: LegalMove):
+        try:
+            payload, kind = encode_move(move), MOVE
+        except ValueError:
+            payload, kind = format_move(move), MOVE_TEXT
+
+        with self._lock:
+            self._append(game_id, ply, kind, payload)
+
+    def finish(self, game_id: int):
+        with self._lock:
+            if game_id in self.state.games:
+                self._append(game_id, self.state.games[game_id].plies, END, "")
+
+    def _append(self, game_id: int, ply: int, kind: int, payload: Union[int, str]):
+        if self._error is not None:
+            raise JournalError("The move log failed") from self._error
+
+        if self._closed:
+            raise JournalError("The move log is closed")
+
+        self.state.apply(game_id, ply, kind, payload)
+        self._buffer.append(encode_record(game_id, ply, kind, payload))
+        self._logged += 1
+        self._wake.notify()
+
+    # -- Writing (in the background) ------------------------------------------
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Waits until every record logged so far is on disk. Returns
+        ``False`` on a timeout."""
+        with self._lock:
+            target = self._logged
+            self._wake.notify()
+            done = self._synced.wait_for(lambda: self._durable >= target or self._error is not None, timeout)
+
+            if self._error is not None:
+                raise JournalError("The move log failed") from self._error
+
+            return done
+
+    def _run(self):
+        while True:
+            with self._lock:
+                self._wake.wait_for(lambda: self._buffer or self._closed)
+
+                if not self._buffer and self._closed:
+                    return
+
+                batch, self._buffer = self._buffer, []
+                logged = self._logged
+                snapshot = None
+
+                if self._since_snapshot + len(batch) >= self.snapshot_every:
+                    # Copy the state that goes with the end of this batch
+                    snapshot = JournalState(self.state.next_id, {
+                        game_id: LoggedGame(game.fen, list(game.moves)) for game_id, game in self.state.games.items()
+                    })
+
+            try:
+                self._file.write(b"".join(batch))
+                self._file.flush()
+                os.fsync(self._file.fileno())
+
+                self._since_snapshot += len(batch)
+
+                if snapshot is not None:
+                    self._rotate(snapshot)
+            except BaseException as e:
+                with self._lock:
+                    self._error = e
+                    self._synced.notify_all()
+                return
+
+            with self._lock:
+                self._durable = logged
+                self._synced.notify_all()
+
+            # Let records pile up for the next group commit
+            with self._lock:
+                self._wake.wait_for(lambda: self._closed, self.commit_interval)
+
+    def _start_segment(self, state: JournalState):
+        """Starts the next segment with a snapshot of ``state`` and removes
+        the older files."""
+        self.segment += 1
+        write_snapshot(self.directory, self.segment, state)
+        self._since_snapshot = 0
+        f = open(_path(self.directory, self.segment, WAL_SUFFIX), "ab")
+
+        for suffix in (WAL_SUFFIX, SNAPSHOT_SUFFIX):
+            for segment in _segments(self.directory, suffix):
+                if segment < self.segment:
+                    os.remove(_path(self.directory, segment, suffix))
+
+        return f
+
+    def _rotate(self, snapshot: JournalState):
+        self._file.close()
+        self._file = self._start_segment(snapshot)
+
+    def close(self):
+        with self._lock:
+            self._closed = True
+            self._wake.notify()
+
+        self._thread.join()
+        self._file.close()
+
+        if self._error is not None:
+            raise JournalError("The move log failed") from self._error
+
+    def __enter__(self) -> 'MoveLog':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def recover_games(log: MoveLog) -> dict[int, Game]:
+    """Rebuilds the live games of ``log`` (by replaying their moves), logging
+    to ``log`` from here on."""
+    games = {}
+
+    for game_id, logged in log.state.games.items():
+        board, _ = parse_fen(logged.fen)
+        game = Game(board)
+
+        for move in logged.legal_moves():
+            game.play(format_cmd(move))
+
+        game.log, game.game_id = log, game_id
+        games[game_id] = game
+
+    return games
@@ -0,0 +1,155 @@
+"""
+Standard (PDN) notation for moves:
+
+- steps are written with a hyphen (``32-28``),
+- captures with an ``x`` between the start, (some of) the intermediate landing
+  squares and the end (``28x17x8x19``, or just ``28x19`` if that's
+  unambiguous),
+- move numbers (``1.``, ``12...``, or ``01.`` glued to the next move) and
+  results (``2-0``, ``0-2``, ``1-1``, ``*``) can appear in between.
+
+Text is split into tokens with a single precompiled pattern, so a whole game
+(or archive line) is tokenized in one pass. Parsed tokens are cached, since
+the same few hundred moves make up most games.
+"""
+import functools
+import itertools
+import re
+from typing import Iterator, Optional, Sequence
+
+from checkers.logic.legal_moves import LegalMove
+from checkers.models import Move, TileIndex, capture_series_to_moves
+from checkers.models.move import InvalidMoveError
+
+NUMBER = "number"
+RESULT = "result"
+STEP = "step"
+CAPTURE = "capture"
+UNKNOWN = "unknown"
+
+_END = r"(?=\s|$)"
+_TOKEN = re.compile(
+    rf"(?P<{NUMBER}>\d+\.+)"
+    rf"|(?P<{RESULT}>2-0|0-2|1-1|\*){_END}"
+    rf"|(?P<{STEP}>\d{{1,2}}-\d{{1,2}}){_END}"
+    rf"|(?P<{CAPTURE}>\d{{1,2}}(?:x\d{{1,2}})+){_END}"
+    rf"|(?P<{UNKNOWN}>\S+)"
+)
+
+
+class NotationError(InvalidMoveError):
+    pass
+
+
+def tokenize(text: str) -> Iterator[tuple[str, str]]:
+    """Yields ``(kind, token)`` for every token in ``text``, where ``kind`` is
+    one of ``NUMBER``, ``RESULT``, ``STEP``, ``CAPTURE`` or ``UNKNOWN``."""
+    for match in _TOKEN.finditer(text):
+        yield match.lastgroup, match.group()
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_squares(token: str) -> tuple[bool, tuple[TileIndex, ...]]:
+    match = _TOKEN.fullmatch(token)
+
+    if match is None or match.lastgroup not in (STEP, CAPTURE):
+        raise NotationError(f"Couldn't parse the given move '{token}'")
+
+    is_capture = match.lastgroup == CAPTURE
+    squares = tuple(map(int, token.split("x" if is_capture else "-")))
+
+    if not all(1 <= sq <= 50 for sq in squares):
+        raise NotationError(f"'{token}' refers to a square that doesn't exist")
+
+    return is_capture, squares
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_move(token: str) -> tuple[Move, ...]:
+    _, squares = _parse_squares(token)
+    return tuple(capture_series_to_moves(list(squares)))
+
+
+def parse_move(token: str) -> LegalMove:
+    """Parses a single step or capture (e.g. ``32-28`` or ``28x17x8x19``).
+
+    A capture comes back as the jumps between the squares that are written
+    down, so a shortened capture (``28x19``) has to be resolved against the
+    legal moves (see :func:`find_move`).
+    """
+    token = token.strip()
+    is_capture, _ = _parse_squares(token)
+    moves = _parse_move(token)
+
+    return list(moves) if is_capture else moves[0]
+
+
+def parse_moves(text: str) -> tuple[list[LegalMove], Optional[str]]:
+    """Parses the move text of a whole game (e.g. ``1. 32-28 19-23 2. 28x19
+    14x23 2-0``) into moves and the result (if any)."""
+    moves, result = [], None
+
+    for kind, token in tokenize(text):
+        if kind == STEP:
+            moves.append(_parse_move(token)[0])
+        elif kind == CAPTURE:
+            _parse_squares(token)
+            moves.append(list(_parse_move(token)))
+        elif kind == RESULT:
+            result = token
+        elif kind == UNKNOWN:
+            raise NotationError(f"Couldn't parse the given move '{token}'")
+
+    return moves, result
+
+
+def _landings(move: list[Move]) -> list[TileIndex]:
+    return [m.end for m in move]
+
+
+def _matches(squares: Sequence[TileIndex], move: LegalMove) -> bool:
+    """Whether capture notation with ``squares`` can stand for ``move``: the
+    start and end have to be the same, and the squares in between have to be
+    landing squares of ``move`` (in order)."""
+    if isinstance(move, Move) or move[0].start != squares[0] or move[-1].end != squares[-1]:
+        return False
+
+    landings = iter(_landings(move)[:-1])
+    return all(sq in landings for sq in squares[1:-1])
+
+
+def find_move(token: str, legal_moves: list[LegalMove]) -> Optional[LegalMove]:
+    """The legal move ``token`` stands for (if there's exactly one)."""
+    is_capture, squares = _parse_squares(token.strip())
+
+    if not is_capture:
+        step = _parse_move(token.strip())[0]
+        return step if step in legal_moves else None
+
+    candidates = [m for m in legal_moves if _matches(squares, m)]
+
+    if len(candidates) == 1:
+        return candidates[0]
+
+
+def format_move(move: LegalMove, legal_moves: Optional[list[LegalMove]] = None) -> str:
+    """The inverse of :func:`parse_move`.
+
+    Given the ``legal_moves``, captures are written with as few intermediate
+    squares as are needed to tell them apart from the other legal moves.
+    Otherwise, every landing square is written down.
+    """
+    if isinstance(move, Move):
+        return f"{move.start}-{move.end}"
+
+    start, landings = move[0].start, _landings(move)
+
+    if legal_moves is not None:
+        for k in range(len(landings)):
+            for intermediate in itertools.combinations(landings[:-1], k):
+                squares = (start, *intermediate, landings[-1])
+
+                if sum(_matches(squares, m) for m in legal_moves) == 1:
+                    return "x".join(map(str, squares))
+
+    return "x".join(map(str, (start, *landings)))
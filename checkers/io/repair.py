@@ -0,0 +1,229 @@
+"""
+Repairs transcription errors in archived games (see :mod:`checkers.io.archive`)::
+
+    python -m checkers.io.repair games.pdn --out repaired.pdn --report report.txt
+
+Replaying a game (:func:`checkers.io.training.replay`) stops at the first
+recorded move that isn't legal: a mistyped square, or a capture that isn't
+maximal. :func:`repair_game` replaces such a move by the closest legal move
+instead, ranked by
+
+1. the edit distance between the recorded notation and the candidate's (the
+   shortest unambiguous or the full notation, whichever is closer), then
+2. how many of the squares in the recorded notation the candidate touches
+   (its start, landing and captured squares),
+
+and checked by looking ahead: the closest candidate after which the next
+``lookahead`` recorded moves are legal wins, else the one after which the
+most of them are (up to the next error, which gets repaired in turn).
+Candidates after which not even the next move is legal are never picked.
+Repaired games keep the recorded notation of every other move. If no
+candidate fits, the game is left as recorded from that move on and the
+report says so.
+
+:func:`repair_games` repairs a stream of games in worker processes.
+
+.. NOTE::
+    A mistake can be made a move before replay notices it. In the sample
+    match (:mod:`checkers.io.sample_match`), the capture at turn 48 wasn't
+    maximal, so the piece the reply moves is already gone. Since the maximal
+    capture is the only legal move there, no repair makes the rest of that
+    game legal, and it's reported as unrepaired.
+"""
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Iterable, Iterator, Optional, TextIO
+
+import click
+from pydantic import ValidationError
+
+from checkers.game import default_board
+from checkers.io.archive import ArchivedGame, read_games, format_game
+from checkers.io.notation import find_move, format_move
+from checkers.io.training import chunked, imap_bounded
+from checkers.logic.cache import PositionCache
+from checkers.logic.legal_moves import LegalMove, apply_move, get_captured
+from checkers.models import Board, Move, Player, TileIndex, PLAYER_ONE
+from checkers.models.move import InvalidMoveError
+from checkers.utils.stringx import edit_distance
+
+DEFAULT_LOOKAHEAD = 4
+MAX_CANDIDATES = 8
+MAX_CORRECTIONS = 4
+
+_LEADING_ZEROS = re.compile(r"(?<!\d)0+(?=\d)")
+_SQUARES = re.compile(r"\d+")
+
+
+@dataclass(frozen=True)
+class Correction:
+    ply: int
+    recorded: str
+    replacement: str
+    distance: int
+
+    @property
+    def turn(self) -> int:
+        return self.ply // 2 + 1
+
+
+@dataclass
+class RepairedGame:
+    game: ArchivedGame
+    corrections: list[Correction] = field(default_factory=list)
+    failed_ply: Optional[int] = None  # The first move that couldn't be repaired
+
+    @property
+    def is_repaired(self) -> bool:
+        return self.failed_ply is None
+
+
+def _read(token: str, legal_moves: list[LegalMove]) -> Optional[LegalMove]:
+    try:
+        return find_move(token, legal_moves)
+    except (InvalidMoveError, ValueError, ValidationError):
+        return None
+
+
+def _touched(board: Board, move: LegalMove) -> set[TileIndex]:
+    if isinstance(move, Move):
+        return {move.start, move.end}
+
+    return {move[0].start, *(m.end for m in move), *get_captured(board, move)}
+
+
+def rank_candidates(board: Board, token: str, legal_moves: list[LegalMove]) -> list[tuple[int, LegalMove]]:
+    """The legal moves ``token`` might have meant, closest first, with their
+    edit distances (see the module docstring)."""
+    normalized = _LEADING_ZEROS.sub("", token)
+    squares = {int(s) for s in _SQUARES.findall(normalized)}
+    ranked = []
+
+    for i, move in enumerate(legal_moves):
+        distance = min(edit_distance(normalized, format_move(move, legal_moves)),
+                       edit_distance(normalized, format_move(move)))
+        ranked.append((distance, -len(squares & _touched(board, move)), i, move))
+
+    return [(distance, move) for distance, _, _, move in sorted(ranked)]
+
+
+def _plays_on(board: Board, player: Player, tokens: list[str], cache: PositionCache) -> int:
+    """How many of ``tokens`` can be played from ``board`` (up to the first
+    that isn't legal)."""
+    for played, token in enumerate(tokens):
+        if (move := _read(token, cache.legal_moves(board, player))) is None:
+            return played
+
+        board, player = apply_move(board, move), not player
+
+    return len(tokens)
+
+
+def repair_game(game: ArchivedGame, *, lookahead: int = DEFAULT_LOOKAHEAD, max_candidates: int = MAX_CANDIDATES,
+                max_corrections: int = MAX_CORRECTIONS, cache: Optional[PositionCache] = None) -> RepairedGame:
+    """See the module docstring. Pass the same ``cache`` when repairing many
+    games."""
+    cache = cache if cache is not None else PositionCache()
+    board, player = default_board(), PLAYER_ONE
+    moves, corrections = [], []
+
+    for ply, token in enumerate(game.moves):
+        legal_moves = cache.legal_moves(board, player)
+
+        if (move := _read(token, legal_moves)) is None:
+            following = game.moves[ply + 1:ply + 1 + lookahead]
+            candidates = rank_candidates(board, token, legal_moves)[:max_candidates] \
+                if len(corrections) < max_corrections else []
+            best, best_played = None, 0
+
+            for distance, move in candidates:
+                if (played := _plays_on(apply_move(board, move), not player, following, cache)) == len(following):
+                    best = distance, move
+                    break
+
+                if played > best_played:
+                    best, best_played = (distance, move), played
+
+            if best is None:
+                return RepairedGame(ArchivedGame([*moves, *game.moves[ply:]], dict(game.headers)), corrections, ply)
+
+            distance, move = best
+
+            token = format_move(move, legal_moves)
+            corrections.append(Correction(ply, game.moves[ply], token, distance))
+
+        moves.append(token)
+        board, player = apply_move(board, move), not player
+
+    return RepairedGame(ArchivedGame(moves, dict(game.headers)), corrections)
+
+
+def _repair_chunk(games: list[ArchivedGame], lookahead: int) -> list[RepairedGame]:
+    cache = PositionCache()
+    return [repair_game(game, lookahead=lookahead, cache=cache) for game in games]
+
+
+def repair_games(games: Iterable[ArchivedGame], *, lookahead: int = DEFAULT_LOOKAHEAD,
+                 workers: Optional[int] = None, chunk_size: int = 64) -> Iterator[RepairedGame]:
+    """Repairs ``games`` (in order) in ``workers`` processes (in this process
+    if ``workers`` is 1). ``games`` is consumed lazily."""
+    if workers == 1:
+        cache = PositionCache()
+
+        for game in games:
+            yield repair_game(game, lookahead=lookahead, cache=cache)
+        return
+
+    workers = workers or os.cpu_count() or 1
+
+    with ProcessPoolExecutor(workers) as executor:
+        for repaired in imap_bounded(executor, _repair_chunk, chunked(games, chunk_size), 2 * workers, lookahead):
+            yield from repaired
+
+
+def format_report(i: int, repaired: RepairedGame) -> str:
+    """The corrections of the ``i``-th game (one per line)."""
+    headers = repaired.game.headers
+    name = f"Game {i + 1}" + (f" ({headers['Event']})" if "Event" in headers else "")
+    lines = [f"{name}, turn {c.turn} (ply {c.ply}): {c.recorded} -> {c.replacement}" for c in repaired.corrections]
+
+    if not repaired.is_repaired:
+        ply = repaired.failed_ply
+        lines.append(f"{name}, turn {ply // 2 + 1} (ply {ply}): couldn't repair {repaired.game.moves[ply]}")
+
+    return "".join(line + "\n" for line in lines)
+
+
+def write_repairs(repaired_games: Iterable[RepairedGame], out: TextIO, report: TextIO) -> tuple[int, int]:
+    """Writes the games to ``out`` and the corrections to ``report``. Returns
+    the number of corrections and of games that couldn't be repaired."""
+    corrections = failures = 0
+
+    for i, repaired in enumerate(repaired_games):
+        out.write(format_game(repaired.game) + "\n")
+        report.write(format_report(i, repaired))
+        corrections += len(repaired.corrections)
+        failures += not repaired.is_repaired
+
+    return corrections, failures
+
+
+@click.command()
+@click.argument("archive", type=click.Path(exists=True, dir_okay=False))
+@click.option("--out", required=True, help="Where to write the repaired games.")
+@click.option("--report", required=True, help="Where to write the corrections.")
+@click.option("--lookahead", default=DEFAULT_LOOKAHEAD, show_default=True,
+              help="How many of the following moves have to be legal after a correction.")
+@click.option("--workers", type=int, help="The number of processes (the number of CPUs by default).")
+def main(archive: str, out: str, report: str, lookahead: int, workers: Optional[int]):
+    with open(out, "w", encoding="utf-8") as out_file, open(report, "w", encoding="utf-8") as report_file:
+        corrections, failures = write_repairs(
+            repair_games(read_games(archive), lookahead=lookahead, workers=workers), out_file, report_file)
+
+    click.echo(f"{corrections} corrections, {failures} games left unrepaired")
+
+
+if __name__ == "__main__":
+    main()
@@ -29,9 +29,15 @@
 --------------------------------------------------------------------------------
 """
 
-from checkers.game import Game
+import shutil
+import sys
+import warnings
+
+from checkers.engine.ponder import PonderingEngine
+from checkers.game import Game, format_cmd
+from checkers.models import PLAYER_TWO
 from checkers.models.move import InvalidMoveError
-from checkers.utils.draw import draw_centered_board_with_indices, draw_tile_indices
+from checkers.utils.draw import draw_tile_indices, BoardRenderer
 from checkers.utils.stringx import HR, center_multiline, wrap_text
 
 
@@ -78,38 +84,87 @@ def get_footer() -> str:
     return "\nThanks for playing!"
 
 
-def main():
+def main(full_frame: bool = False, bot: bool = False, depth: int = 3):
+    """
+    :param full_frame: Redraw the entire board after every move instead of only
+                       the tiles that changed (for terminals without ANSI
+                       support).
+    :param bot: Play against the engine (as player two) instead of PVP. The
+                engine ponders while you're typing.
+    :param depth: How deep the engine searches.
+    """
     game = Game()
+    renderer = BoardRenderer(full_frame=full_frame)
+    engine = PonderingEngine(depth) if bot else None
 
     print(get_intro())
-    print(draw_centered_board_with_indices(game.board))
+    print(renderer.frame(game.board))
+
+    # The engine's reply goes into the next prompt, so the prompt (and the
+    # user's input) is all that's printed below the board. ``None`` means
+    # something else was printed, and the board is redrawn in full.
+    lines_below = 1
+    engine_note = ""
+    prompt = ""
 
     def get_prompt(turn_idx: 'TurnIndex') -> str:
-        return f"> {str(turn_idx).zfill(2)} (P{1 + (turn_idx // 2)}). "
+        nonlocal prompt
+        prompt = f"{engine_note}> {str(turn_idx).zfill(2)} (P{1 + (turn_idx // 2)}). "
+        return prompt
 
     def handle_invalid_move(e: InvalidMoveError):
+        nonlocal lines_below
         print(f"{e} Please try again.")
+        lines_below = None
 
     try:
         for turn_idx, move in std_input_cmd_generator(
                 get_prompt=get_prompt,
                 invalid_move_error_handler=handle_invalid_move
         ):
-            game.play(move)
+            if len(prompt) + len(move) >= shutil.get_terminal_size().columns:
+                lines_below = None  # The input wrapped
+
+            with warnings.catch_warnings(record=True) as caught:
+                warnings.simplefilter("always")
+
+                try:
+                    game.play(move)
+                except InvalidMoveError as e:
+                    handle_invalid_move(e)
+                    continue
 
-            print("\n")
-            print(draw_centered_board_with_indices(game.board))
-            print("\n")
+                engine_move = None
+
+                if engine is not None and (engine_move := engine.choose_move(game.board, PLAYER_TWO).move):
+                    game.play(format_cmd(engine_move))
+
+            for w in caught:
+                warnings.showwarning(w.message, w.category, w.filename, w.lineno)
+                lines_below = None
+
+            if full_frame:
+                print("\n")
+                print(renderer.update(game.board))
+                print("\n")
+            else:
+                print(renderer.update(game.board, lines_below=lines_below), end="")
+
+            engine_note = "" if engine_move is None else f"Engine played {format_cmd(engine_move)}. "
+            lines_below = 1
 
     except StopIteration:
         pass
 
-    print(draw_centered_board_with_indices(game.board))
+    if engine is not None:
+        engine.stop()
+
+    print(renderer.frame(game.board))
     print(get_footer())
 
 
 if __name__ == "__main__":
-    main()
+    main(full_frame="--full-frame" in sys.argv[1:], bot="--bot" in sys.argv[1:])
 
 # THe same game as in sample_match (but structured to copy-paste into the shell)
 SAMPLE_GAME = """32-28
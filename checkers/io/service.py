@@ -0,0 +1,351 @@
+"""
+A local HTTP/JSON service for move validation and hints, so other services
+can share one warm copy of :mod:`checkers.logic` instead of embedding their
+own::
+
+    python -m checkers.io.service [--port 27532] [--workers 4]
+
+Positions are given as FEN (see :mod:`checkers.io.fen`) and moves in the
+notation of :mod:`checkers.io.notation`. The endpoints are:
+
+- ``POST /validate`` with ``{"fen": ..., "move": "28x19"}``: ``{"legal":
+  true, "move": "28x17x19"}`` (the move as it's written among the legal
+  moves) or ``{"legal": false}``,
+- ``POST /legal-moves`` with ``{"fen": ...}``: ``{"moves": [...]}``,
+- ``POST /best-move`` with ``{"fen": ..., "depth": 4}`` (and optionally
+  ``"seconds"``): ``{"move": ..., "score": ..., "depth": ...}``, and
+- ``GET /stats``: the p50/p99 latency per endpoint (in milliseconds) and the
+  hit rate of the position cache.
+
+Malformed requests get a 400 with ``{"error": ...}``.
+
+Request threads don't do the work themselves: they hand it to a
+:class:`MicroBatcher`, which collects the requests that arrive within
+``max_delay`` seconds (or ``max_batch`` of them) and dispatches them to a
+pool of workers. Validation and legal-move requests of a batch are answered
+together, with a single :meth:`checkers.logic.cache.PositionCache.legal_moves_many`
+(so the positions nobody asked for before are generated by
+:mod:`checkers.logic.batch`). Searches go to the pool one by one, sharing a
+transposition table.
+
+.. NOTE::
+    The service binds to localhost by default and has no authentication, so
+    don't expose it.
+"""
+import json
+import math
+import os
+import queue
+import threading
+import time
+from collections import defaultdict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+
+import click
+
+from checkers.engine.search import Searcher, SearchLimits, SearchResult, SearchStopped, TranspositionTable
+from checkers.io.fen import FenError, parse_fen
+from checkers.io.notation import NotationError, find_move, format_move
+from checkers.logic.cache import PositionCache
+from checkers.logic.legal_moves import LegalMove
+from checkers.models import Board, Player
+
+DEFAULT_PORT = 27532
+
+VALIDATE = "validate"
+LEGAL_MOVES = "legal-moves"
+BEST_MOVE = "best-move"
+ENDPOINTS = (VALIDATE, LEGAL_MOVES, BEST_MOVE)
+
+DEFAULT_DEPTH = 4
+MAX_SERVICE_DEPTH = 8
+MAX_SECONDS = 10.
+
+DEFAULT_MAX_BATCH = 64
+DEFAULT_MAX_DELAY = 0.002
+
+# How many of the latest requests the percentiles are computed over
+LATENCY_WINDOW = 10_000
+
+
+class ServiceError(ValueError):
+    pass
+
+
+@dataclass
+class Job:
+    endpoint: str
+    board: Board
+    player: Player
+    args: dict = field(default_factory=dict)
+    future: Future = field(default_factory=Future)
+
+
+class LatencyStats:
+    """The latencies of the last ``window`` requests per endpoint."""
+
+    def __init__(self, window: int = LATENCY_WINDOW):
+        self._latencies: dict[str, deque[float]] = defaultdict(lambda: deque(maxlen=window))
+        self._counts: dict[str, int] = defaultdict(int)
+        self._lock = threading.Lock()
+
+    def record(self, endpoint: str, seconds: float):
+        with self._lock:
+            self._latencies[endpoint].append(seconds)
+            self._counts[endpoint] += 1
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        """``{endpoint: {"count": ..., "p50_ms": ..., "p99_ms": ...}}``"""
+        with self._lock:
+            latencies = {endpoint: sorted(values) for endpoint, values in self._latencies.items()}
+            counts = dict(self._counts)
+
+        return {endpoint: {"count": counts[endpoint],
+                           "p50_ms": 1000 * percentile(values, 50),
+                           "p99_ms": 1000 * percentile(values, 99)}
+                for endpoint, values in latencies.items()}
+
+
+def percentile(ordered: list[float], p: float) -> float:
+    """The nearest-rank percentile of the (sorted, non-empty) ``ordered``."""
+    return ordered[max(0, min(len(ordered), math.ceil(len(ordered) * p / 100)) - 1)]
+
+
+class MicroBatcher:
+    """Collects submitted jobs into batches and runs them on a pool of
+    ``workers`` threads (see the module docstring)."""
+
+    def __init__(self, cache: Optional[PositionCache] = None, *, workers: Optional[int] = None,
+                 max_batch: int = DEFAULT_MAX_BATCH, max_delay: float = DEFAULT_MAX_DELAY):
+        self.cache = cache if cache is not None else PositionCache()
+        self.tt = TranspositionTable()
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.batches = 0
+
+        self._jobs: queue.SimpleQueue[Optional[Job]] = queue.SimpleQueue()
+        self._pool = ThreadPoolExecutor(workers or os.cpu_count(), thread_name_prefix="checkers-service")
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def submit(self, endpoint: str, board: Board, player: Player, **args) -> Future:
+        job = Job(endpoint, board, player, args)
+        self._jobs.put(job)
+        return job.future
+
+    def _collect(self) -> Optional[list[Job]]:
+        """Blocks for the next batch (``None`` once closed)."""
+        if (job := self._jobs.get()) is None:
+            return None
+
+        batch = [job]
+        deadline = time.monotonic() + self.max_delay
+
+        while len(batch) < self.max_batch and (timeout := deadline - time.monotonic()) > 0:
+            try:
+                job = self._jobs.get(timeout=timeout)
+            except queue.Empty:
+                break
+
+            if job is None:
+                self._jobs.put(None)  # Close after this batch
+                break
+
+            batch.append(job)
+
+        return batch
+
+    def _run(self):
+        while (batch := self._collect()) is not None:
+            self.batches += 1
+            lookups = [job for job in batch if job.endpoint != BEST_MOVE]
+
+            if lookups:
+                self._pool.submit(self._answer_lookups, lookups)
+
+            for job in batch:
+                if job.endpoint == BEST_MOVE:
+                    self._pool.submit(self._answer, job, self._best_move)
+
+    def _answer_lookups(self, jobs: list[Job]):
+        try:
+            all_moves = self.cache.legal_moves_many([(job.board, job.player) for job in jobs])
+        except BaseException as e:
+            for job in jobs:
+                job.future.set_exception(e)
+            return
+
+        for job, moves in zip(jobs, all_moves):
+            self._answer(job, lambda j: _lookup(j, moves))
+
+    @staticmethod
+    def _answer(job: Job, compute):
+        try:
+            job.future.set_result(compute(job))
+        except BaseException as e:
+            job.future.set_exception(e)
+
+    def _best_move(self, job: Job) -> dict:
+        depth, seconds = job.args["depth"], job.args.get("seconds")
+        limits = SearchLimits.within(seconds) if seconds is not None else SearchLimits()
+        searcher = Searcher(self.tt, limits)
+        result: Optional[SearchResult] = None
+
+        try:
+            for result in searcher.iterate(job.board, job.player, depth):
+                pass
+        except SearchStopped:
+            pass
+
+        if result is None or result.move is None:
+            return {"move": None, "score": result.score if result else None, "depth": 0}
+
+        return {"move": format_move(result.move, self.cache.legal_moves(job.board, job.player)),
+                "score": result.score, "depth": result.depth}
+
+    def close(self):
+        self._jobs.put(None)
+        self._thread.join()
+        self._pool.shutdown()
+
+
+def _lookup(job: Job, moves: list[LegalMove]) -> dict:
+    if job.endpoint == LEGAL_MOVES:
+        return {"moves": [format_move(move, moves) for move in moves]}
+
+    try:
+        move = find_move(job.args["move"], moves)
+    except NotationError:
+        move = None
+
+    if move is None:
+        return {"legal": False}
+
+    return {"legal": True, "move": format_move(move, moves)}
+
+
+def parse_request(endpoint: str, body: dict) -> tuple[Board, Player, dict]:
+    """The position and the arguments of a request (raises ``ServiceError``
+    if they're missing or malformed)."""
+    if endpoint not in ENDPOINTS:
+        raise ServiceError(f"Unknown endpoint '{endpoint}'")
+
+    if not isinstance(body, dict) or not isinstance(body.get("fen"), str):
+        raise ServiceError("Expected a JSON object with a 'fen'")
+
+    try:
+        board, player = parse_fen(body["fen"])
+    except FenError as e:
+        raise ServiceError(str(e)) from e
+
+    if endpoint == VALIDATE:
+        if not isinstance(body.get("move"), str):
+            raise ServiceError("Expected a 'move'")
+
+        return board, player, {"move": body["move"]}
+
+    if endpoint == BEST_MOVE:
+        depth, seconds = body.get("depth", DEFAULT_DEPTH), body.get("seconds")
+
+        if not isinstance(depth, int) or not 1 <= depth <= MAX_SERVICE_DEPTH:
+            raise ServiceError(f"Expected a 'depth' from 1 to {MAX_SERVICE_DEPTH}")
+
+        if seconds is not None and (not isinstance(seconds, (int, float)) or not 0 < seconds <= MAX_SECONDS):
+            raise ServiceError(f"Expected 'seconds' up to {MAX_SECONDS}")
+
+        return board, player, {"depth": depth, "seconds": seconds}
+
+    return board, player, {}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: 'ServiceServer'
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        if self.path != "/stats":
+            self._reply(404, {"error": f"Unknown path '{self.path}'"})
+            return
+
+        stats = self.server.batcher.cache.stats
+        self._reply(200, {"latency": self.server.latency.summary(),
+                          "batches": self.server.batcher.batches,
+                          "cache": {"hits": stats.hits, "misses": stats.misses, "size": stats.size,
+                                    "hit_rate": stats.hit_rate}})
+
+    def do_POST(self):
+        started = time.perf_counter()
+        endpoint = self.path.lstrip("/")
+
+        try:
+            body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"null")
+            board, player, args = parse_request(endpoint, body)
+        except ValueError as e:  # Including JSONDecodeError and ServiceError
+            self._reply(404 if endpoint not in ENDPOINTS else 400, {"error": str(e)})
+            return
+
+        try:
+            result = self.server.batcher.submit(endpoint, board, player, **args).result()
+        except Exception as e:
+            self._reply(500, {"error": str(e)})
+            return
+
+        self._reply(200, result)
+        self.server.latency.record(endpoint, time.perf_counter() - started)
+
+    def _reply(self, status: int, data: dict):
+        payload = json.dumps(data).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class ServiceServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128  # The default listen backlog (5) refuses bursts of clients
+
+    def __init__(self, address: tuple[str, int], batcher: Optional[MicroBatcher] = None):
+        super().__init__(address, _Handler)
+        self.batcher = batcher or MicroBatcher()
+        self.latency = LatencyStats()
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def server_close(self):
+        super().server_close()
+        self.batcher.close()
+
+
+def start_service(host: str = "127.0.0.1", port: int = 0, **kwargs) -> ServiceServer:
+    """Starts serving in a background thread (on a free port by default).
+    Call ``shutdown`` and ``server_close`` to stop."""
+    server = ServiceServer((host, port), MicroBatcher(**kwargs))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+@click.command()
+@click.option("--port", type=int, default=DEFAULT_PORT, show_default=True)
+@click.option("--host", default="127.0.0.1", show_default=True)
+@click.option("--workers", type=int, help="The size of the worker pool (the number of CPUs by default).")
+def main(port: int, host: str, workers: Optional[int]):
+    with ServiceServer((host, port), MicroBatcher(workers=workers)) as server:
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,196 @@
+"""
+Aggregate statistics over archives of games (see :mod:`checkers.io.archive`),
+collected in a single pass::
+
+    python -m checkers.io.stats games.pdn more-games.pdn --out summary.json
+
+Every game is replayed once (like :func:`checkers.io.training.replay`, up to
+the first illegal move) and counted into the NumPy arrays of an
+:class:`ArchiveStats`:
+
+- ``positions`` and ``heatmaps``: how many positions there were per phase
+  and, per phase, how often each square held each kind of piece (the planes
+  of :func:`checkers.io.training.encode_position`),
+- ``capture_lengths``: how many positions had a maximum capture (see
+  :func:`checkers.logic.max_capture.compute_max_capture`) of each length,
+  where 0 means there was nothing to capture,
+- ``promotions``: per player, the plies at which men were crowned,
+- ``game_lengths``: the number of plies of the games,
+- ``results``: the recorded results (``2-0``, ``0-2``, ``1-1`` and unknown),
+- ``draw_reasons``: for games recorded as draws, the rule that applies to
+  their final position (see :class:`checkers.logic.adjudication.Adjudicator`),
+  or ``OTHER_DRAW`` (e.g., an agreement or a draw decided by the players), and
+- ``incomplete``: the games that stopped at an illegal move.
+
+Plies are counted from 0 and clipped to ``MAX_PLIES`` (the last bucket holds
+everything longer).
+
+Stats are mergeable (:meth:`ArchiveStats.merge`), so the games are handed out in chunks to
+worker processes, which each send back the stats of their chunk. The archive
+is streamed: only ``2 * workers`` chunks are in flight at a time.
+"""
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, fields
+from typing import Iterable, Iterator, Optional
+
+import click
+import numpy as np
+
+from checkers.game import default_board
+from checkers.io.archive import ArchivedGame, RESULTS, UNKNOWN_RESULT, read_games
+from checkers.io.training import PLANES, SQUARES, encode_position, replay, chunked, imap_bounded
+from checkers.logic.adjudication import Adjudicator, DrawReason, Status, MAX_PIECES
+from checkers.logic.cache import PositionCache
+from checkers.logic.legal_moves import LegalMove, apply_move, get_moving_piece, get_start_end
+from checkers.models import Board, PLAYER_ONE
+
+OPENING = 0
+MIDDLEGAME = 1
+ENDGAME = 2
+PHASES = ("opening", "middlegame", "endgame")
+
+# The fewest pieces on the board in the opening and the middlegame
+OPENING_PIECES = 30
+MIDDLEGAME_PIECES = 13
+
+MAX_PLIES = 400
+
+RESULT_NAMES = (*RESULTS, UNKNOWN_RESULT)
+DRAW_REASONS = (*(reason.name for reason in DrawReason), "OTHER_DRAW")
+
+
+def phase_of(board: Board) -> int:
+    """The phase of the game, by the number of pieces on the board (any king
+    makes it an endgame)."""
+    if len(board) < MIDDLEGAME_PIECES or any(p.is_king for p in board):
+        return ENDGAME
+
+    return OPENING if len(board) >= OPENING_PIECES else MIDDLEGAME
+
+
+def _counts(*shape: int):
+    return field(default_factory=lambda: np.zeros(shape, dtype=np.int64))
+
+
+@dataclass
+class ArchiveStats:
+    """See the module docstring."""
+    games: np.ndarray = _counts()
+    incomplete: np.ndarray = _counts()
+    positions: np.ndarray = _counts(len(PHASES))
+    heatmaps: np.ndarray = _counts(len(PHASES), PLANES, SQUARES)
+    capture_lengths: np.ndarray = _counts(MAX_PIECES + 1)
+    promotions: np.ndarray = _counts(2, MAX_PLIES + 1)
+    game_lengths: np.ndarray = _counts(MAX_PLIES + 1)
+    results: np.ndarray = _counts(len(RESULT_NAMES))
+    draw_reasons: np.ndarray = _counts(len(DRAW_REASONS))
+
+    def merge(self, other: 'ArchiveStats') -> 'ArchiveStats':
+        """Adds the counts of ``other`` (in place) and returns ``self``."""
+        for f in fields(self):
+            getattr(self, f.name)[...] += getattr(other, f.name)
+
+        return self
+
+    def add_position(self, board: Board, max_capture: int):
+        phase = phase_of(board)
+        self.positions[phase] += 1
+        self.heatmaps[phase] += encode_position(board)
+        self.capture_lengths[max_capture] += 1
+
+    def add_move(self, ply: int, before: Board, move: LegalMove, after: Board):
+        piece = get_moving_piece(before, move)
+
+        if not piece.is_king and after[get_start_end(move)[1]].is_king:
+            self.promotions[0 if piece.player is PLAYER_ONE else 1, min(ply, MAX_PLIES)] += 1
+
+    def add_game(self, game: ArchivedGame, plies: int, adjudicator: Adjudicator):
+        self.games += 1
+        self.incomplete += plies < len(game.moves)
+        self.game_lengths[min(plies, MAX_PLIES)] += 1
+        self.results[RESULT_NAMES.index(game.result) if game.result in RESULTS else -1] += 1
+
+        if game.is_decided and game.winner is None:
+            status = adjudicator.status
+            self.draw_reasons[DRAW_REASONS.index(status.reason.name) if status.status is Status.DRAW else -1] += 1
+
+    def to_dict(self) -> dict:
+        return {
+            "phases": list(PHASES),
+            "result_names": list(RESULT_NAMES),
+            "draw_reason_names": list(DRAW_REASONS),
+            **{f.name: getattr(self, f.name).tolist() for f in fields(self)},
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'ArchiveStats':
+        return cls(**{f.name: np.array(data[f.name], dtype=np.int64) for f in fields(cls)})
+
+
+def collect_stats(games: Iterable[ArchivedGame]) -> ArchiveStats:
+    """The stats of ``games`` (in this process)."""
+    stats = ArchiveStats()
+    cache = PositionCache()
+
+    for game in games:
+        adjudicator = Adjudicator(default_board())
+        plies = 0
+
+        for ply, (board, player, _, move) in enumerate(replay(game, cache)):
+            after = apply_move(board, move)
+            stats.add_position(board, cache.max_capture(board, player))
+            stats.add_move(ply, board, move, after)
+            adjudicator.record(board, move, after)
+            plies = ply + 1
+
+        stats.add_game(game, plies, adjudicator)
+
+    return stats
+
+
+def archive_stats(games: Iterable[ArchivedGame], *, workers: Optional[int] = None,
+                  chunk_size: int = 64) -> ArchiveStats:
+    """The stats of ``games``, collected by ``workers`` processes (in this
+    process if ``workers`` is 1)."""
+    if workers == 1:
+        return collect_stats(games)
+
+    workers = workers or os.cpu_count() or 1
+    stats = ArchiveStats()
+
+    with ProcessPoolExecutor(workers) as executor:
+        for partial in imap_bounded(executor, collect_stats, chunked(games, chunk_size), 2 * workers):
+            stats.merge(partial)
+
+    return stats
+
+
+def write_stats(path: str, stats: ArchiveStats):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(stats.to_dict(), f)
+
+
+def read_stats(path: str) -> ArchiveStats:
+    with open(path, encoding="utf-8") as f:
+        return ArchiveStats.from_dict(json.load(f))
+
+
+def _read_archives(paths: Iterable[str]) -> Iterator[ArchivedGame]:
+    for path in paths:
+        yield from read_games(path)
+
+
+@click.command()
+@click.argument("archives", nargs=-1, required=True, type=click.Path(exists=True, dir_okay=False))
+@click.option("--out", default="summary.json", show_default=True, help="Where to write the summary.")
+@click.option("--workers", type=int, help="The number of processes (the number of CPUs by default).")
+def main(archives: tuple[str, ...], out: str, workers: Optional[int]):
+    stats = archive_stats(_read_archives(archives), workers=workers)
+    write_stats(out, stats)
+    click.echo(f"{int(stats.games)} games, {int(stats.positions.sum())} positions -> {out}")
+
+
+if __name__ == "__main__":
+    main()
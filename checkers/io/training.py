@@ -0,0 +1,280 @@
+"""
+Exports training data for evaluation models from archives of games
+(see :mod:`checkers.io.archive`).
+
+Every position of every game becomes a sample with:
+
+- ``positions``: a ``(4, 50)`` uint8 tensor with planes for player one's men,
+  player one's kings, player two's men and player two's kings,
+- ``side``: 1 if player one is to move, 0 otherwise,
+- ``legal``: a mask over all ``50 * 50`` (start, end) pairs of the legal moves,
+- ``move``: the (start, end) index of the move that was played,
+- ``outcome``: 1 if player one won, -1 if player two won, 0 otherwise
+  (including unknown results).
+
+Games are replayed in worker processes and the samples are written to shards
+of memory-mappable ``.npy`` files (one per field), described by a
+``manifest.json``. Positions (with the side to move) that were already
+exported are skipped. To keep memory bounded on large archives, only the
+``max_seen`` most recently seen positions are remembered (an LRU), which
+catches the positions that recur most, e.g. the openings.
+
+The board is symmetric under a 180° rotation (square ``i`` becomes
+``51 - i``) combined with swapping the colours, so every sample can be
+augmented with its mirror image using precomputed index permutations.
+"""
+import hashlib
+import json
+import os
+from collections import deque, OrderedDict
+from concurrent.futures import ProcessPoolExecutor, Executor
+from typing import Iterable, Iterator, Optional, Callable, TypeVar
+
+import numpy as np
+from pydantic import ValidationError
+
+from checkers.game import default_board
+from checkers.io.archive import ArchivedGame
+from checkers.io.notation import find_move
+from checkers.logic.cache import PositionCache
+from checkers.logic.legal_moves import LegalMove, get_legal_moves, apply_move, get_start_end
+from checkers.models import Board, Player, PLAYER_ONE
+from checkers.models.move import InvalidMoveError
+
+T = TypeVar("T")
+U = TypeVar("U")
+
+PLANES = 4
+SQUARES = 50
+MOVES = SQUARES * SQUARES
+
+FIELDS = {
+    "positions": (np.uint8, (PLANES, SQUARES)),
+    "side": (np.uint8, ()),
+    "legal": (np.bool_, (MOVES,)),
+    "move": (np.int16, ()),
+    "outcome": (np.int8, ()),
+}
+
+# -- Symmetry -----------------------------------------------------------------
+
+SQUARE_ROTATION = np.arange(SQUARES - 1, -1, -1)
+PLANE_SWAP = np.array([2, 3, 0, 1])
+MOVE_ROTATION = (SQUARE_ROTATION[:, None] * SQUARES + SQUARE_ROTATION[None, :]).reshape(-1)
+
+
+def augment(samples: dict[str, np.ndarray]) -> dict[str, np.ndarray]:
+    """Rotates the board by 180° and swaps the colours of all ``samples``."""
+    return {
+        "positions": samples["positions"][:, PLANE_SWAP][:, :, SQUARE_ROTATION],
+        "side": 1 - samples["side"],
+        "legal": samples["legal"][:, MOVE_ROTATION],
+        "move": MOVE_ROTATION[samples["move"]].astype(np.int16),
+        "outcome": -samples["outcome"],
+    }
+
+
+# -- Encoding -----------------------------------------------------------------
+
+def encode_position(board: Board) -> np.ndarray:
+    planes = np.zeros((PLANES, SQUARES), dtype=np.uint8)
+
+    for idx, player, is_king in board:
+        planes[(0 if player is PLAYER_ONE else 2) + is_king, idx - 1] = 1
+
+    return planes
+
+
+def move_index(move: LegalMove) -> int:
+    start, end = get_start_end(move)
+    return (start - 1) * SQUARES + end - 1
+
+
+def replay(game: ArchivedGame, cache: Optional[PositionCache] = None
+           ) -> Iterator[tuple[Board, Player, list[LegalMove], LegalMove]]:
+    """Yields every position of ``game`` with the legal moves and the move that
+    was played. Stops at the first move that isn't legal.
+
+    Pass the same ``cache`` when replaying many games, so later games profit
+    from the openings of earlier ones."""
+    board, player = default_board(), PLAYER_ONE
+
+    for cmd in game.moves:
+        legal_moves = cache.legal_moves(board, player) if cache is not None else get_legal_moves(board, player)
+
+        try:
+            move = find_move(cmd, legal_moves)
+        except (InvalidMoveError, ValueError, ValidationError):
+            move = None
+
+        if move is None:
+            return
+
+        yield board, player, legal_moves, move
+
+        board, player = apply_move(board, move), not player
+
+
+def encode_games(games: list[ArchivedGame], with_augmentation: bool = True) -> dict[str, np.ndarray]:
+    """Turns ``games`` into samples (and a ``keys`` field to deduplicate them)."""
+    columns = {name: [] for name in FIELDS}
+    cache = PositionCache()
+
+    for game in games:
+        outcome = 0 if game.winner is None else (1 if game.winner is PLAYER_ONE else -1)
+
+        for board, player, legal_moves, move in replay(game, cache):
+            legal = np.zeros(MOVES, dtype=np.bool_)
+            legal[[move_index(m) for m in legal_moves]] = True
+
+            columns["positions"].append(encode_position(board))
+            columns["side"].append(int(player is PLAYER_ONE))
+            columns["legal"].append(legal)
+            columns["move"].append(move_index(move))
+            columns["outcome"].append(outcome)
+
+    samples = {name: np.array(columns[name], dtype=dtype).reshape((-1, *shape))
+               for name, (dtype, shape) in FIELDS.items()}
+
+    if with_augmentation:
+        mirrored = augment(samples)
+        samples = {name: np.concatenate([samples[name], mirrored[name]]) for name in FIELDS}
+
+    samples["keys"] = np.array([_position_key(p, s) for p, s in zip(samples["positions"], samples["side"])],
+                               dtype=np.uint64)
+
+    return samples
+
+
+def _position_key(positions: np.ndarray, side: int) -> int:
+    """A hash that (unlike ``hash``) is the same in every process."""
+    digest = hashlib.blake2b(positions.tobytes() + bytes([side]), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
+
+
+# -- Exporting ----------------------------------------------------------------
+
+def chunked(iterable: Iterable[T], size: int) -> Iterator[list[T]]:
+    chunk = []
+
+    for item in iterable:
+        chunk.append(item)
+
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+
+    if chunk:
+        yield chunk
+
+
+def imap_bounded(executor: Executor, fn: Callable[..., U], iterable: Iterable[T], window: int,
+                 *args) -> Iterator[U]:
+    """Like ``executor.map(fn, iterable)`` (in order), but with at most
+    ``window`` pending tasks, so ``iterable`` is consumed lazily."""
+    pending = deque()
+
+    for item in iterable:
+        pending.append(executor.submit(fn, item, *args))
+
+        if len(pending) >= window:
+            yield pending.popleft().result()
+
+    while pending:
+        yield pending.popleft().result()
+
+
+class ShardWriter:
+    """Buffers samples and writes them to ``out_dir`` in shards of
+    ``shard_size`` samples (plus a ``manifest.json`` on ``close``).
+
+    Samples whose key is among the last ``max_seen`` keys are dropped as
+    duplicates."""
+
+    def __init__(self, out_dir: str, shard_size: int = 1 << 16, max_seen: int = 1 << 20):
+        self.out_dir = out_dir
+        self.shard_size = shard_size
+        self.max_seen = max_seen
+        self.shards: list[dict] = []
+        self.seen: OrderedDict[int, None] = OrderedDict()
+        self.duplicates = 0
+        self._buffer = {name: [] for name in FIELDS}
+        self._buffered = 0
+
+        os.makedirs(out_dir, exist_ok=True)
+
+    def add(self, samples: dict[str, np.ndarray]):
+        keep = []
+
+        for i, key in enumerate(samples["keys"].tolist()):
+            if key in self.seen:
+                self.duplicates += 1
+                self.seen.move_to_end(key)
+            else:
+                self.seen[key] = None
+                keep.append(i)
+
+                if len(self.seen) > self.max_seen:
+                    self.seen.popitem(last=False)
+
+        for name in FIELDS:
+            self._buffer[name].append(samples[name][keep])
+
+        self._buffered += len(keep)
+
+        while self._buffered >= self.shard_size:
+            self._flush(self.shard_size)
+
+    def _flush(self, n: int):
+        data = {name: np.concatenate(self._buffer[name]) for name in FIELDS}
+        shard = {"count": n, "files": {}}
+
+        for name, values in data.items():
+            filename = f"shard-{len(self.shards):05d}.{name}.npy"
+            np.save(os.path.join(self.out_dir, filename), values[:n])
+            shard["files"][name] = filename
+            self._buffer[name] = [values[n:]]
+
+        self._buffered -= n
+        self.shards.append(shard)
+
+    def close(self) -> dict:
+        if self._buffered:
+            self._flush(self._buffered)
+
+        manifest = {
+            "fields": {name: {"dtype": np.dtype(dtype).str, "shape": list(shape)}
+                       for name, (dtype, shape) in FIELDS.items()},
+            "samples": sum(shard["count"] for shard in self.shards),
+            "duplicates": self.duplicates,
+            "shards": self.shards,
+        }
+
+        with open(os.path.join(self.out_dir, "manifest.json"), "w") as f:
+            json.dump(manifest, f, indent=2)
+
+        return manifest
+
+
+def export(games: Iterable[ArchivedGame], out_dir: str, *, shard_size: int = 1 << 16,
+           with_augmentation: bool = True, workers: Optional[int] = None, chunk_size: int = 64,
+           max_seen: int = 1 << 20) -> dict:
+    """Replays ``games`` in ``workers`` processes and writes the (deduplicated)
+    samples to ``out_dir``. Returns the manifest."""
+    writer = ShardWriter(out_dir, shard_size, max_seen)
+    workers = workers or os.cpu_count() or 1
+
+    with ProcessPoolExecutor(workers) as executor:
+        for samples in imap_bounded(executor, encode_games, chunked(games, chunk_size), 2 * workers,
+                                    with_augmentation):
+            writer.add(samples)
+
+    return writer.close()
+
+
+def load_shard(out_dir: str, i: int, mmap_mode: Optional[str] = "r") -> dict[str, np.ndarray]:
+    with open(os.path.join(out_dir, "manifest.json")) as f:
+        shard = json.load(f)["shards"][i]
+
+    return {name: np.load(os.path.join(out_dir, filename), mmap_mode=mmap_mode)
+            for name, filename in shard["files"].items()}
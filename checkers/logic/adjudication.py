@@ -0,0 +1,208 @@
+"""
+The endgame rules from the README: when is a game won, and when is it drawn?
+
+- A player loses if they cannot make any valid moves.
+- A game draws if:
+    - a position repeats itself three times, or
+    - the players end up with only (equal numbers of) kings, or
+    - during 25 moves, there are only king moves without normal piece moves or
+      captures, or
+    - after 16 moves if there are only three kings, two kings and a piece, or
+      a king and two pieces against a king, or
+    - a player proposes a draw (and there have been at least 40 moves).
+
+Which of the material-based rules applies only depends on how many men and
+kings each player has, so we look that up in a table (``MATERIAL_TABLE``)
+computed once at import. The counters are updated with every move by an
+:class:`Adjudicator`, so checking the status of a game is constant-time.
+
+.. NOTE:: A "move" in these rules is one move by *each* player, i.e., two plies.
+"""
+from collections import Counter
+from dataclasses import dataclass
+from enum import Enum, IntEnum
+from typing import Callable, Optional
+
+import numpy as np
+
+from checkers.logic.legal_moves import LegalMove, get_moving_piece, get_captured, has_legal_moves
+from checkers.models import Board, Move, Piece, Player, PLAYER_ONE, PLAYER_TWO
+
+MAX_PIECES = 20
+
+REPETITIONS = 3
+KING_MOVES = 25
+SIXTEEN_MOVES = 16
+DRAW_OFFER_MOVES = 40
+
+
+class DrawOfferError(ValueError):
+    pass
+
+
+class Material(IntEnum):
+    NORMAL = 0
+    EQUAL_KINGS = 1
+    SIXTEEN_MOVES = 2
+
+
+class Status(Enum):
+    ONGOING = "ongoing"
+    WIN = "win"
+    DRAW = "draw"
+
+
+class DrawReason(Enum):
+    REPETITION = "threefold repetition"
+    EQUAL_KINGS = "only equal numbers of kings"
+    KING_MOVES = f"{KING_MOVES} moves with only kings moving"
+    SIXTEEN_MOVES = f"{SIXTEEN_MOVES} moves in a drawn endgame"
+    AGREEMENT = "agreement"
+
+
+@dataclass(frozen=True)
+class GameStatus:
+    status: Status
+    winner: Optional[Player] = None
+    reason: Optional[DrawReason] = None
+
+
+ONGOING = GameStatus(Status.ONGOING)
+
+# (men, kings) of the stronger side in the 16-move endgames (against a lone king)
+_SIXTEEN_MOVE_SIDES = ((0, 3), (1, 2), (2, 1))
+
+
+def _build_material_table() -> np.ndarray:
+    """Indexed by ``[p1 men, p1 kings, p2 men, p2 kings]``."""
+    table = np.full((MAX_PIECES + 1,) * 4, Material.NORMAL, dtype=np.int8)
+
+    for kings in range(1, MAX_PIECES + 1):
+        table[0, kings, 0, kings] = Material.EQUAL_KINGS
+
+    for men, kings in _SIXTEEN_MOVE_SIDES:
+        table[men, kings, 0, 1] = Material.SIXTEEN_MOVES
+        table[0, 1, men, kings] = Material.SIXTEEN_MOVES
+
+    return table
+
+
+MATERIAL_TABLE = _build_material_table()
+
+Signature = tuple[int, int, int, int]
+
+
+def get_signature(board: Board) -> Signature:
+    counts = Counter((p.player, p.is_king) for p in board)
+    return (counts[PLAYER_ONE, False], counts[PLAYER_ONE, True],
+            counts[PLAYER_TWO, False], counts[PLAYER_TWO, True])
+
+
+def classify(signature: Signature) -> Material:
+    return Material(MATERIAL_TABLE[signature])
+
+
+PositionKey = tuple[int, int, int, Player]
+
+
+def get_position_key(board: Board, player: Player) -> PositionKey:
+    """Identifies a position exactly (for counting repetitions): the masks of
+    ``Board.to_masks`` and the player to move."""
+    return (*board.to_masks(), player)
+
+
+class Adjudicator:
+    """Tracks everything the endgame rules need, one move at a time.
+
+    Call :meth:`record` after every move with the boards before and after. The
+    resulting status is available as ``status``.
+    """
+
+    def __init__(self, board: Board, player: Player = PLAYER_ONE):
+        self.player = player  # To move
+        self.plies = 0
+        self.signature = list(get_signature(board))
+        self.king_plies = 0
+        self.sixteen_plies = 0
+        self.repetitions = Counter({get_position_key(board, player): 1})
+        self.status = self._material_status() or ONGOING
+
+    def record(self, before: Board, move: LegalMove, after: Board) -> GameStatus:
+        mover = get_moving_piece(before, move)
+        captured = [before[i] for i in get_captured(before, move)]
+        end = move.end if isinstance(move, Move) else move[-1].end
+        signature = list(self.signature)
+
+        for p in captured:
+            signature[self._signature_idx(p.player, p.is_king)] -= 1
+
+        if not mover.is_king and after[end].is_king:
+            signature[self._signature_idx(mover.player, False)] -= 1
+            signature[self._signature_idx(mover.player, True)] += 1
+
+        player = not mover.player
+        return self.record_move(mover, len(captured), tuple(signature), get_position_key(after, player),
+                                lambda: has_legal_moves(after, player))
+
+    def record_move(self, mover: Piece, captures: int, signature: Signature, position: PositionKey,
+                    has_moves: Callable[[], bool]) -> GameStatus:
+        """Same as ``record``, for callers that already know what changed:
+        ``mover`` is the piece that moved (as it was before the move),
+        ``captures`` the number of pieces it captured, and ``signature``,
+        ``position`` and ``has_moves`` describe the position after the move
+        (see :class:`checkers.logic.move_lists.MoveLists`). ``has_moves`` is
+        only called if the game isn't over for other reasons."""
+        self.plies += 1
+        self.player = not mover.player
+
+        # Moves of men and captures can't be undone, so positions before them
+        # can't repeat.
+        if captures or not mover.is_king:
+            self.king_plies = 0
+            self.repetitions.clear()
+        else:
+            self.king_plies += 1
+
+        if signature != tuple(self.signature):
+            self.sixteen_plies = 0
+            self.signature = list(signature)
+
+        if classify(signature) is Material.SIXTEEN_MOVES:
+            self.sixteen_plies += 1
+
+        self.repetitions[position] += 1
+
+        self.status = self._material_status() \
+            or self._counter_status(self.repetitions[position]) \
+            or (GameStatus(Status.WIN, winner=mover.player) if not has_moves() else ONGOING)
+
+        return self.status
+
+    def agree_draw(self) -> GameStatus:
+        if self.plies < 2 * DRAW_OFFER_MOVES:
+            raise DrawOfferError(f"A draw can only be agreed on after {DRAW_OFFER_MOVES} moves.")
+
+        self.status = GameStatus(Status.DRAW, reason=DrawReason.AGREEMENT)
+        return self.status
+
+    @staticmethod
+    def _signature_idx(player: Player, is_king: bool) -> int:
+        return (0 if player is PLAYER_ONE else 2) + is_king
+
+    def _material_status(self) -> Optional[GameStatus]:
+        p1_men, p1_kings, p2_men, p2_kings = self.signature
+
+        if not p1_men + p1_kings:
+            return GameStatus(Status.WIN, winner=PLAYER_TWO)
+        elif not p2_men + p2_kings:
+            return GameStatus(Status.WIN, winner=PLAYER_ONE)
+        elif classify(tuple(self.signature)) is Material.EQUAL_KINGS:
+            return GameStatus(Status.DRAW, reason=DrawReason.EQUAL_KINGS)
+
+    def _counter_status(self, repetitions: int) -> Optional[GameStatus]:
+        if repetitions >= REPETITIONS:
+            return GameStatus(Status.DRAW, reason=DrawReason.REPETITION)
+        elif self.king_plies >= 2 * KING_MOVES:
+            return GameStatus(Status.DRAW, reason=DrawReason.KING_MOVES)
+        elif self.sixteen_plies >= 2 * SIXTEEN_MOVES:
+            return GameStatus(Status.DRAW, reason=DrawReason.SIXTEEN_MOVES)
@@ -0,0 +1,152 @@
+"""
+A per-position analysis of who can capture what.
+
+The predicates in :mod:`checkers.logic.rules` scan the board (and walk the rays
+of kings) every time they're called, and the max-capture check, the legal-move
+generator and the engine all end up asking the same questions about the same
+position. :class:`PositionAnalysis` answers them once, lazily, and
+:func:`get_analysis` stores it on the board with ``Board.cached`` so it's
+dropped as soon as the board changes.
+
+Jumps are read off the ray tables in :mod:`checkers.logic.rays`.
+"""
+from functools import cached_property
+
+from checkers.logic.rays import RAYS, DIRECTIONS, DIAGONALS, scan
+from checkers.models import Board, Player, TileIndex, Piece, PLAYER_ONE
+
+Jump = tuple[TileIndex, TileIndex]  # (landing square, captured square)
+
+# The direction opposite each of ``DIRECTIONS`` (by index)
+_OPPOSITE = tuple(DIRECTIONS.index((-dr, -dc)) for dr, dc in DIRECTIONS)
+
+
+def find_jumps(idx: TileIndex, is_king: bool, enemies: int, occupied: int) -> list[Jump]:
+    """The single captures from ``idx``, given bitmasks of the enemy pieces
+    and of all pieces (see ``PositionAnalysis.jumps_from``)."""
+    jumps = []
+
+    if is_king:
+        for d in range(len(DIRECTIONS)):
+            ray = scan(idx, d, occupied)
+
+            if ray.blocker is not None and enemies >> (ray.blocker - 1) & 1:
+                jumps.extend((end, ray.blocker) for end in ray.beyond)
+    else:
+        for d in DIAGONALS:
+            ray = RAYS[idx][d]
+
+            if len(ray) > 1 and enemies >> (ray[0] - 1) & 1 and not occupied >> (ray[1] - 1) & 1:
+                jumps.append((ray[1], ray[0]))
+
+    return jumps
+
+
+class PositionAnalysis:
+    """Lazily computed (and cached) capture facts about a single position.
+
+    .. NOTE:: Only use this through :func:`get_analysis`, which takes care of
+       throwing it away when the board changes.
+    """
+
+    def __init__(self, board: Board):
+        self.board = board
+        self._jumps: dict[tuple[TileIndex, Player, bool], list[Jump]] = {}
+
+    @cached_property
+    def occupancy(self) -> dict[TileIndex, Piece]:
+        return {p.idx: p for p in self.board}
+
+    @cached_property
+    def masks(self) -> tuple[int, int, int]:
+        """See ``Board.to_masks``."""
+        return self.board.to_masks()
+
+    @property
+    def occupied(self) -> int:
+        p1, p2, _ = self.masks
+        return p1 | p2
+
+    def jumps_from(self, idx: TileIndex, player: Player, is_king: bool) -> list[Jump]:
+        """The single captures available to a (king) piece of ``player`` at
+        ``idx``. The square doesn't need to hold that piece, so this also
+        serves the intermediate squares of a capture series.
+
+        Pieces stay on the board until the end of a turn, so the capturing
+        piece's starting square (and the captured pieces) still block.
+        """
+        key = (idx, player, is_king)
+
+        if key not in self._jumps:
+            p1, p2, _ = self.masks
+            self._jumps[key] = find_jumps(idx, is_king, p2 if player else p1, p1 | p2)
+
+        return self._jumps[key]
+
+    @cached_property
+    def jumps(self) -> dict[TileIndex, list[Jump]]:
+        """The single captures available to each piece on the board (pieces
+        without captures are left out)."""
+        return {p.idx: jumps for p in self.board
+                if (jumps := self.jumps_from(p.idx, p.player, p.is_king))}
+
+    @cached_property
+    def attackers(self) -> dict[TileIndex, list[TileIndex]]:
+        """For every piece that can be captured: the pieces that can capture it."""
+        attackers: dict[TileIndex, list[TileIndex]] = {}
+
+        for idx, jumps in self.jumps.items():
+            for captured in dict.fromkeys(captured for _, captured in jumps):
+                attackers.setdefault(captured, []).append(idx)
+
+        return attackers
+
+    def can_capture(self, player: Player) -> bool:
+        return any(self.occupancy[idx].player is player for idx in self.jumps)
+
+    def hanging(self, player: Player) -> set[TileIndex]:
+        """``player``'s pieces that the opponent can capture."""
+        return {idx for idx in self.attackers if self.occupancy[idx].player is player}
+
+    @cached_property
+    def safe_jumps(self) -> dict[TileIndex, list[Jump]]:
+        """The subset of ``jumps`` after which the capturing piece can't
+        immediately be captured back on its landing square."""
+        safe_jumps = {}
+
+        for idx, jumps in self.jumps.items():
+            if safe := [(end, captured) for end, captured in jumps if self._is_safe_landing(idx, end, captured)]:
+                safe_jumps[idx] = safe
+
+        return safe_jumps
+
+    def _is_safe_landing(self, start: TileIndex, end: TileIndex, captured: TileIndex) -> bool:
+        """Whether no enemy piece can capture the piece that jumps from
+        ``start`` over ``captured`` on its landing square ``end``, worked out
+        on the masks of the position after the jump."""
+        p1, p2, kings = self.masks
+        own, enemies = (p1, p2) if self.occupancy[start].player is PLAYER_ONE else (p2, p1)
+        enemies &= ~(1 << (captured - 1))
+        occupied = own & ~(1 << (start - 1)) | 1 << (end - 1) | enemies
+
+        for d in range(len(DIRECTIONS)):
+            # An attacker along ``d`` needs somewhere to land on the other side
+            behind = RAYS[end][_OPPOSITE[d]]
+
+            if not behind or occupied >> (behind[0] - 1) & 1:
+                continue
+
+            attacker = scan(end, d, occupied).blocker
+
+            if attacker is None or not enemies >> (attacker - 1) & 1:
+                continue
+
+            # Kings capture from any distance, men only diagonally from next door
+            if kings >> (attacker - 1) & 1 or d in DIAGONALS and attacker == RAYS[end][d][0]:
+                return False
+
+        return True
+
+
+def get_analysis(board: Board) -> PositionAnalysis:
+    return board.cached("analysis", PositionAnalysis)
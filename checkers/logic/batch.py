@@ -0,0 +1,173 @@
+"""
+Legal-move generation for many boards at once with numpy.
+
+Boards are encoded as rows of an ``(N, 50)`` int8 array (see
+:func:`boards_to_array`): 0 for an empty square, 1/2 for player one's
+men/kings and -1/-2 for player two's men/kings.
+
+All the geometry is precomputed in ``RAYS``, an array version of
+:data:`checkers.logic.rays.RAYS` (with 0-based squares): for every square and
+each of the eight directions a king can move in, the squares along that ray.
+Off-board entries point at an extra "blocked" column that we append to the
+boards.
+
+Steps and single captures of all boards then come out of a few fancy-indexing
+operations. Only boards where a capture series might go on after the first
+jump are handed to the scalar :func:`checkers.logic.legal_moves.get_legal_moves`.
+"""
+from typing import Sequence, Union
+
+import numpy as np
+
+from checkers.logic import rays
+from checkers.logic.legal_moves import LegalMove, get_legal_moves, sort_legal_moves
+from checkers.logic.rays import DIRECTIONS
+from checkers.models import Board, Move, Player, PLAYER_ONE
+
+EMPTY = 0
+MAN = 1
+KING = 2
+BLOCKED = 9
+
+OFF_BOARD = 50  # The index of the "blocked" column
+MAX_RAY = 9
+
+DIAGONALS = slice(0, 4)
+
+# Which diagonals are "forward" for the men of player one (up) and two (down)
+FORWARD = np.array([[False, False, True, True],
+                    [True, True, False, False]])
+
+
+def _build_rays() -> np.ndarray:
+    array = np.full((50, len(DIRECTIONS), MAX_RAY), OFF_BOARD, dtype=np.intp)
+
+    for i in range(1, 51):
+        for d, ray in enumerate(rays.RAYS[i]):
+            array[i - 1, d, :len(ray)] = [sq - 1 for sq in ray]
+
+    return array
+
+
+RAYS = _build_rays()
+_STEPS = np.arange(MAX_RAY)
+
+
+def boards_to_array(boards: Sequence[Board]) -> np.ndarray:
+    array = np.zeros((len(boards), 50), dtype=np.int8)
+
+    for n, board in enumerate(boards):
+        for idx, player, is_king in board:
+            array[n, idx - 1] = (KING if is_king else MAN) * (1 if player is PLAYER_ONE else -1)
+
+    return array
+
+
+def _relative(boards: np.ndarray, players: Union[Player, Sequence[Player]]) -> tuple[np.ndarray, np.ndarray]:
+    """Flips the signs of the boards so that the player to move's pieces are
+    positive, and appends the "blocked" column."""
+    sides = np.broadcast_to(np.asarray(players, dtype=bool), (len(boards),))
+    signs = np.where(sides, 1, -1).astype(np.int8)
+    rel = np.empty((len(boards), 51), dtype=np.int8)
+    rel[:, :50] = boards * signs[:, None]
+    rel[:, OFF_BOARD] = BLOCKED
+
+    return rel, sides
+
+
+def batch_steps(boards: np.ndarray, players: Union[Player, Sequence[Player]]) -> np.ndarray:
+    """All steps (ignoring the maximum capture rule) as rows of
+    ``(board, start, end)`` (with 1-based squares)."""
+    rel, sides = _relative(boards, players)
+
+    # Men: one diagonal step forward
+    targets = RAYS[:, DIAGONALS, 0]                                  # (50, 4)
+    is_man = rel[:, :50, None] == MAN                                # (N, 50, 1)
+    is_forward = FORWARD[sides.astype(int)][:, None, :]              # (N, 1, 4)
+    man_steps = np.nonzero(is_man & is_forward & (rel[:, targets] == EMPTY))
+    man_ends = targets[man_steps[1], man_steps[2]]
+
+    # Kings: any number of empty squares along a ray
+    occupancy = rel[:, RAYS]                                         # (N, 50, 8, 9)
+    reachable = np.cumprod(occupancy == EMPTY, axis=-1, dtype=np.int8).astype(bool)
+    king_steps = np.nonzero(reachable & (rel[:, :50, None, None] == KING))
+    king_ends = RAYS[king_steps[1], king_steps[2], king_steps[3]]
+
+    return np.concatenate([
+        np.stack([man_steps[0], man_steps[1], man_ends], axis=1),
+        np.stack([king_steps[0], king_steps[1], king_ends], axis=1),
+    ]).reshape(-1, 3) + [0, 1, 1]
+
+
+def batch_captures(boards: np.ndarray, players: Union[Player, Sequence[Player]]) -> np.ndarray:
+    """All single captures as rows of ``(board, start, captured, end)``
+    (with 1-based squares)."""
+    rel, _ = _relative(boards, players)
+
+    # Men: jump a neighbouring enemy along a diagonal (forward or backward)
+    neighbours, beyond = RAYS[:, DIAGONALS, 0], RAYS[:, DIAGONALS, 1]
+    man_jumps = np.nonzero((rel[:, :50, None] == MAN)
+                           & (rel[:, neighbours] < 0)
+                           & (rel[:, beyond] == EMPTY))
+    man_rows = np.stack([man_jumps[0], man_jumps[1],
+                         neighbours[man_jumps[1], man_jumps[2]],
+                         beyond[man_jumps[1], man_jumps[2]]], axis=1)
+
+    # Kings: the first piece along the ray must be an enemy, and we can land
+    # on any empty square beyond it (up to the next piece)
+    occupancy = rel[:, RAYS]                                         # (N, 50, 8, 9)
+    is_empty = occupancy == EMPTY
+    first = np.argmax(~is_empty, axis=-1)                            # (N, 50, 8)
+    first_piece = np.take_along_axis(occupancy, first[..., None], axis=-1)[..., 0]
+    is_capturable = (rel[:, :50, None] == KING) & (first_piece < 0)
+
+    is_beyond = _STEPS > first[..., None]
+    landings = np.cumprod(is_empty | ~is_beyond, axis=-1, dtype=np.int8).astype(bool) \
+        & is_beyond & is_capturable[..., None]
+    king_jumps = np.nonzero(landings)
+    king_rows = np.stack([king_jumps[0], king_jumps[1],
+                          RAYS[king_jumps[1], king_jumps[2], first[king_jumps[:3]]],
+                          RAYS[king_jumps[1], king_jumps[2], king_jumps[3]]], axis=1)
+
+    return np.concatenate([man_rows, king_rows]).reshape(-1, 4) + [0, 1, 1, 1]
+
+
+def _has_continuations(rel: np.ndarray, captures: np.ndarray) -> np.ndarray:
+    """For captures by men: whether the capturing piece could jump again from
+    its landing square (without jumping the same piece twice)."""
+    n, captured, end = captures[:, 0], captures[:, 2] - 1, captures[:, 3] - 1
+    neighbours, beyond = RAYS[end][:, DIAGONALS, 0], RAYS[end][:, DIAGONALS, 1]
+
+    return ((rel[n[:, None], neighbours] < 0)
+            & (neighbours != captured[:, None])
+            & (rel[n[:, None], beyond] == EMPTY)).any(axis=1)
+
+
+def batch_legal_moves(boards: Sequence[Board], players: Union[Player, Sequence[Player]]) -> list[list[LegalMove]]:
+    """``get_legal_moves`` for every board (in the same order)."""
+    array = boards_to_array(boards)
+    rel, sides = _relative(array, players)
+    captures = batch_captures(array, players)
+    steps = batch_steps(array, players)
+
+    legal_moves: list[list[LegalMove]] = [[] for _ in boards]
+    has_captures = np.zeros(len(boards), dtype=bool)
+    has_captures[captures[:, 0]] = True
+
+    # Boards that need the scalar capture search: captures by kings, and
+    # captures by men that might continue.
+    needs_search = np.zeros(len(boards), dtype=bool)
+    is_king_capture = rel[captures[:, 0], captures[:, 1] - 1] == KING
+    needs_search[captures[is_king_capture, 0]] = True
+    needs_search[captures[~is_king_capture][_has_continuations(rel, captures[~is_king_capture]), 0]] = True
+
+    for n in np.nonzero(needs_search)[0]:
+        legal_moves[n] = get_legal_moves(boards[n], bool(sides[n]))
+
+    for n, start, _, end in captures[~needs_search[captures[:, 0]]].tolist():
+        legal_moves[n].append([Move(start, end)])
+
+    for n, start, end in steps[~has_captures[steps[:, 0]]].tolist():
+        legal_moves[n].append(Move(start, end))
+
+    return [moves if needs_search[n] else sort_legal_moves(boards[n], moves) for n, moves in enumerate(legal_moves)]
@@ -0,0 +1,118 @@
+"""
+An LRU cache for the results of move validation: the legal moves and the
+maximum capture of a position (with the side to move).
+
+Archives replay the same positions (most of all the openings) over and over,
+so these are worth remembering. Entries are keyed by the pieces on the board
+and the side to move (boards are mutable, so we can't key by the board
+itself). The cache can be shared between threads; results are computed
+outside of the lock, so two threads may occasionally compute the same entry.
+"""
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Hashable, TypeVar, Sequence, Optional
+
+from checkers.logic.batch import batch_legal_moves
+from checkers.logic.legal_moves import LegalMove, get_legal_moves
+from checkers.logic.max_capture import compute_max_capture
+from checkers.models import Board, Player
+
+T = TypeVar("T")
+
+LEGAL_MOVES = "legal_moves"
+MAX_CAPTURE = "max_capture"
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.
+
+
+class PositionCache:
+    def __init__(self, maxsize: int = 1 << 14):
+        self.maxsize = maxsize
+        self._entries: OrderedDict[Hashable, object] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = self._misses = self._evictions = 0
+
+    def _get(self, key: Hashable, compute: Callable[[], T]) -> T:
+        with self._lock:
+            if key in self._entries:
+                self._hits += 1
+                self._entries.move_to_end(key)
+                return self._entries[key]
+
+            self._misses += 1
+
+        value = compute()
+
+        with self._lock:
+            self._store(key, value)
+
+        return value
+
+    def _store(self, key: Hashable, value: object):
+        """(Call this with the lock held.)"""
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    def legal_moves(self, board: Board, player: Player) -> list[LegalMove]:
+        """Like ``get_legal_moves`` (the list is a copy, the moves aren't)."""
+        return list(self._get((LEGAL_MOVES, tuple(board), player), lambda: get_legal_moves(board, player)))
+
+    def legal_moves_many(self, positions: Sequence[tuple[Board, Player]]) -> list[list[LegalMove]]:
+        """``legal_moves`` for every position, where the misses are generated
+        together with :func:`checkers.logic.batch.batch_legal_moves`."""
+        keys = [(LEGAL_MOVES, tuple(board), player) for board, player in positions]
+        results: list[Optional[list[LegalMove]]] = [None] * len(keys)
+        misses = []
+
+        with self._lock:
+            for n, key in enumerate(keys):
+                if key in self._entries:
+                    self._hits += 1
+                    self._entries.move_to_end(key)
+                    results[n] = list(self._entries[key])
+                else:
+                    self._misses += 1
+                    misses.append(n)
+
+        if misses:
+            computed = batch_legal_moves([positions[n][0] for n in misses], [positions[n][1] for n in misses])
+
+            with self._lock:
+                for n, moves in zip(misses, computed):
+                    self._store(keys[n], moves)
+                    results[n] = list(moves)
+
+        return results
+
+    def max_capture(self, board: Board, player: Player) -> int:
+        """Like ``compute_max_capture``."""
+        return self._get((MAX_CAPTURE, tuple(board), player), lambda: compute_max_capture(board, player))
+
+    @property
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(self._hits, self._misses, self._evictions, len(self._entries))
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = self._evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
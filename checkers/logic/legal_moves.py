@@ -0,0 +1,259 @@
+"""
+A generator of all legal moves for a player. Steps and jumps are read off the
+ray tables in :mod:`checkers.logic.rays` (the jumps through
+:class:`checkers.logic.attacks.PositionAnalysis`).
+
+A legal move comes in one of the two shapes :func:`checkers.game.parse_cmd`
+produces:
+
+- a single ``Move`` for a step, or
+- a ``list[Move]`` for a series of captures.
+
+Because of the maximum capture rule, steps are only legal if no captures are
+available, and only the longest capture series are legal.
+"""
+from typing import Union, Iterator, Optional, NamedTuple
+
+from checkers.logic.attacks import get_analysis
+from checkers.logic.rays import RAYS, DIRECTIONS, scan
+from checkers.models import Board, Move, Piece, Player, TileIndex, PLAYER_ONE, PLAYER_TWO, capture_series_to_moves
+
+LegalMove = Union[Move, list[Move]]
+
+# The forward diagonals of men (see ``rays.DIRECTIONS``), right before left
+# for player one, left before right for player two
+_FORWARD = {PLAYER_ONE: (1, 0), PLAYER_TWO: (2, 3)}
+
+
+def _generate_steps(board: Board, piece: Piece) -> Iterator[Move]:
+    return generate_steps(piece, get_analysis(board).occupied)
+
+
+# Steps are shared between positions, since constructing a ``Move`` is
+# relatively expensive (and nothing modifies them)
+_STEPS: dict[tuple[TileIndex, TileIndex], Move] = {}
+
+
+def _step(start: TileIndex, end: TileIndex) -> Move:
+    if (move := _STEPS.get((start, end))) is None:
+        move = _STEPS[start, end] = Move(start, end)
+
+    return move
+
+
+def generate_steps(piece: Piece, occupied: int) -> Iterator[Move]:
+    """The steps of ``piece``, given a bitmask of the occupied squares."""
+    if piece.is_king:
+        for d in range(len(DIRECTIONS)):
+            for end in scan(piece.idx, d, occupied).empty:
+                yield _step(piece.idx, end)
+
+        return
+
+    for d in _FORWARD[piece.player]:
+        if (ray := RAYS[piece.idx][d]) and not occupied >> (ray[0] - 1) & 1:
+            yield _step(piece.idx, ray[0])
+
+
+def _generate_capture_series(
+        board: Board,
+        piece: Piece,
+        idx: TileIndex = None,
+        captured: tuple[TileIndex, ...] = ()
+) -> Iterator[list[Move]]:
+    """Yields every capture series (that can't be extended any further)
+    starting with ``piece`` at ``idx``.
+
+    Like :func:`checkers.logic.max_capture._compute_max_capture_abstract`,
+    captured pieces stay on the board until the end of the turn and can only be
+    jumped once.
+    """
+    idx = idx or piece.idx
+
+    for next_idx, newly_captured in get_analysis(board).jumps_from(idx, piece.player, piece.is_king):
+        if newly_captured in captured:
+            continue
+
+        move = Move(idx, next_idx)
+        is_extended = False
+
+        for series in _generate_capture_series(board, piece, next_idx, (*captured, newly_captured)):
+            is_extended = True
+            yield [move, *series]
+
+        if not is_extended:
+            yield [move]
+
+
+def get_legal_moves(board: Board, player: Player) -> list[LegalMove]:
+    """All of ``player``'s legal moves in ``board`` (ordered by the index of
+    the piece that moves)."""
+    pieces = [p for p in board if p.player is player]
+
+    if get_analysis(board).can_capture(player):
+        captures = [series for p in pieces for series in _generate_capture_series(board, p)]
+        max_capture = max(map(len, captures))
+        return [series for series in captures if len(series) == max_capture]
+
+    return [step for p in pieces for step in _generate_steps(board, p)]
+
+
+def has_legal_moves(board: Board, player: Player) -> bool:
+    """Like ``bool(get_legal_moves(board, player))``, but stops at the first move."""
+    if get_analysis(board).can_capture(player):
+        return True
+
+    return any(True for p in board if p.player is player for _ in _generate_steps(board, p))
+
+
+# ``(start, end)`` -> the direction and the distance (from 0) of ``end`` along
+# the rays from ``start``
+_RAY_POSITIONS = {(start, end): (d, k)
+                  for start in range(1, 51) for d, ray in enumerate(RAYS[start]) for k, end in enumerate(ray)}
+
+
+def sort_legal_moves(board: Board, moves: list[LegalMove]) -> list[LegalMove]:
+    """Sorts ``moves`` (e.g., from :func:`checkers.logic.batch.batch_legal_moves`)
+    into the order of ``get_legal_moves``: by the piece that moves, then by
+    the direction and the length of its first step or jump, in the order the
+    generators try them. Capture series that start the same keep their
+    order."""
+    def key(move: LegalMove) -> tuple[int, int, int]:
+        first = move if isinstance(move, Move) else move[0]
+        d, k = _RAY_POSITIONS[first.start, first.end]
+
+        if isinstance(move, Move) and not (piece := board[first.start]).is_king:
+            d = _FORWARD[piece.player].index(d)
+
+        return first.start, d, k
+
+    return sorted(moves, key=key)
+
+
+def get_start_end(move: LegalMove) -> tuple[TileIndex, TileIndex]:
+    return (move.start, move.end) if isinstance(move, Move) else (move[0].start, move[-1].end)
+
+
+def find_legal_move(move: LegalMove, legal_moves: list[LegalMove]) -> Optional[LegalMove]:
+    """Returns the legal move ``move`` stands for (if any).
+
+    Captures are often written down by just their start and end (``28x19``
+    for ``28x17x8x19``), so if there's no exact match we accept the only legal
+    move with the same start and end.
+    """
+    if move in legal_moves:
+        return move
+
+    start_end = get_start_end(move)
+    candidates = [m for m in legal_moves if get_start_end(m) == start_end]
+
+    if len(candidates) == 1:
+        return candidates[0]
+
+
+def get_moving_piece(board: Board, move: LegalMove) -> Piece:
+    return board[move.start if isinstance(move, Move) else move[0].start]
+
+
+def get_captured(board: Board, move: LegalMove) -> list[TileIndex]:
+    """The squares of the pieces ``move`` captures (in the order they're
+    jumped)."""
+    if isinstance(move, Move):
+        return []
+
+    piece = get_moving_piece(board, move)
+    analysis = get_analysis(board)
+
+    return [captured
+            for m in move
+            for end, captured in analysis.jumps_from(m.start, piece.player, piece.is_king)
+            if end == m.end]
+
+
+def apply_move(board: Board, move: LegalMove) -> Board:
+    """Returns a copy of ``board`` with ``move`` (assumed legal) applied,
+    including coronation."""
+    board = board.copy()
+
+    if isinstance(move, Move):
+        piece = board.apply_step(move)[move.end]
+    else:
+        piece = board.apply_captures(move)[move[-1].end]
+
+    if piece.has_reached_end and not piece.is_king:
+        board.replace(piece.coronate())
+
+    return board
+
+
+class Undo(NamedTuple):
+    """What :func:`unmake_move` needs to take a move back."""
+    piece: Piece  # The moving piece, before the move
+    end: TileIndex
+    captured: tuple[Piece, ...]
+
+
+def make_move(board: Board, move: LegalMove) -> Undo:
+    """Like :func:`apply_move`, but applies ``move`` to ``board`` itself.
+    Pass the result to :func:`unmake_move` to restore the board."""
+    piece = get_moving_piece(board, move)
+
+    if isinstance(move, Move):
+        end, captured = move.end, ()
+        board.apply_step(move)
+    else:
+        end = move[-1].end
+        visited = {i for m in move for i in m}
+        captured = tuple(p for p in board if p.idx in visited and p.idx != piece.idx)
+        board.apply_captures(move)
+
+    if not piece.is_king and board[end].has_reached_end:
+        board.replace(board[end].coronate())
+
+    return Undo(piece, end, captured)
+
+
+def unmake_move(board: Board, undo: Undo) -> Board:
+    """Takes back the move :func:`make_move` returned ``undo`` for (this has
+    to be the last move made on ``board``)."""
+    board.pop(undo.end)
+
+    for p in undo.captured:
+        board.insert(p)
+
+    board.insert(undo.piece)
+
+    return board
+
+
+# -- Compact encoding ---------------------------------------------------------
+# A legal move packs into a single int: bit 0 says whether it's a capture
+# series, bits 1-4 how many squares it visits, then 6 bits per square.
+
+MAX_ENCODED_SQUARES = 9
+
+
+def encode_move(move: LegalMove) -> int:
+    """Packs ``move`` into a (63 bit) int. Raises ``ValueError`` for capture
+    series that visit more than ``MAX_ENCODED_SQUARES`` squares."""
+    is_capture = not isinstance(move, Move)
+    squares = (move[0].start, *(m.end for m in move)) if is_capture else (move.start, move.end)
+
+    if len(squares) > MAX_ENCODED_SQUARES:
+        raise ValueError(f"Can't encode a move that visits {len(squares)} squares.")
+
+    code = len(squares) << 1 | is_capture
+
+    for i, square in enumerate(squares):
+        code |= square << (5 + 6 * i)
+
+    return code
+
+
+def decode_move(code: int) -> LegalMove:
+    squares = [(code >> (5 + 6 * i)) & 0b111111 for i in range((code >> 1) & 0b1111)]
+
+    if code & 1:
+        return capture_series_to_moves(squares)
+
+    return Move(*squares)
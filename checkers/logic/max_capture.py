@@ -13,45 +13,19 @@ The secret is in the data structure:
 
 """
 import functools
-import itertools
 import warnings
-from typing import Callable, Iterable
+from typing import Callable
 
-from pydantic import ValidationError
-
-from checkers.logic.rules import get_valid_normal_capture, get_valid_king_capture
+from checkers.logic.attacks import get_analysis, Jump
 from checkers.models import Board, Player, Move, TileIndex
-from checkers.models.position import move_ur, move_dr, TileIndexError, move_u, move_r
-
-
-def get_normal_moves():
-    return itertools.product((move_ur, move_dr), (2, -2))
-
 
-def get_king_moves():
-    return itertools.product((move_ur, move_dr, move_u, move_r),
-                             itertools.chain(range(-11, 0), range(1, 11)))
 
+def _generate_normal_captures(board: Board, idx: TileIndex, player: Player) -> list[Jump]:
+    return get_analysis(board).jumps_from(idx, player, False)
 
-def _generate_captures(
-        get_tiles: Callable[[], Iterable[TileIndex]],
-        get_valid_capture: Callable[[Board, Move, Player], bool],
-        board: Board,
-        start: TileIndex,
-        player: Player,
-) -> list[TileIndex]:
-    for move, amt in get_tiles():
-        try:
-            end = move(start, amt)
-            if capture := get_valid_capture(board, Move(start, end), player=player):
-                yield end, capture
-
-        except (TileIndexError, ValidationError):
-            pass
 
-
-_generate_normal_captures = functools.partial(_generate_captures, get_normal_moves, get_valid_normal_capture)
-_generate_king_captures = functools.partial(_generate_captures, get_king_moves, get_valid_king_capture)
+def _generate_king_captures(board: Board, idx: TileIndex, player: Player) -> list[Jump]:
+    return get_analysis(board).jumps_from(idx, player, True)
 
 
 def _compute_max_capture_abstract(
@@ -100,6 +74,9 @@ _compute_king_max_capture = functools.partial(_compute_max_capture_abstract,
 
 
 def compute_max_capture(board: Board, player: Player) -> int:
+    if not get_analysis(board).can_capture(player):
+        return 0
+
     max_capture = 0
 
     for p in board:
@@ -119,8 +96,11 @@ def is_max_capture(board: Board, moves: list[Move]) -> bool:
     return len(moves) == compute_max_capture(board, board[moves[0].start].player)
 
 
-def validate_max_capture(board: Board, moves: list[Move]):
-    max_capture = compute_max_capture(board, board[moves[0].start].player)
+def validate_max_capture(board: Board, moves: list[Move],
+                         compute: Callable[[Board, Player], int] = compute_max_capture):
+    """Warns if ``moves`` isn't a maximal capture. ``compute`` can be swapped
+    for a cached version (see :class:`checkers.logic.cache.PositionCache`)."""
+    max_capture = compute(board, board[moves[0].start].player)
     is_maximal = len(moves) == max_capture
 
     if not is_maximal:
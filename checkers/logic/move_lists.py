@@ -0,0 +1,179 @@
+"""
+Legal-move lists that are kept up to date as pieces move, instead of being
+regenerated from scratch every ply.
+
+A step or capture only changes the mobility of the pieces near the squares it
+touches (the start, the end and the captured squares). :class:`MoveLists`
+tracks a board (see ``Board.add_tracker``) and, for every piece that's put on
+or taken off a square, marks as dirty:
+
+- the square itself and the squares up to two steps away along the
+  diagonals (what the steps and jumps of a man depend on), and
+- the kings anywhere along the rays through the square (a king's steps and
+  jumps depend on its whole rays).
+
+Per piece, it keeps the steps and whether the piece can capture. Asking for
+the legal moves of a player (:meth:`MoveLists.legal_moves`) only regenerates
+those of the player's pieces on dirty squares. If any of them can capture,
+the moves are regenerated in full (with
+:func:`checkers.logic.legal_moves.get_legal_moves` or, say, a
+:class:`checkers.logic.cache.PositionCache`), since the maximum capture rule
+depends on the whole board.
+
+Like ``get_legal_moves``, the moves come ordered by the index of the piece
+that moves. Copying a tracked board copies its move lists, so the copies
+``apply_move`` makes stay incremental.
+"""
+from typing import Callable, Iterator, Optional
+
+from checkers.logic.attacks import find_jumps
+from checkers.logic.legal_moves import LegalMove, generate_steps, get_legal_moves
+from checkers.logic.rays import RAYS, DIAGONALS, DIRECTIONS
+from checkers.models import Board, Move, Piece, Player, TileIndex, PLAYER_ONE, PLAYER_TWO
+
+ALL_SQUARES = (1 << 50) - 1
+
+
+def _mask(squares) -> int:
+    mask = 0
+
+    for idx in squares:
+        mask |= 1 << (idx - 1)
+
+    return mask
+
+
+# A square and the squares up to two steps away along the diagonals: the men
+# whose steps and jumps a change on the square can affect
+_NEAR = (0, *(_mask((idx, *(i for d in DIAGONALS for i in RAYS[idx][d][:2]))) for idx in range(1, 51)))
+
+# Every square on the rays through a square
+_RAYS = (0, *(_mask(i for d in range(len(DIRECTIONS)) for i in RAYS[idx][d]) for idx in range(1, 51)))
+
+
+def _popcount(mask: int) -> int:
+    return bin(mask).count("1")
+
+
+def _squares(mask: int) -> Iterator[TileIndex]:
+    """The squares in ``mask``, in ascending order."""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length()
+        mask ^= low
+
+
+class MoveLists:
+    """Tracks the legal moves of ``board``. Use :func:`track_move_lists` to
+    set one up."""
+
+    def __init__(self, board: Board):
+        self.board = board
+        self._pieces: list[Optional[Piece]] = [None] * 51
+        self._masks = {PLAYER_ONE: 0, PLAYER_TWO: 0}
+        self._kings = 0
+        self._steps: list[tuple[Move, ...]] = [()] * 51
+        self._jumpers = 0  # The pieces that can capture (as of their last update)
+        self._dirty = ALL_SQUARES
+
+        for piece in board:
+            self._place(piece)
+
+    def _place(self, piece: Piece):
+        bit = 1 << (piece.idx - 1)
+        self._pieces[piece.idx] = piece
+        self._masks[piece.player] |= bit
+
+        if piece.is_king:
+            self._kings |= bit
+
+    def _touch(self, idx: TileIndex):
+        self._dirty |= _NEAR[idx] | _RAYS[idx] & self._kings
+
+    def add(self, piece: Piece):
+        self._place(piece)
+        self._touch(piece.idx)
+
+    def remove(self, piece: Piece):
+        bit = 1 << (piece.idx - 1)
+        self._touch(piece.idx)
+        self._pieces[piece.idx] = None
+        self._masks[piece.player] &= ~bit
+        self._kings &= ~bit
+        self._jumpers &= ~bit
+        self._steps[piece.idx] = ()
+
+    def copy(self, board: Board) -> 'MoveLists':
+        """A copy that tracks ``board`` (a copy of the tracked board)."""
+        move_lists = MoveLists.__new__(MoveLists)
+        move_lists.board = board
+        move_lists._pieces = list(self._pieces)
+        move_lists._masks = dict(self._masks)
+        move_lists._kings = self._kings
+        move_lists._steps = list(self._steps)
+        move_lists._jumpers = self._jumpers
+        move_lists._dirty = self._dirty
+        return move_lists
+
+    def _refresh(self, player: Player):
+        """Regenerates the steps (and captures) of ``player``'s dirty pieces."""
+        own = self._masks[player]
+
+        if not (dirty := self._dirty & own):
+            return
+
+        enemies = self._masks[not player]
+        occupied = own | enemies
+
+        for idx in _squares(dirty):
+            piece = self._pieces[idx]
+            self._steps[idx] = tuple(generate_steps(piece, occupied))
+
+            if find_jumps(idx, piece.is_king, enemies, occupied):
+                self._jumpers |= 1 << (idx - 1)
+            else:
+                self._jumpers &= ~(1 << (idx - 1))
+
+        self._dirty &= ~own
+
+    def can_capture(self, player: Player) -> bool:
+        self._refresh(player)
+        return bool(self._jumpers & self._masks[player])
+
+    def has_legal_moves(self, player: Player) -> bool:
+        return self.can_capture(player) or any(self._steps[idx] for idx in _squares(self._masks[player]))
+
+    def signature(self) -> tuple[int, int, int, int]:
+        """The material, like :func:`checkers.logic.adjudication.get_signature`."""
+        p1, p2, kings = self._masks[PLAYER_ONE], self._masks[PLAYER_TWO], self._kings
+        return _popcount(p1 & ~kings), _popcount(p1 & kings), _popcount(p2 & ~kings), _popcount(p2 & kings)
+
+    def position_key(self, player: Player) -> tuple[int, int, int, Player]:
+        """Like :func:`checkers.logic.adjudication.get_position_key`."""
+        return self._masks[PLAYER_ONE], self._masks[PLAYER_TWO], self._kings, player
+
+    def legal_moves(self, player: Player,
+                    generate: Callable[[Board, Player], list[LegalMove]] = get_legal_moves) -> list[LegalMove]:
+        """Same as ``get_legal_moves(self.board, player)``. Positions with
+        captures are handed to ``generate`` (e.g., ``PositionCache.legal_moves``)."""
+        if self.can_capture(player):
+            return generate(self.board, player)
+
+        steps = self._steps
+        return [step for idx in _squares(self._masks[player]) for step in steps[idx]]
+
+
+def track_move_lists(board: Board) -> MoveLists:
+    """Attaches a :class:`MoveLists` to ``board`` (and returns it)."""
+    move_lists = MoveLists(board)
+    board.add_tracker(move_lists)
+    return move_lists
+
+
+def legal_moves(board: Board, player: Player) -> list[LegalMove]:
+    """The incremental legal moves if ``board`` is tracked, else
+    ``get_legal_moves``."""
+    if (move_lists := board.find_tracker(MoveLists)) is not None:
+        return move_lists.legal_moves(player)
+
+    return get_legal_moves(board, player)
@@ -0,0 +1,84 @@
+"""
+Precomputed rays for move generation.
+
+For every square and each of the eight directions a king can move in (the
+four diagonals and, in this implementation, the four perpendicular
+directions, which skip the light squares), ``RAYS[idx][d]`` holds the squares
+along that ray, nearest first.
+
+What a king can do along a ray only depends on which squares of the ray are
+occupied, so :func:`scan` maps that occupancy pattern (the board's occupancy
+bitmask restricted to the ray) to a :class:`RayScan`: the empty squares the
+king can step to, the first piece in the way and the empty squares behind
+it, where the king lands if it captures that piece. Scans are memoized per
+ray and pattern, so generating king moves takes a lookup per direction.
+"""
+from typing import NamedTuple, Optional
+
+from checkers.models import TileIndex
+from checkers.models.position import row_of, col_of, tile_index_of
+
+# (row, col) offsets. The first four are the diagonals (up-left, up-right,
+# down-left, down-right), the last four the perpendicular directions.
+DIRECTIONS = ((-1, -1), (-1, 1), (1, -1), (1, 1), (-2, 0), (2, 0), (0, -2), (0, 2))
+DIAGONALS = range(4)
+UP = (0, 1)
+DOWN = (2, 3)
+
+
+def _build_rays() -> tuple[tuple[tuple[TileIndex, ...], ...], ...]:
+    rays = [()]  # There's no square 0
+
+    for idx in range(1, 51):
+        square_rays = []
+
+        for dr, dc in DIRECTIONS:
+            row, col = row_of(idx) + dr, col_of(idx) + dc
+            ray = []
+
+            while 0 <= row < 10 and 0 <= col < 10:
+                ray.append(tile_index_of(row, col))
+                row, col = row + dr, col + dc
+
+            square_rays.append(tuple(ray))
+
+        rays.append(tuple(square_rays))
+
+    return tuple(rays)
+
+
+RAYS = _build_rays()
+RAY_MASKS = tuple(tuple(sum(1 << (sq - 1) for sq in ray) for ray in square_rays) for square_rays in RAYS)
+
+
+class RayScan(NamedTuple):
+    empty: tuple[TileIndex, ...]  # Up to the first piece
+    blocker: Optional[TileIndex]  # The first piece (if any)
+    beyond: tuple[TileIndex, ...]  # The empty squares between the first and the second piece
+
+
+_SCANS: list[list[dict[int, RayScan]]] = [[{} for _ in DIRECTIONS] for _ in range(51)]
+
+
+def _scan(ray: tuple[TileIndex, ...], occupied: int) -> RayScan:
+    blockers = [k for k, sq in enumerate(ray) if occupied >> (sq - 1) & 1]
+
+    if not blockers:
+        return RayScan(ray, None, ())
+
+    first = blockers[0]
+    second = blockers[1] if len(blockers) > 1 else len(ray)
+
+    return RayScan(ray[:first], ray[first], ray[first + 1:second])
+
+
+def scan(idx: TileIndex, d: int, occupied: int) -> RayScan:
+    """What's along ray ``d`` from ``idx``, given the ``occupied`` squares (a
+    bitmask with bit ``i - 1`` for square ``i``)."""
+    pattern = occupied & RAY_MASKS[idx][d]
+    scans = _SCANS[idx][d]
+
+    if (result := scans.get(pattern)) is None:
+        result = scans[pattern] = _scan(RAYS[idx][d], pattern)
+
+    return result
@@ -3,3 +3,4 @@ from checkers.models.move import Move, capture_series_to_moves
 from checkers.models.piece import Piece
 from checkers.models.player import Player, PLAYER_ONE, PLAYER_TWO
 from checkers.models.position import TileIndex
+from checkers.models.compact import CompactGame
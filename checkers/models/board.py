@@ -1,6 +1,6 @@
 from collections.abc import Collection
 from collections.abc import Collection
-from typing import Optional, Iterator, Union
+from typing import Optional, Iterator, Union, Callable, TypeVar, Any
 
 from pydantic import validate_arguments
 
@@ -10,6 +10,14 @@ from checkers.models.player import PLAYER_ONE, PLAYER_TWO
 from checkers.models.position import TileIndex
 from checkers.utils.itertoolsx import first_index
 
+T = TypeVar("T")
+
+# Every possible piece, indexed by ``[player][is_king][idx]`` (pieces are
+# immutable, so boards can share them).
+_PIECES = {player: (tuple(Piece(i, player, False) if i else None for i in range(51)),
+                    tuple(Piece(i, player, True) if i else None for i in range(51)))
+           for player in (PLAYER_ONE, PLAYER_TWO)}
+
 
 class BoardError(ValueError):
     pass
@@ -19,6 +27,24 @@ class InvalidMoveError(ValueError):
     pass
 
 
+class Trackers:
+    """Several trackers following the same board (see ``Board.add_tracker``)."""
+
+    def __init__(self, trackers: Iterator[Any]):
+        self.trackers = tuple(trackers)
+
+    def add(self, piece: Piece):
+        for tracker in self.trackers:
+            tracker.add(piece)
+
+    def remove(self, piece: Piece):
+        for tracker in self.trackers:
+            tracker.remove(piece)
+
+    def copy(self, board: 'Board') -> 'Trackers':
+        return Trackers(tracker.copy(board) for tracker in self.trackers)
+
+
 class Board(Collection):
     """Board is a collection for pieces, where pieces are indexed according to
     their position in standard international draughts format.
@@ -29,6 +55,8 @@ class Board(Collection):
           the provided methods return new instances).
     """
     _pieces: list[Piece]
+    _cache: dict[str, Any]
+    _tracker: Optional[Any] = None
 
     @validate_arguments
     def __init__(self, p1_pieces: list[TileIndex], p2_pieces: list[TileIndex], *,
@@ -48,7 +76,8 @@ class Board(Collection):
         if set(p1_pieces) & set(p2_pieces):
             raise BoardError("Cannot place two opposing pieces on the same square")
 
-        kings = kings or []
+        kings = set(kings or [])
+        self._cache = {}
 
         self._pieces = list(sorted(
             (*map(lambda i: Piece(i, PLAYER_ONE, i in kings), p1_pieces),
@@ -79,11 +108,114 @@ class Board(Collection):
 
         starting_tile = self.pop(moves[0].start)
         visited_idxs = [i for move in moves for i in move]
+
+        if self._tracker is not None:
+            for p in self._pieces:
+                if p.idx in visited_idxs:
+                    self._tracker.remove(p)
+
         self._pieces = [p for p in self if p.idx not in visited_idxs]
+        self._cache.clear()
         self.insert(starting_tile.position(moves[-1].end))
 
         return self
 
+    def copy(self) -> 'Board':
+        """A shallow copy of the board. Pieces are immutable, so this is all we
+        need to apply moves without touching the original.
+
+        (This skips the validation in ``__init__``, since we already know the
+        pieces are valid.)
+        """
+        board = Board.__new__(Board)
+        board._pieces = list(self._pieces)
+        board._cache = {}
+
+        if self._tracker is not None:
+            board._tracker = self._tracker.copy(board)
+
+        return board
+
+    @classmethod
+    def from_masks(cls, p1: int, p2: int, kings: int = 0) -> 'Board':
+        """A board from bitmasks of player one's pieces, player two's pieces
+        and the kings (bit ``i - 1`` stands for square ``i``).
+
+        .. NOTE:: Like ``copy``, this skips the validation in ``__init__``, so
+           only use it on trusted input (the masks must be disjoint and only
+           use the lowest 50 bits).
+        """
+        board = Board.__new__(Board)
+        pieces = []
+        occupied = p1 | p2
+
+        while occupied:
+            low = occupied & -occupied
+            idx = low.bit_length()
+            pieces.append(_PIECES[bool(p1 & low)][bool(kings & low)][idx])
+            occupied ^= low
+
+        board._pieces = pieces
+        board._cache = {}
+        return board
+
+    def to_masks(self) -> tuple[int, int, int]:
+        """The inverse of ``from_masks``."""
+        p1 = p2 = kings = 0
+
+        for idx, player, is_king in self._pieces:
+            bit = 1 << (idx - 1)
+
+            if player is PLAYER_ONE:
+                p1 |= bit
+            else:
+                p2 |= bit
+
+            if is_king:
+                kings |= bit
+
+        return p1, p2, kings
+
+    def cached(self, key: str, compute: Callable[['Board'], T]) -> T:
+        """Memoize facts derived from the current position (e.g., the
+        analysis in :mod:`checkers.logic.attacks`) under ``key``.
+
+        The cache is cleared whenever the board changes, so there's no need
+        to invalidate anything by hand.
+        """
+        if key not in self._cache:
+            self._cache[key] = compute(self)
+
+        return self._cache[key]
+
+    def track(self, tracker: Optional[Any]):
+        """Have ``tracker`` follow the pieces on the board (e.g., the
+        incremental evaluation in :mod:`checkers.engine.incremental`).
+
+        The tracker's ``add(piece)`` and ``remove(piece)`` are called for every
+        piece that's put on or taken off the board, and ``copy(board)`` when the
+        board is copied. Pass ``None`` to stop tracking.
+        """
+        self._tracker = tracker
+
+    def add_tracker(self, tracker: Any):
+        """Like ``track``, but keeps the trackers that already follow the board."""
+        if self._tracker is None:
+            self._tracker = tracker
+        elif isinstance(self._tracker, Trackers):
+            self._tracker = Trackers((*self._tracker.trackers, tracker))
+        else:
+            self._tracker = Trackers((self._tracker, tracker))
+
+    def find_tracker(self, cls: type[T]) -> Optional[T]:
+        """The (first) tracker of type ``cls`` that follows the board, if any."""
+        trackers = self._tracker.trackers if isinstance(self._tracker, Trackers) else (self._tracker,)
+        return next((tracker for tracker in trackers if isinstance(tracker, cls)), None)
+
+    @property
+    def tracker(self) -> Optional[Any]:
+        return self._tracker
+
     # -- Methods inspired by list() -------------------------------------------
 
     def _get_list_idx(self, idx: TileIndex) -> int:
@@ -99,11 +231,21 @@ class Board(Collection):
         according to international checkers notation, *not*
         the pythonic index of an element in ``pieces``.
         """
-        return self._pieces.pop(self._get_list_idx(idx))
+        self._cache.clear()
+        piece = self._pieces.pop(self._get_list_idx(idx))
+
+        if self._tracker is not None:
+            self._tracker.remove(piece)
+
+        return piece
 
     def insert(self, tile: Piece):
         """Insert a ``tile`` at the position ``tile.idx``. See ``pop``"""
         ls_idx = first_index(lambda p: p.idx > tile.idx, self)
+        self._cache.clear()
+
+        if self._tracker is not None:
+            self._tracker.add(tile)
 
         if ls_idx == -1:
             return self._pieces.append(tile)
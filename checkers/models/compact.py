@@ -0,0 +1,168 @@
+"""
+A compact representation of a game in progress, for when we have to keep
+many of them in memory.
+
+A ``Board`` holds a list of up to 40 ``Piece`` tuples. Here, the position is
+three bitmasks (bit ``i - 1`` stands for square ``i``): player one's pieces,
+player two's pieces and the kings. The history is an ``array('H')`` with one
+entry per step or jump::
+
+    start | end << 6 | kind << 12
+
+where ``kind`` is ``STEP``, ``JUMP`` (the last jump of a capture) or
+``JUMP_CONTINUES`` (another jump of the same capture follows).
+
+``Piece`` views, ``Board``'s and the moves in the history are built on demand.
+
+.. NOTE:: Like ``Board.apply_step`` and ``Board.apply_captures``, ``play``
+   assumes the move is legal.
+"""
+import functools
+from array import array
+from typing import Iterator, Optional, Union
+
+from checkers.models.board import Board
+from checkers.models.move import Move
+from checkers.models.piece import Piece
+from checkers.models.player import Player, PLAYER_ONE, PLAYER_TWO
+from checkers.models.position import TileIndex, row_of, col_of, tile_index_of
+
+STEP = 0
+JUMP = 1
+JUMP_CONTINUES = 2
+
+_SQUARE_BITS = 6
+_SQUARE_MASK = (1 << _SQUARE_BITS) - 1
+
+# Squares on the far row for player one (1-5) and player two (46-50)
+_PROMOTION = {PLAYER_ONE: sum(1 << (i - 1) for i in range(1, 6)),
+              PLAYER_TWO: sum(1 << (i - 1) for i in range(46, 51))}
+
+
+def _bit(idx: TileIndex) -> int:
+    return 1 << (idx - 1)
+
+
+def _squares(mask: int) -> Iterator[TileIndex]:
+    while mask:
+        low = mask & -mask
+        yield low.bit_length()
+        mask ^= low
+
+
+@functools.lru_cache(maxsize=None)
+def _between(start: TileIndex, end: TileIndex) -> int:
+    """The mask of the squares strictly between ``start`` and ``end`` (along
+    a diagonal or, for kings, a perpendicular)."""
+    (r0, c0), (r1, c1) = (row_of(start), col_of(start)), (row_of(end), col_of(end))
+    dr, dc = (r1 > r0) - (r1 < r0), (c1 > c0) - (c1 < c0)
+
+    if not dr or not dc:  # Perpendicular moves skip the light squares
+        dr, dc = 2 * dr, 2 * dc
+
+    mask, row, col = 0, r0 + dr, c0 + dc
+
+    while (row, col) != (r1, c1):
+        mask |= _bit(tile_index_of(row, col))
+        row, col = row + dr, col + dc
+
+    return mask
+
+
+class CompactGame:
+    __slots__ = ("p1", "p2", "kings", "player", "history")
+
+    def __init__(self, p1: int, p2: int, kings: int = 0, player: Player = PLAYER_ONE,
+                 history: Optional[array] = None):
+        self.p1 = p1
+        self.p2 = p2
+        self.kings = kings
+        self.player = player
+        self.history = history if history is not None else array("H")
+
+    @classmethod
+    def from_board(cls, board: Board, player: Player = PLAYER_ONE) -> 'CompactGame':
+        return cls(*board.to_masks(), player)
+
+    def to_board(self) -> Board:
+        return Board.from_masks(self.p1, self.p2, self.kings)
+
+    # -- Piece views ----------------------------------------------------------
+
+    def __iter__(self) -> Iterator[Piece]:
+        """The pieces in the order of their indices (like ``Board``)."""
+        for idx in _squares(self.p1 | self.p2):
+            yield self[idx]
+
+    def __getitem__(self, idx: TileIndex) -> Piece:
+        bit = _bit(idx)
+
+        if not (self.p1 | self.p2) & bit:
+            raise IndexError(f"No tile with index '{idx}' found on board.")
+
+        return Piece(idx, bool(self.p1 & bit), bool(self.kings & bit))
+
+    def __contains__(self, idx: TileIndex) -> bool:
+        return bool((self.p1 | self.p2) & _bit(idx))
+
+    def __len__(self) -> int:
+        return bin(self.p1 | self.p2).count("1")
+
+    # -- Moves ----------------------------------------------------------------
+
+    def play(self, move: Union[Move, list[Move]]):
+        """Applies ``move`` (including captures and coronation) and records it
+        in the history."""
+        own, other = (self.p1, self.p2) if self.player is PLAYER_ONE else (self.p2, self.p1)
+        jumps = [move] if isinstance(move, Move) else move
+        start, end = jumps[0].start, jumps[-1].end
+        is_king = self.kings & _bit(start)
+        captured = 0
+
+        for k, jump in enumerate(jumps):
+            if isinstance(move, Move):
+                kind = STEP
+            else:
+                kind = JUMP_CONTINUES if k < len(jumps) - 1 else JUMP
+                captured |= _between(jump.start, jump.end) & other
+
+            self.history.append(jump.start | jump.end << _SQUARE_BITS | kind << 2 * _SQUARE_BITS)
+
+        own = own & ~_bit(start) | _bit(end)
+        other &= ~captured
+        self.kings &= ~(_bit(start) | captured)
+
+        if is_king or _bit(end) & _PROMOTION[self.player]:
+            self.kings |= _bit(end)
+
+        self.p1, self.p2 = (own, other) if self.player is PLAYER_ONE else (other, own)
+        self.player = not self.player
+
+    def moves(self) -> Iterator[Union[Move, list[Move]]]:
+        """The moves in the history (in the shapes ``get_legal_moves`` uses)."""
+        series = []
+
+        for entry in self.history:
+            kind = entry >> 2 * _SQUARE_BITS
+            move = Move(entry & _SQUARE_MASK, entry >> _SQUARE_BITS & _SQUARE_MASK)
+
+            if kind == STEP:
+                yield move
+            else:
+                series.append(move)
+
+                if kind == JUMP:
+                    yield series
+                    series = []
+
+    @property
+    def plies(self) -> int:
+        return sum(1 for entry in self.history if entry >> 2 * _SQUARE_BITS != JUMP_CONTINUES)
+
+    def __eq__(self, other: 'CompactGame') -> bool:
+        return (self.p1, self.p2, self.kings, self.player, self.history) \
+            == (other.p1, other.p2, other.kings, other.player, other.history)
+
+    def __repr__(self) -> str:
+        return f"CompactGame(p1={self.p1:#x}, p2={self.p2:#x}, kings={self.kings:#x}, " \
+               f"player={self.player}, plies={self.plies})"
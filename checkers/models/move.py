@@ -8,7 +8,7 @@ class InvalidMoveError(ValueError):
     pass
 
 
-@dataclass
+@dataclass(frozen=True)
 class Move:
     """A move is essentially a vector pointing from a start tile to an end
     tile. It's slightly more complicated than "just a vector" because we're
@@ -18,6 +18,9 @@ class Move:
        combine to form valid moves (though they might combine into valid series
        of captures) (closedness is a defining requirement of "vectors").
 
+    .. NOTE:: Moves are frozen, because the same instances get handed out
+       again and again (e.g., by :func:`checkers.io.notation.parse_move` and
+       :func:`checkers.logic.legal_moves.generate_steps`).
     """
 
     start: TileIndex
@@ -51,8 +54,8 @@ class Move:
         quadrant_unnormed = (row_of(self.end) - row_of(self.start),
                              col_of(self.end) - col_of(self.start))
 
-        self.direction = (quadrant_unnormed[0] / (abs(quadrant_unnormed[0]) or 1),
-                          quadrant_unnormed[1] / (abs(quadrant_unnormed[1]) or 1))
+        object.__setattr__(self, "direction", (quadrant_unnormed[0] / (abs(quadrant_unnormed[0]) or 1),
+                                               quadrant_unnormed[1] / (abs(quadrant_unnormed[1]) or 1)))
 
     def __add__(self, other: int) -> 'Move':
         """This is a bit of python magic that lets us override the standard
@@ -4,6 +4,7 @@ in practice via the modules in :mod:`checkers.io`.
 """
 
 from dataclasses import dataclass
+from typing import Optional
 
 from pydantic.types import conlist
 
@@ -102,3 +103,106 @@ def draw_tile_indices(options: DrawOptions = default_draw_options):
     it acts as a test of :func:`tile_index_of` -- see below).
     """
     return draw_grid(list(str(i).zfill(2) for i in range(1, 51)), options=options)
+
+
+# -- Incremental rendering ----------------------------------------------------
+
+CURSOR_PREV_LINE = "\x1b[{}F"
+CURSOR_NEXT_LINE = "\x1b[{}E"
+CURSOR_DOWN = "\x1b[{}B"
+CURSOR_COLUMN = "\x1b[{}G"
+CLEAR_BELOW = "\x1b[J"
+
+_PLACEHOLDER = 0xE000  # Private use area, so it can't clash with the edges
+
+
+def get_piece_reprs(board: Board, options: DrawOptions = default_draw_options) -> dict[int, str]:
+    """The symbols of the occupied tiles (by index)."""
+    return {
+        i: (options.p1_king if is_king else options.p1_normal)
+        if player is PLAYER_ONE
+        else (options.p2_king if is_king else options.p2_normal)
+        for i, player, is_king in board
+    }
+
+
+class BoardRenderer:
+    """Renders the same frame as :func:`draw_centered_board_with_indices`, but
+    builds the static grid (edges, light tiles, centering) only once.
+
+    After the first frame, ``update`` only redraws the tiles that changed
+    since the last call, using ANSI cursor movements. Pass ``full_frame=True``
+    for terminals that don't understand those.
+    """
+
+    def __init__(self, char: str = " ", width: int = 80,
+                 options: DrawOptions = default_draw_options, *, full_frame: bool = False):
+        self.options = options
+        self.full_frame = full_frame
+
+        placeholders = [chr(_PLACEHOLDER + i) * 2 for i in range(50)]
+        frame = center_multiline(add_edges(draw_grid(placeholders, options=options)), char=char, width=width)
+        lines = frame.split("\n")
+
+        self.height = len(lines)
+        self.positions = {}  # Tile index -> (line, column)
+
+        for line_idx, line in enumerate(lines):
+            for col_idx, c in enumerate(line):
+                if ord(c) - _PLACEHOLDER in range(50) and (i := 1 + ord(c) - _PLACEHOLDER) not in self.positions:
+                    self.positions[i] = (line_idx, col_idx)
+
+        template = frame.replace("{", "{{").replace("}", "}}")
+
+        for i, placeholder in enumerate(placeholders):
+            template = template.replace(placeholder, f"{{{i}}}")
+
+        self._template = template
+        self._last: Optional[dict[int, str]] = None
+
+    def frame(self, board: Board) -> str:
+        """The complete board, identical to :func:`draw_centered_board_with_indices`."""
+        self._last = get_piece_reprs(board, self.options)
+        reprs = [self.options.dark_empty] * 50
+
+        for i, r in self._last.items():
+            reprs[i - 1] = r
+
+        return self._template.format(*reprs)
+
+    def diff(self, board: Board) -> dict[int, str]:
+        """The new symbols of all tiles that changed since the last render."""
+        reprs = get_piece_reprs(board, self.options)
+        changed = {i: r for i, r in reprs.items() if self._last.get(i) != r}
+        changed.update({i: self.options.dark_empty for i in self._last if i not in reprs})
+        self._last = reprs
+
+        return changed
+
+    def update(self, board: Board, lines_below: Optional[int] = 0) -> str:
+        """The ANSI escape sequences that turn the previously printed frame
+        into ``board``.
+
+        This assumes the cursor is ``lines_below`` lines below the last line of
+        the frame (e.g., after a prompt) and leaves it on the first line below
+        the frame, after clearing everything beneath it. If you can't tell how
+        many lines were printed since (e.g., after an error message), pass
+        ``None`` to get the complete frame instead.
+        """
+        if self.full_frame or self._last is None or lines_below is None:
+            return self.frame(board)
+
+        positions = sorted((*self.positions[i], r) for i, r in self.diff(board).items())
+        output = [CURSOR_PREV_LINE.format(self.height + lines_below)]
+        current_line = 0
+
+        for line, col, r in positions:
+            if line > current_line:
+                output.append(CURSOR_DOWN.format(line - current_line))
+                current_line = line
+
+            output.append(CURSOR_COLUMN.format(col + 1) + r)
+
+        output.append(CURSOR_NEXT_LINE.format(self.height - current_line) + CLEAR_BELOW)
+
+        return "".join(output)
@@ -0,0 +1,92 @@
+"""
+Measuring how much memory live games take, to plan capacity.
+
+``deep_sizeof`` follows references (like the garbage collector does) and
+counts every object once, so objects shared between games (small ints,
+``True``/``False``, interned strings) are only counted once for the whole
+fleet. Classes, modules and functions aren't counted at all.
+
+Run this module to compare ``Game`` with ``CompactGame``::
+
+    python -m checkers.utils.memory [games] [plies]
+"""
+import gc
+import sys
+import types
+import warnings
+from typing import Iterable
+
+from checkers.game import Game, default_board
+from checkers.io.archive import parse_games
+from checkers.io.notation import parse_move
+from checkers.io.sample_match import SAMPLE_GAME
+from checkers.logic.legal_moves import find_legal_move, get_legal_moves, apply_move
+from checkers.models import PLAYER_ONE
+from checkers.models.compact import CompactGame
+
+_SKIP = (type, types.ModuleType, types.FunctionType, types.BuiltinFunctionType, types.MethodType)
+
+
+def deep_sizeof(objects: Iterable[object]) -> int:
+    seen = set()
+    stack = list(objects)
+    size = 0
+
+    while stack:
+        obj = stack.pop()
+
+        if id(obj) in seen or isinstance(obj, _SKIP):
+            continue
+
+        seen.add(id(obj))
+        size += sys.getsizeof(obj)
+        stack.extend(gc.get_referents(obj))
+
+    return size
+
+
+def bytes_per_game(games: list) -> float:
+    return deep_sizeof(games) / len(games) if games else 0.
+
+
+def _fleets(n_games: int, plies: int) -> tuple[list[Game], list[CompactGame]]:
+    sample, = parse_games(SAMPLE_GAME.split("\n"))
+    cmds = sample.moves[:plies]
+    games, compact_games = [], []
+
+    # Resolve the (possibly shortened) captures once
+    board, player, moves = default_board(), PLAYER_ONE, []
+
+    for cmd in cmds:
+        moves.append(find_legal_move(parse_move(cmd), get_legal_moves(board, player)))
+        board, player = apply_move(board, moves[-1]), not player
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+
+        for _ in range(n_games):
+            game = Game()
+            compact = CompactGame.from_board(game.board)
+
+            for cmd, move in zip(cmds, moves):
+                game.play(cmd)
+                compact.play(move)
+
+            games.append(game)
+            compact_games.append(compact)
+
+    return games, compact_games
+
+
+def main(n_games: int = 20, plies: int = 40):
+    games, compact_games = _fleets(n_games, plies)
+    boards = [game.board for game in games]
+
+    print(f"{n_games} games after {plies} plies of the sample match:")
+    print(f"  Game (with adjudicator):  {bytes_per_game(games):8.0f} bytes/game")
+    print(f"  Board only:               {bytes_per_game(boards):8.0f} bytes/game")
+    print(f"  CompactGame (w/ history): {bytes_per_game(compact_games):8.0f} bytes/game")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:3]))
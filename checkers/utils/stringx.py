@@ -25,3 +25,20 @@ def center_multiline(text: str, char=" ", width=80) -> str:
     The built-in ``str.center(width, fillchar)`` doesn't work with multiline strings
     """
     return "\n".join(map(lambda s: s.center(width, char), text.split("\n")))
+
+
+def edit_distance(a: str, b: str) -> int:
+    """The Levenshtein distance between ``a`` and ``b`` (the fewest insertions,
+    deletions and substitutions of single characters that turn one into the
+    other)."""
+    previous = list(range(len(b) + 1))
+
+    for i, ca in enumerate(a, 1):
+        current = [i]
+
+        for j, cb in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (ca != cb)))
+
+        previous = current
+
+    return previous[-1]
@@ -0,0 +1,208 @@
+"""
+SVG diagrams of boards, for publishing (e.g., every critical position of an
+annotated archive).
+
+Everything that's the same from diagram to diagram is built once per
+:class:`SvgRenderer`: the board with its square numbers and the piece symbols
+go into ``<defs>``, and every placement of a piece on a square is a
+precomputed ``<use>`` line. A diagram then costs a lookup per piece (plus the
+arrows of the moves it shows), so rendering tens of thousands of them is
+mostly string joining.
+
+Moves are drawn as arrows from the start to the end square. For capture
+series, the arrow follows every landing square and the captured pieces are
+highlighted.
+
+:func:`write_diagrams` renders a stream of :class:`Diagram`'s to files,
+optionally in several processes.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Iterable, Iterator, NamedTuple, Optional, Sequence
+
+from checkers.io.training import imap_bounded
+from checkers.logic.legal_moves import LegalMove, get_captured
+from checkers.models import Board, Move, PLAYER_ONE, PLAYER_TWO
+from checkers.models.position import row_col_of
+
+
+@dataclass(frozen=True)
+class SvgOptions:
+    """Options to control how diagrams are rendered (sizes are in pixels).
+
+    .. NOTE:: Frozen (like :class:`checkers.utils.draw.DrawOptions`) so it can
+       be a default and be sent to worker processes as is.
+    """
+    square_size: int = 40
+    light_square: str = "#f0d9b5"
+    dark_square: str = "#b58863"
+    p1_fill: str = "#ffffff"
+    p2_fill: str = "#202020"
+    outline: str = "#000000"
+    coordinates: bool = True
+    coordinate_color: str = "#e8d0aa"
+    arrow_color: str = "#2060c0"
+    capture_color: str = "#d02020"
+
+
+default_svg_options = SvgOptions()
+
+
+class Diagram(NamedTuple):
+    """A board with the moves to draw on it (made from ``board``)."""
+    board: Board
+    moves: Sequence[LegalMove] = ()
+    name: Optional[str] = None  # The file name, for :func:`write_diagrams`
+
+
+# The (row, col) of every square, by index
+_ROW_COLS = (None, *(row_col_of(i) for i in range(1, 51)))
+
+_PIECE_IDS = {(PLAYER_ONE, False): "m1", (PLAYER_ONE, True): "k1",
+              (PLAYER_TWO, False): "m2", (PLAYER_TWO, True): "k2"}
+
+
+class SvgRenderer:
+    def __init__(self, options: SvgOptions = default_svg_options):
+        self.options = options
+        size = options.square_size
+
+        # The center of every square, by index
+        self.centers = (None, *((col * size + size // 2, row * size + size // 2) for row, col in _ROW_COLS[1:]))
+
+        self._header = self._build_header()
+        self._footer = "</svg>\n"
+
+        # ``[player][is_king][idx]`` -> the placement of that piece
+        self._placements = {player: tuple(self._uses(_PIECE_IDS[player, is_king]) for is_king in (False, True))
+                            for player in (PLAYER_ONE, PLAYER_TWO)}
+        self._highlights = self._uses("hit")
+
+    def _uses(self, id_: str) -> tuple[Optional[str], ...]:
+        """``<use>``'s of ``#id_`` on every square (by index)."""
+        return (None, *(f'<use href="#{id_}" x="{x}" y="{y}"/>' for x, y in self.centers[1:]))
+
+    def _build_header(self) -> str:
+        o, size = self.options, self.options.square_size
+        width = 10 * size
+        radius = size * 2 // 5
+
+        board = [f'<rect width="{width}" height="{width}" fill="{o.light_square}"/>']
+
+        for i, (row, col) in enumerate(_ROW_COLS[1:], 1):
+            board.append(f'<rect x="{col * size}" y="{row * size}" width="{size}" height="{size}" '
+                         f'fill="{o.dark_square}"/>')
+
+            if o.coordinates:
+                board.append(f'<text x="{col * size + 2}" y="{row * size + size // 4}" font-size="{size // 4}" '
+                             f'font-family="sans-serif" fill="{o.coordinate_color}">{i}</text>')
+
+        def piece(id_: str, fill: str, is_king: bool) -> str:
+            shapes = [f'<circle r="{radius}" fill="{fill}" stroke="{o.outline}" stroke-width="1.5"/>']
+
+            if is_king:
+                shapes.append(f'<circle r="{radius // 2}" fill="none" stroke="{o.capture_color}" stroke-width="2"/>')
+
+            return f'<g id="{id_}">{"".join(shapes)}</g>'
+
+        defs = [
+            f'<g id="board">{"".join(board)}</g>',
+            piece("m1", o.p1_fill, False), piece("k1", o.p1_fill, True),
+            piece("m2", o.p2_fill, False), piece("k2", o.p2_fill, True),
+            f'<circle id="hit" r="{radius + 2}" fill="none" stroke="{o.capture_color}" stroke-width="3"/>',
+            *(f'<marker id="{id_}" viewBox="0 0 10 10" refX="7" refY="5" markerWidth="4" markerHeight="4" '
+              f'orient="auto-start-reverse"><path d="M0,0L10,5L0,10z" fill="{color}"/></marker>'
+              for id_, color in (("arrow", o.arrow_color), ("capture-arrow", o.capture_color))),
+        ]
+
+        return (f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{width}" '
+                f'viewBox="0 0 {width} {width}">\n<defs>{"".join(defs)}</defs>\n<use href="#board"/>\n')
+
+    def _arrow(self, board: Board, move: LegalMove) -> list[str]:
+        if isinstance(move, Move):
+            (x1, y1), (x2, y2) = self.centers[move.start], self.centers[move.end]
+            return [f'<line x1="{x1}" y1="{y1}" x2="{x2}" y2="{y2}" stroke="{self.options.arrow_color}" '
+                    f'stroke-width="4" marker-end="url(#arrow)"/>']
+
+        squares = (move[0].start, *(m.end for m in move))
+        points = " ".join(f"{x},{y}" for x, y in map(self.centers.__getitem__, squares))
+        return [*(self._highlights[i] for i in get_captured(board, move)),
+                f'<polyline points="{points}" fill="none" stroke="{self.options.capture_color}" '
+                f'stroke-width="4" marker-end="url(#capture-arrow)"/>']
+
+    def render(self, board: Board, moves: Sequence[LegalMove] = ()) -> str:
+        """An SVG document of ``board``, with arrows for ``moves``."""
+        lines = [self._header]
+        lines.extend(self._placements[player][is_king][idx] + "\n" for idx, player, is_king in board)
+
+        for move in moves:
+            lines.extend(line + "\n" for line in self._arrow(board, move))
+
+        lines.append(self._footer)
+        return "".join(lines)
+
+    def render_many(self, diagrams: Iterable[Diagram]) -> Iterator[str]:
+        for diagram in diagrams:
+            yield self.render(diagram.board, diagram.moves)
+
+
+def render_svg(board: Board, moves: Sequence[LegalMove] = (), options: SvgOptions = default_svg_options) -> str:
+    """A one-off diagram (use an :class:`SvgRenderer` for many)."""
+    return SvgRenderer(options).render(board, moves)
+
+
+# -- Batches ------------------------------------------------------------------
+
+_worker_renderer: Optional[SvgRenderer] = None
+
+
+def _init_worker(options: SvgOptions):
+    global _worker_renderer
+    _worker_renderer = SvgRenderer(options)
+
+
+def _write_chunk(chunk: list[tuple[str, Diagram]]) -> list[str]:
+    paths = []
+
+    for path, diagram in chunk:
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(_worker_renderer.render(diagram.board, diagram.moves))
+
+        paths.append(path)
+
+    return paths
+
+
+def _named(diagrams: Iterable[Diagram], out_dir: str, chunk_size: int) -> Iterator[list[tuple[str, Diagram]]]:
+    chunk = []
+
+    for i, diagram in enumerate(diagrams):
+        chunk.append((os.path.join(out_dir, diagram.name or f"{i:06d}.svg"), diagram))
+
+        if len(chunk) == chunk_size:
+            yield chunk
+            chunk = []
+
+    if chunk:
+        yield chunk
+
+
+def write_diagrams(diagrams: Iterable[Diagram], out_dir: str, *, options: SvgOptions = default_svg_options,
+                   workers: Optional[int] = None, chunk_size: int = 256) -> list[str]:
+    """Writes every diagram to ``out_dir`` (as ``diagram.name``, or numbered in
+    the order of ``diagrams``) and returns the paths.
+
+    ``diagrams`` is consumed lazily. With ``workers`` (> 1), chunks of
+    ``chunk_size`` diagrams are rendered and written in that many processes,
+    each with its own renderer.
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    chunks = _named(diagrams, out_dir, chunk_size)
+
+    if not workers or workers <= 1:
+        _init_worker(options)
+        return [path for chunk in chunks for path in _write_chunk(chunk)]
+
+    with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(options,)) as executor:
+        return [path for paths in imap_bounded(executor, _write_chunk, chunks, 2 * workers) for path in paths]
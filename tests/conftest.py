@@ -0,0 +1,30 @@
+import pytest
+
+from checkers.models import Board
+
+
+def make_board_1() -> Board:
+    """
+    .. code::
+
+        .  .01.  .02.  .03.  .04.  .05.
+        |  |[]|  |[]|  |[]|  |[]|  |[]|05
+      06|[]|  |[]|  |[]|  |[]|  |[]|  |
+        |  |[]|  |<>|  |<>|  |[]|  |[]|15
+      16|[]|  |[]|  |[]|  |[]|  |[]|  |
+        |  |[]|  |<>|  |[]|  |[]|  |[]|25
+      26|[]|  |⊂⊃|  |⊂⊃|  |[]|  |[]|  |
+        |  |[]|  |[]|  |[]|  |[]|  |[]|35
+     36|[]|  |[]|  |[]|  |[]|  |[]|  |
+       |  |[]|  |[]|  |[]|  |⊂⊃|  |[]|45
+     46|[]|  |[]|  |[]|  |[]|  |[]|  |
+       '46'  '47'  '48'  '49'  '50'  '
+
+    """
+
+    return Board([28, 44, 27], [22, 12, 13])
+
+
+@pytest.fixture()
+def board_1() -> Board:
+    return make_board_1()
@@ -0,0 +1,108 @@
+import random
+
+import pytest
+
+from checkers.game import Game, format_cmd
+from checkers.logic.adjudication import classify, Material, Status, DrawReason, GameStatus, DrawOfferError, \
+    Adjudicator, get_position_key
+from checkers.logic.legal_moves import get_legal_moves
+from checkers.models import Board, PLAYER_ONE, PLAYER_TWO
+
+
+def test_classify():
+    assert classify((0, 2, 0, 2)) is Material.EQUAL_KINGS
+    assert classify((0, 2, 0, 1)) is Material.NORMAL
+    assert classify((0, 3, 0, 1)) is Material.SIXTEEN_MOVES
+    assert classify((1, 2, 0, 1)) is Material.SIXTEEN_MOVES
+    assert classify((0, 1, 2, 1)) is Material.SIXTEEN_MOVES
+    assert classify((20, 0, 20, 0)) is Material.NORMAL
+
+
+def test_equal_kings():
+    assert Adjudicator(Board([1], [50], kings=[1, 50])).status \
+           == GameStatus(Status.DRAW, reason=DrawReason.EQUAL_KINGS)
+
+
+def test_win_by_capturing_everything():
+    game = Game(Board([32], [28]))
+    game.play("32x23")
+
+    assert game.status == GameStatus(Status.WIN, winner=PLAYER_ONE)
+
+
+def test_win_by_blocking():
+    # Player two's last man on 45 can only move to 50, which is taken
+    game = Game(Board([40, 50], [45]))
+    game.play("40-35")
+
+    assert game.status == GameStatus(Status.WIN, winner=PLAYER_ONE)
+
+
+def test_repetition():
+    game = Game(Board([46, 36], [5, 15], kings=[46, 5]))
+
+    for _ in range(2):
+        for cmd in ("46-41", "5-10", "41-46", "10-5"):
+            assert game.status.status is Status.ONGOING
+            game.play(cmd)
+
+    assert game.status == GameStatus(Status.DRAW, reason=DrawReason.REPETITION)
+
+
+def test_men_moves_reset_king_counter():
+    game = Game(Board([46, 36], [5, 15], kings=[46, 5]))
+
+    game.play("46-41")
+    game.play("5-10")
+    assert game.adjudicator.king_plies == 2
+
+    game.play("36-31")
+    assert game.adjudicator.king_plies == 0
+
+
+def test_sixteen_moves():
+    game = Game(Board([46, 47, 48], [5], kings=[46, 47, 48, 5]))
+    game.adjudicator.sixteen_plies = 31
+    game.play("46-41")
+
+    assert game.status == GameStatus(Status.DRAW, reason=DrawReason.SIXTEEN_MOVES)
+
+
+def test_agree_draw():
+    adjudicator = Adjudicator(Board([32], [18]))
+
+    with pytest.raises(DrawOfferError):
+        adjudicator.agree_draw()
+
+    adjudicator.plies = 80
+    assert adjudicator.agree_draw().reason is DrawReason.AGREEMENT
+
+
+@pytest.mark.parametrize("seed", range(6))
+def test_game_matches_record(seed):
+    # Random games with captures, coronations and king moves
+    rng = random.Random(seed)
+    board = Board([46, 41, 17, 33], [5, 10, 34], kings=[46, 5])
+    game, adjudicator = Game(board.copy()), Adjudicator(board.copy())
+    player = PLAYER_ONE
+
+    while game.status.status is Status.ONGOING:
+        before = game.board.copy()
+        move = rng.choice(get_legal_moves(before, player))
+        game.play(format_cmd(move))
+        adjudicator.record(before, move, game.board)
+        player = not player
+
+        assert game.adjudicator.signature == adjudicator.signature
+        assert game.adjudicator.repetitions == adjudicator.repetitions
+        assert game.adjudicator.king_plies == adjudicator.king_plies
+        assert game.adjudicator.sixteen_plies == adjudicator.sixteen_plies
+        assert game.status == adjudicator.status
+
+
+def test_repetitions_are_keyed_by_position():
+    adjudicator = Adjudicator(Board([46], [5], kings=[46, 5]))
+
+    assert get_position_key(Board([46], [5], kings=[46, 5]), PLAYER_ONE) in adjudicator.repetitions
+    assert get_position_key(Board([46], [5], kings=[46, 5]), PLAYER_TWO) not in adjudicator.repetitions
+    assert get_position_key(Board([46], [5], kings=[46]), PLAYER_ONE) not in adjudicator.repetitions
@@ -0,0 +1,81 @@
+from checkers.engine.analysis import analyse
+from checkers.engine.evaluation import evaluate, KING_VALUE
+from checkers.engine.search import search, Searcher, WIN_SCORE, INFINITY
+from checkers.models import Board, Move, PLAYER_ONE, PLAYER_TWO
+
+
+def test_search_finds_winning_capture():
+    # Player one can capture the last piece of player two
+    result = search(Board([32, 45], [27]), PLAYER_ONE, 2)
+
+    assert result.move == [Move(32, 21)]
+    assert result.score >= WIN_SCORE - 2
+
+
+def test_search_without_moves():
+    result = search(Board([], [27]), PLAYER_ONE, 2)
+
+    assert result.move is None
+    assert result.score == -WIN_SCORE
+
+
+def test_analyse_yields_per_depth():
+    results = list(analyse(Board([32, 33], [18, 19]), PLAYER_ONE, k=2, depth=3))
+
+    assert len(results) == 3
+    assert all(len(lines) == 2 for lines in results)
+    assert all(line.depth == d for d, lines in enumerate(results, 1) for line in lines)
+
+
+def test_analyse_ranks_lines():
+    *_, lines = analyse(Board([32, 33], [18, 19]), PLAYER_ONE, k=4, depth=3)
+
+    assert [line.score for line in lines] == sorted((line.score for line in lines), reverse=True)
+    assert all(line.pv[0] == line.move for line in lines)
+
+
+def test_analyse_matches_search():
+    board = Board([28, 44, 27], [22, 12, 13])
+    *_, lines = analyse(board, PLAYER_TWO, k=1, depth=3)
+
+    assert lines[0].score == search(board, PLAYER_TWO, 3).score
+
+
+def test_analyse_shares_transposition_table():
+    searcher = Searcher()
+    list(analyse(Board([32, 33], [18, 19]), PLAYER_ONE, k=3, depth=2, searcher=searcher))
+
+    assert len(searcher.tt) > 0
+
+
+def test_quiescence_resolves_exchanges():
+    # 17-12 looks best at depth 1, but it hangs the piece on 12 to 7x18
+    board = Board([36, 45, 17], [9, 22, 7, 28])
+    plain = Searcher(quiescence=False).search(board, PLAYER_ONE, 1)
+    quiescent = Searcher().search(board, PLAYER_ONE, 1)
+    deep = Searcher(quiescence=False).search(board, PLAYER_ONE, 3)
+
+    assert plain.move == Move(17, 12)
+    assert quiescent.move == deep.move == Move(36, 31)
+    assert abs(quiescent.score - deep.score) < abs(plain.score - deep.score)
+
+
+def test_quiesce_quiet_position():
+    board = Board([36, 45, 17], [9, 22, 7, 28])
+    searcher = Searcher()
+
+    assert searcher.quiesce(board, PLAYER_ONE) == (evaluate(board, PLAYER_ONE), [])
+    assert searcher.nodes == 1
+
+
+def test_quiesce_delta_pruning():
+    board = Board([36, 45, 12], [9, 22, 7, 28])  # Player two has to capture 12
+    score, pv = Searcher().quiesce(board, PLAYER_TWO)
+
+    assert pv == [[Move(7, 18)]]
+
+    searcher = Searcher()
+    pruned, pv = searcher.quiesce(board, PLAYER_TWO, alpha=10 * KING_VALUE, beta=INFINITY)
+
+    assert pruned <= 10 * KING_VALUE and pv == []
+    assert searcher.nodes == 1
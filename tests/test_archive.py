@@ -0,0 +1,39 @@
+from checkers.io.archive import parse_games, format_game, ArchivedGame, write_games, read_games
+from checkers.io.sample_match import SAMPLE_GAME
+from checkers.models import PLAYER_ONE
+
+PDN = """[Event "Test"]
+[Result "2-0"]
+
+1. 32-28 19-23 2. 28x19 14x23 2-0
+
+[Event "Test 2"]
+1. 32-28 19-23 *
+1. 31-27 1-1
+"""
+
+
+def test_parse_pdn():
+    games = list(parse_games(PDN.split("\n")))
+
+    assert [g.moves for g in games] == [["32-28", "19-23", "28x19", "14x23"], ["32-28", "19-23"], ["31-27"]]
+    assert games[0].headers == {"Event": "Test", "Result": "2-0"}
+    assert games[0].winner is PLAYER_ONE
+    assert not games[1].is_decided
+    assert games[2].is_decided and games[2].winner is None
+
+
+def test_parse_sample_match():
+    game, = parse_games(SAMPLE_GAME.split("\n"))
+
+    assert game.moves[:4] == ["32-28", "19-23", "28x19", "14x23"]
+    assert game.moves[-1] == "35-30"
+
+
+def test_roundtrip(tmp_path):
+    games = [ArchivedGame(["32-28", "19-23", "28x19"], {"Event": "A", "Result": "0-2"}),
+             ArchivedGame(["31-27"], {"Result": "1-1"})]
+    write_games(tmp_path / "games.pdn", games)
+
+    assert list(read_games(tmp_path / "games.pdn")) == games
+    assert list(parse_games(format_game(games[0]).split("\n"))) == [games[0]]
@@ -0,0 +1,62 @@
+import random
+
+import pytest
+
+from checkers.logic.attacks import get_analysis
+from checkers.models import Board, Move, PLAYER_ONE, PLAYER_TWO
+
+
+def _random_boards(n: int, seed: int = 0):
+    rng = random.Random(seed)
+
+    for _ in range(n):
+        squares = rng.sample(range(1, 51), rng.randint(4, 24))
+        half = len(squares) // 2
+        yield Board(squares[:half], squares[half:], kings=rng.sample(squares, rng.randint(0, len(squares) // 2)))
+
+
+def test_jumps():
+    analysis = get_analysis(Board([28, 44, 27], [22, 12, 13]))
+
+    assert analysis.jumps == {22: [(31, 27), (33, 28)], 27: [(18, 22)], 28: [(17, 22)]}
+
+
+def test_attackers_and_hanging():
+    analysis = get_analysis(Board([28, 44, 27], [22, 12, 13]))
+
+    assert analysis.attackers == {22: [27, 28], 27: [22], 28: [22]}
+    assert analysis.hanging(PLAYER_ONE) == {27, 28}
+    assert analysis.hanging(PLAYER_TWO) == {22}
+    assert analysis.can_capture(PLAYER_ONE) and analysis.can_capture(PLAYER_TWO)
+
+
+def test_safe_jumps():
+    # After 28x17, 17 can be captured by 11 (landing on 22)
+    analysis = get_analysis(Board([28, 33], [22, 11]))
+
+    assert analysis.jumps[28] == [(17, 22)]
+    assert 28 not in analysis.safe_jumps
+
+
+@pytest.mark.parametrize("board", list(_random_boards(40)))
+def test_safe_jumps_match_replaying(board):
+    analysis = get_analysis(board)
+
+    for idx, jumps in analysis.jumps.items():
+        # Apply the jump and look for attackers of the landing square
+        expected = [(end, captured) for end, captured in jumps
+                    if end not in get_analysis(board.copy().apply_captures([Move(idx, end)])).attackers]
+
+        assert analysis.safe_jumps.get(idx, []) == expected
+
+
+def test_analysis_is_cached_until_board_changes():
+    board = Board([28], [22])
+    analysis = get_analysis(board)
+
+    assert get_analysis(board) is analysis
+
+    board.apply_step(Move(28, 23))
+
+    assert get_analysis(board) is not analysis
+    assert get_analysis(board).jumps == {}
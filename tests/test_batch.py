@@ -0,0 +1,43 @@
+import numpy as np
+
+from checkers.game import default_board
+from checkers.logic.batch import batch_legal_moves, batch_steps, batch_captures, boards_to_array, RAYS
+from checkers.logic.legal_moves import get_legal_moves, encode_move
+from checkers.models import Board, PLAYER_ONE, PLAYER_TWO
+
+BOARDS = [
+    default_board(),
+    Board([28, 44, 27], [22, 12, 13]),
+    Board([28, 44, 27], [22, 12, 14], kings=[28]),
+    Board([46], [41], kings=[46]),
+    Board([32, 45], [27]),
+    Board([46, 36], [5, 15], kings=[46, 5]),
+    Board([], [27]),
+]
+
+
+def test_rays():
+    assert RAYS[45, 1].tolist() == [40, 36, 31, 27, 22, 18, 13, 9, 4]  # 46 -> 5 (0-based)
+    assert RAYS[0, 0].tolist() == [50] * 9  # Nothing up-left of 1
+
+
+def test_steps_and_captures():
+    array = boards_to_array([Board([28, 44, 27], [22, 12, 13])])
+
+    assert sorted(batch_steps(array, PLAYER_TWO).tolist()) == [[0, 12, 17], [0, 12, 18], [0, 13, 18], [0, 13, 19]]
+    assert sorted(batch_captures(array, PLAYER_ONE).tolist()) == [[0, 27, 22, 18], [0, 28, 22, 17]]
+
+
+def test_matches_scalar():
+    for player in (PLAYER_ONE, PLAYER_TWO):
+        for board, moves in zip(BOARDS, batch_legal_moves(BOARDS, player)):
+            assert sorted(map(encode_move, moves)) == sorted(map(encode_move, get_legal_moves(board, player)))
+            assert moves == get_legal_moves(board, player)  # In the same order, too
+
+
+def test_players_per_board():
+    players = np.array([True, False] * 2)
+    boards = BOARDS[:4]
+
+    for board, player, moves in zip(boards, players, batch_legal_moves(boards, players)):
+        assert sorted(map(encode_move, moves)) == sorted(map(encode_move, get_legal_moves(board, bool(player))))
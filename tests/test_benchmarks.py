@@ -0,0 +1,54 @@
+import json
+
+from click.testing import CliRunner
+
+from benchmarks import harness
+from benchmarks.__main__ import cli
+from benchmarks.cases import CASES
+
+
+def test_cases_run():
+    for name, setup in CASES.items():
+        setup()()
+
+
+def _results(**best: float) -> dict:
+    return {"metadata": {}, "results": {name: {"best": t} for name, t in best.items()}}
+
+
+def test_compare():
+    comparisons = {c.name: c for c in harness.compare(_results(a=1., b=1., c=1.), _results(a=1.05, b=1.5, c=0.5, d=1.))}
+
+    assert set(comparisons) == {"a", "b", "c"}
+    assert not comparisons["a"].is_regression() and not comparisons["a"].is_improvement()
+    assert comparisons["b"].is_regression()
+    assert comparisons["c"].is_improvement()
+
+
+def test_cli(tmp_path):
+    runner = CliRunner()
+    before, after = tmp_path / "before.json", tmp_path / "after.json"
+
+    result = runner.invoke(cli, ["run", "-k", "board.get", "--repeat", "1", "--min-time", "0.01", "-o", str(before)])
+    assert result.exit_code == 0, result.output
+
+    saved = json.loads(before.read_text())
+    assert list(saved["results"]) == ["board.getitem"]
+    assert saved["metadata"]["python"]
+
+    saved["results"]["board.getitem"]["best"] *= 2
+    after.write_text(json.dumps(saved))
+
+    assert runner.invoke(cli, ["compare", str(before), str(before)]).exit_code == 0
+
+    result = runner.invoke(cli, ["compare", str(before), str(after)])
+    assert result.exit_code == 1
+    assert "REGRESSION" in result.output
+
+
+def test_cli_without_matches():
+    assert harness.run([])["results"] == {}
+
+    result = CliRunner().invoke(cli, ["run", "-k", "no such case"])
+    assert result.exit_code == 1
+    assert "No cases match" in result.output
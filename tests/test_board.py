@@ -46,4 +46,14 @@ def test_crowning():
 
     assert Piece(floor_tile_index_of(9, 5, direction=(0, 1)), PLAYER_TWO, False).has_reached_end
     assert not Piece(floor_tile_index_of(9, 5, direction=(0, 1)), PLAYER_ONE, False).has_reached_end
-    assert all([not Piece(floor_tile_index_of(i, 5, direction=(-1, 0)), PLAYER_TWO, False).has_reached_end for i in range(0, 9)])
\ No newline at end of file
+    assert all([not Piece(floor_tile_index_of(i, 5, direction=(-1, 0)), PLAYER_TWO, False).has_reached_end for i in range(0, 9)])
+
+
+def test_board_masks():
+    b = Board([15, 28], [18, 1], kings=[1, 28])
+    p1, p2, kings = b.to_masks()
+
+    assert (p1, p2, kings) == ((1 << 14) | (1 << 27), (1 << 17) | 1, 1 | (1 << 27))
+    assert Board.from_masks(p1, p2, kings) == b
+    assert list(Board.from_masks(p1, p2, kings)) == list(b)
+    assert Board.from_masks(0, 0) == Board([], [])
@@ -0,0 +1,87 @@
+import threading
+
+from checkers.game import Game, default_board
+from checkers.io.archive import ArchivedGame
+from checkers.io.training import replay
+from checkers.logic.cache import PositionCache
+from checkers.logic.legal_moves import get_legal_moves
+from checkers.logic.max_capture import compute_max_capture
+from checkers.models import PLAYER_ONE, PLAYER_TWO
+
+
+def test_hits_and_misses(board_1):
+    cache = PositionCache()
+
+    for _ in range(3):
+        assert cache.max_capture(board_1, PLAYER_ONE) == compute_max_capture(board_1, PLAYER_ONE)
+        assert cache.legal_moves(board_1, PLAYER_TWO) == get_legal_moves(board_1, PLAYER_TWO)
+
+    stats = cache.stats
+    assert (stats.hits, stats.misses, stats.size) == (4, 2, 2)
+    assert stats.hit_rate == 4 / 6
+
+
+def test_returns_copies():
+    cache = PositionCache()
+    cache.legal_moves(default_board(), PLAYER_ONE).clear()
+
+    assert len(cache.legal_moves(default_board(), PLAYER_ONE)) == 9
+
+
+def test_keyed_by_position_not_board():
+    cache = PositionCache()
+    board = default_board()
+    cache.legal_moves(board, PLAYER_ONE)
+    board = board.apply_step(get_legal_moves(board, PLAYER_ONE)[0])
+
+    assert cache.legal_moves(board, PLAYER_ONE) == get_legal_moves(board, PLAYER_ONE)
+    assert cache.stats.misses == 2
+
+
+def test_lru_eviction():
+    cache = PositionCache(maxsize=2)
+    board = default_board()
+
+    cache.max_capture(board, PLAYER_ONE)
+    cache.max_capture(board, PLAYER_TWO)
+    cache.max_capture(board, PLAYER_ONE)
+    cache.legal_moves(board, PLAYER_ONE)  # Evicts (board, PLAYER_TWO)
+    cache.max_capture(board, PLAYER_ONE)
+    cache.max_capture(board, PLAYER_TWO)
+
+    stats = cache.stats
+    assert (stats.hits, stats.misses, stats.evictions, stats.size) == (2, 4, 2, 2)
+
+
+def test_shared_between_threads():
+    cache = PositionCache()
+    board = default_board()
+    threads = [threading.Thread(target=lambda: [cache.legal_moves(board, p) for p in (PLAYER_ONE, PLAYER_TWO) * 5])
+               for _ in range(4)]
+
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    stats = cache.stats
+    assert stats.hits + stats.misses == 40
+    assert stats.size == 2
+
+
+def test_replay_overlapping_games():
+    cache = PositionCache()
+    games = [ArchivedGame(["32-28", "19-23", "28x19", "14x23"]), ArchivedGame(["32-28", "19-23", "34-29"])]
+
+    for game in games:
+        list(replay(game, cache))
+
+    assert (cache.stats.hits, cache.stats.misses) == (3, 4)
+
+
+def test_game_with_cache(board_1):
+    cache = PositionCache()
+    game = Game(board_1, cache=cache)
+    game.play("28x17x8x19")
+
+    assert cache.stats.misses == 1
@@ -0,0 +1,61 @@
+import random
+
+from checkers.game import default_board
+from checkers.logic.legal_moves import get_legal_moves, apply_move
+from checkers.models import Board, CompactGame, Move, Piece, PLAYER_ONE, PLAYER_TWO
+from checkers.utils.memory import deep_sizeof, bytes_per_game
+
+
+def test_round_trip():
+    board = Board([28, 44, 27], [22, 12, 13], kings=[44, 12])
+    game = CompactGame.from_board(board, PLAYER_TWO)
+
+    assert game.to_board() == board
+    assert list(game) == list(board)
+    assert game[44] == Piece(44, PLAYER_ONE, True)
+    assert 22 in game and 23 not in game
+    assert len(game) == 6
+
+
+def test_play_matches_apply_move():
+    rng = random.Random(0)
+    board, player = default_board(), PLAYER_ONE
+    game = CompactGame.from_board(board)
+    played = []
+
+    for _ in range(120):
+        if not (moves := get_legal_moves(board, player)):
+            break
+
+        move = rng.choice(moves)
+        board, player = apply_move(board, move), not player
+        game.play(move)
+        played.append(move)
+
+        assert game.to_board() == board
+        assert game.player is player
+
+    assert list(game.moves()) == played
+    assert game.plies == len(played)
+
+
+def test_king_capture_and_coronation():
+    game = CompactGame.from_board(Board([7, 44], [12, 33], kings=[44]))
+    game.play([Move(44, 22)])  # Captures 33 from a distance
+
+    assert game.to_board() == Board([7, 22], [12], kings=[22])
+
+    game.play(Move(12, 18))
+    game.play(Move(7, 1))
+
+    assert game[1].is_king
+
+
+def test_compact_is_smaller():
+    boards = [default_board() for _ in range(10)]
+    compact = [CompactGame.from_board(board) for board in boards]
+
+    assert bytes_per_game(compact) * 5 < bytes_per_game(boards)
+
+    # Shared objects are only counted once
+    assert deep_sizeof([boards[0], boards[0].copy()]) < 2 * deep_sizeof([boards[0]])
@@ -0,0 +1,59 @@
+from checkers.game import default_board
+from checkers.models import Board, Move
+from checkers.utils.draw import BoardRenderer, draw_centered_board_with_indices
+
+
+def test_frame_matches_draw():
+    renderer = BoardRenderer()
+
+    for board in (default_board(), Board([28, 29, 15], [18, 1, 9], kings=[29, 1]), Board([], [])):
+        assert renderer.frame(board) == draw_centered_board_with_indices(board)
+
+
+def test_positions():
+    renderer = BoardRenderer()
+    lines = draw_centered_board_with_indices(default_board()).split("\n")
+
+    assert len(renderer.positions) == 50
+    assert renderer.height == len(lines)
+
+    for i, (line, col) in renderer.positions.items():
+        assert lines[line][col:col + 2] == ("<>" if i <= 20 else "⊂⊃" if i > 30 else "[]")
+
+
+def test_diff_only_changed_tiles():
+    renderer = BoardRenderer()
+    board = default_board()
+    renderer.frame(board)
+
+    assert renderer.diff(board.apply_step(Move(32, 28))) == {32: "[]", 28: "⊂⊃"}
+    assert renderer.diff(board) == {}
+
+
+def test_full_frame_update():
+    renderer = BoardRenderer(full_frame=True)
+    board = default_board()
+    renderer.frame(board)
+
+    assert renderer.update(board.apply_step(Move(32, 28))) == draw_centered_board_with_indices(board)
+
+
+def test_incremental_update():
+    renderer = BoardRenderer()
+    board = default_board()
+    renderer.frame(board)
+    update = renderer.update(board.apply_step(Move(32, 28)), lines_below=1)
+
+    assert update.startswith(f"\x1b[{renderer.height + 1}F")
+    assert update.count("⊂⊃") == 1 and update.count("[]") == 1
+    assert update.endswith("\x1b[J")
+
+
+def test_update_without_lines_below():
+    renderer = BoardRenderer()
+    board = default_board()
+    renderer.frame(board)
+    board = board.apply_step(Move(32, 28))
+
+    assert renderer.update(board, lines_below=None) == draw_centered_board_with_indices(board)
+    assert renderer.diff(board) == {}
@@ -0,0 +1,48 @@
+import pytest
+
+from checkers.game import default_board
+from checkers.io.fen import parse_fen, format_fen, parse_masks, load_masks, read_fens, FenError
+from checkers.models import Board, PLAYER_ONE, PLAYER_TWO
+
+
+def test_parse_fen():
+    board, player = parse_fen("W:W31,32,K45:B1,2")
+
+    assert board == Board([31, 32, 45], [1, 2], kings=[45])
+    assert player is PLAYER_ONE
+
+
+def test_parse_fen_variants():
+    expected = (Board([31, 32, 33, 34, 35], [1, 2], kings=[1, 2]), PLAYER_TWO)
+
+    assert parse_fen("B:W31-35:BK1,K2") == expected
+    assert parse_fen('"B:BK1-2:W31,32,33,34,35."') == expected
+    assert parse_fen("B:W31-35:BK1-2") == expected
+    assert parse_fen("W:W:B") == (Board([], []), PLAYER_ONE)
+
+
+@pytest.mark.parametrize("fen", ["X:W31:B1", "W:W31:B1:W2", "W:W0:B1", "W:W51:B1", "W:W31:B31", "W:W3a:B1",
+                                 "W:W35-31:B1", "W:W45-55:B1", "W:Q31:B1"])
+def test_parse_invalid_fen(fen):
+    with pytest.raises(FenError):
+        parse_fen(fen)
+
+
+def test_round_trip():
+    board = Board([28, 44, 27], [22, 12, 13], kings=[44, 12])
+
+    assert format_fen(board, PLAYER_TWO) == "B:W27,28,K44:BK12,13,22"
+    assert parse_fen(format_fen(board, PLAYER_TWO)) == (board, PLAYER_TWO)
+    assert parse_fen(format_fen(default_board(), PLAYER_ONE)) == (default_board(), PLAYER_ONE)
+
+
+def test_bulk_loading(tmp_path):
+    path = tmp_path / "positions.fen"
+    path.write_text("W:W31,32,K45:B1,2\n\nB:W50:BK1\n")
+
+    masks = load_masks(str(path))
+
+    assert masks.shape == (2, 4)
+    assert tuple(map(int, masks[1])) == parse_masks("B:W50:BK1") == (1 << 49, 1, 1, PLAYER_TWO)
+    assert [b for b, _ in read_fens(str(path))] == [Board([31, 32, 45], [1, 2], kings=[45]),
+                                                    Board([50], [1], kings=[1])]
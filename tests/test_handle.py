@@ -0,0 +1,81 @@
+import asyncio
+import threading
+import time
+
+from checkers.engine.handle import SearchHandle, start_search
+from checkers.engine.search import Searcher, SearchLimits, search
+from checkers.game import default_board
+from checkers.logic.legal_moves import get_legal_moves
+from checkers.models import Board, PLAYER_ONE
+
+BOARD = Board([32, 33, 38], [18, 19, 13])
+
+
+def test_depth_limit():
+    progress = []
+    result = start_search(BOARD, PLAYER_ONE, SearchLimits(depth=3), progress.append).wait()
+
+    assert result.score == search(BOARD, PLAYER_ONE, 3).score
+    assert [p.depth for p in progress] == [1, 2, 3]
+    assert progress[-1].move == result.move
+    assert all(p.nps > 0 for p in progress)
+
+
+def test_node_limit():
+    handle = start_search(BOARD, PLAYER_ONE, SearchLimits(nodes=50))
+    result = handle.wait()
+
+    assert handle.searcher.nodes <= 50
+    assert result.nodes < 50
+    assert result.move in get_legal_moves(BOARD, PLAYER_ONE)
+
+
+def test_no_completed_iteration():
+    result = start_search(BOARD, PLAYER_ONE, SearchLimits(nodes=1)).wait()
+
+    assert result.depth == 0
+    assert result.move == get_legal_moves(BOARD, PLAYER_ONE)[0]
+
+
+def test_searcher_limits_are_restored():
+    searcher = Searcher()
+    SearchHandle(BOARD, PLAYER_ONE, SearchLimits(nodes=1), searcher=searcher).wait()
+
+    assert searcher.limits == SearchLimits()
+    assert searcher.search(BOARD, PLAYER_ONE, 3).score == search(BOARD, PLAYER_ONE, 3).score
+
+
+def test_deadline():
+    start = time.monotonic()
+    result = start_search(default_board(), PLAYER_ONE, SearchLimits.within(0.2)).wait()
+
+    assert time.monotonic() - start < 1
+    assert result.move in get_legal_moves(default_board(), PLAYER_ONE)
+
+
+def test_stop():
+    handle = start_search(default_board(), PLAYER_ONE)
+    time.sleep(0.1)
+
+    start = time.monotonic()
+    result = handle.stop()
+
+    assert time.monotonic() - start < 0.5
+    assert handle.done
+    assert result.move in get_legal_moves(default_board(), PLAYER_ONE)
+    assert not handle.searcher.stop_event.is_set()
+
+
+def test_cancellation_token():
+    cancel = threading.Event()
+    handle = start_search(default_board(), PLAYER_ONE, SearchLimits(cancel=cancel))
+    cancel.set()
+
+    assert handle.wait(timeout=1).move is not None
+
+
+def test_await():
+    async def main():
+        return await start_search(BOARD, PLAYER_ONE, SearchLimits(depth=2))
+
+    assert asyncio.run(main()).score == search(BOARD, PLAYER_ONE, 2).score
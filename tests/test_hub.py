@@ -0,0 +1,167 @@
+import queue
+import socket
+import threading
+import time
+
+import pytest
+
+from checkers.engine.search import search
+from checkers.game import default_board, format_cmd
+from checkers.io.hub import HubEngine, parse_message, format_message, parse_position, format_position, \
+    HubError, Level, serve_tcp
+from checkers.models import Board, PLAYER_ONE, PLAYER_TWO
+
+START = "W" + "b" * 20 + "e" * 10 + "w" * 20
+
+
+@pytest.fixture()
+def hub():
+    lines = queue.Queue()
+    engine = HubEngine(lines.put)
+    yield engine, lines
+    engine.handle("quit")
+
+
+def _receive(lines: queue.Queue, command: str, timeout: float = 10.) -> str:
+    """Skips ahead to the next message that starts with ``command``."""
+    deadline = time.monotonic() + timeout
+
+    while True:
+        line = lines.get(timeout=max(deadline - time.monotonic(), 0.01))
+
+        if line.split()[0] == command:
+            return line
+
+
+def test_messages():
+    assert parse_message('pos pos=W123 moves="32-28 19-23"') == ("pos", {"pos": "W123", "moves": "32-28 19-23"})
+    assert parse_message("go ponder") == ("go", {"ponder": ""})
+    assert format_message("done", move="32-28", ponder=None) == "done move=32-28"
+    assert format_message("info", pv="32-28 19-23", move_time=1) == 'info pv="32-28 19-23" move-time=1'
+
+    with pytest.raises(HubError):
+        parse_message('pos moves="32-28')
+
+
+def test_positions():
+    assert parse_position(START) == (default_board(), PLAYER_ONE)
+
+    board = Board([28], [23, 13], kings=[13])
+    assert parse_position(format_position(board, PLAYER_TWO)) == (board, PLAYER_TWO)
+
+    with pytest.raises(HubError):
+        parse_position("W" + "e" * 49)
+
+
+def test_level():
+    assert Level(move_time=2.).seconds_for_move() == 2.
+    assert Level(time=60., moves=20, inc=1.).seconds_for_move() == 4.
+    assert Level().seconds_for_move() is None
+
+
+def test_handshake(hub):
+    engine, lines = hub
+
+    engine.handle("hub")
+    assert lines.get(timeout=10).startswith("id name=")
+    assert lines.get(timeout=10) == "wait"
+
+    engine.handle("init")
+    assert lines.get(timeout=10) == "ready"
+
+    engine.handle("bogus")
+    assert lines.get(timeout=10).startswith("error")
+
+    engine.handle("ping now=1")
+    assert lines.get(timeout=10).startswith("error message=\"Invalid arguments")
+
+
+def test_go_think(hub):
+    engine, lines = hub
+    board = Board([32, 33, 38], [18, 19, 13])
+
+    engine.handle(f'pos pos={format_position(board, PLAYER_ONE)}')
+    engine.handle("level depth=3")
+    engine.handle("go think")
+
+    assert _receive(lines, "info").startswith("info depth=1")
+    done = parse_message(_receive(lines, "done"))[1]
+
+    assert done["move"] == format_cmd(search(board, PLAYER_ONE, 3).move)
+
+
+def test_pos_with_moves(hub):
+    engine, _ = hub
+
+    engine.handle(f'pos pos={START} moves="32-28 19-23"')
+
+    assert engine.board == Board([28, 31, *range(33, 51)], [*range(1, 19), 20, 23])
+    assert engine.player is PLAYER_ONE
+
+
+def test_illegal_move(hub):
+    engine, lines = hub
+
+    engine.handle(f'pos pos={START} moves="32-23"')
+
+    assert lines.get(timeout=10).startswith("error")
+    assert engine.board == default_board()
+
+
+def test_ponder_hit(hub):
+    engine, lines = hub
+
+    engine.handle("level depth=3")
+    engine.handle("go ponder")
+    while parse_message(_receive(lines, "info"))[1]["depth"] != "3":
+        pass
+
+    with pytest.raises(queue.Empty):  # The result is held back
+        _receive(lines, "done", timeout=0.2)
+
+    engine.handle("ponder-hit")
+    assert "move=" in _receive(lines, "done")
+
+
+def test_stop(hub):
+    engine, lines = hub
+
+    engine.handle("go analyze")
+    _receive(lines, "info")
+    engine.handle("stop")
+
+    assert "move=" in _receive(lines, "done")
+
+
+def test_ping_latency(hub):
+    engine, lines = hub
+    times = []
+
+    for _ in range(200):
+        start = time.perf_counter()
+        engine.handle("ping")
+        lines.get_nowait()
+        times.append(time.perf_counter() - start)
+
+    assert sorted(times)[len(times) // 2] < 1e-3
+
+
+def test_tcp():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        port = s.getsockname()[1]
+
+    threading.Thread(target=serve_tcp, args=("127.0.0.1", port), daemon=True).start()
+
+    for _ in range(100):
+        try:
+            conn = socket.create_connection(("127.0.0.1", port))
+            break
+        except ConnectionRefusedError:
+            time.sleep(0.02)
+
+    with conn, conn.makefile("rw", encoding="utf-8") as f:
+        f.write("ping\nquit\n")
+        f.flush()
+
+        assert f.readline() == "pong\n"
@@ -0,0 +1,85 @@
+import random
+
+import pytest
+
+from checkers.engine.evaluation import evaluate
+from checkers.engine.incremental import track_evaluation, compute_terms, get_score, EvaluationMismatch, Terms
+from checkers.engine.search import Searcher
+from checkers.logic.legal_moves import get_legal_moves, make_move, unmake_move, apply_move
+from checkers.models import Board, Move, Piece, PLAYER_ONE, PLAYER_TWO
+from checkers.game import default_board
+
+
+def test_terms():
+    board = Board([46, 28], [3], kings=[3])
+
+    assert compute_terms(board, PLAYER_ONE) == Terms(200, 4, 1)
+    assert compute_terms(board, PLAYER_TWO) == Terms(300, 0, 0)
+
+    # 200 + 2 * 4 (tempo) + 4 (46 guards the back row) - 300
+    assert track_evaluation(board).score(PLAYER_ONE) == evaluate(board, PLAYER_ONE) == -88
+
+
+def test_make_unmake_random_games():
+    rng = random.Random(0)
+
+    for _ in range(3):
+        board = default_board()
+        evaluation = track_evaluation(board, debug=True)
+        original = board.copy()
+        player, undos = PLAYER_ONE, []
+
+        for _ in range(60):
+            if not (moves := get_legal_moves(board, player)):
+                break
+
+            move = rng.choice(moves)
+            expected = apply_move(board, move)
+            undos.append(make_move(board, move))
+            player = not player
+
+            assert board == expected
+            assert evaluation.score(player) == evaluate(board, player)
+
+        while undos:
+            unmake_move(board, undos.pop())
+            evaluation.check()
+
+        assert board == original
+        assert evaluation.terms(PLAYER_ONE) == compute_terms(original, PLAYER_ONE)
+
+
+def test_coronation_and_copy():
+    board = Board([7], [40])
+    evaluation = track_evaluation(board)
+    undo = make_move(board, Move(7, 1))
+
+    assert board[1] == Piece(1, PLAYER_ONE, True)
+    assert evaluation.terms(PLAYER_ONE).material == 300
+
+    copy = board.copy()
+    copy.apply_step(Move(1, 6))
+
+    assert get_score(copy, PLAYER_ONE) == evaluate(copy, PLAYER_ONE)
+    assert get_score(board, PLAYER_ONE) == evaluate(board, PLAYER_ONE)
+
+    unmake_move(board, undo)
+
+    assert board == Board([7], [40])
+    assert evaluation.terms(PLAYER_ONE) == compute_terms(board, PLAYER_ONE)
+
+
+def test_debug_mode_catches_drift():
+    board = Board([31], [20])
+    evaluation = track_evaluation(board, debug=True)
+    evaluation.add(Piece(45, PLAYER_ONE, False))  # Not actually on the board
+
+    with pytest.raises(EvaluationMismatch):
+        evaluation.score(PLAYER_ONE)
+
+
+def test_search_with_debug_evaluation():
+    board = Board([36, 45, 17], [9, 22, 7, 28])
+    track_evaluation(board, debug=True)
+
+    assert Searcher().search(board, PLAYER_ONE, 3).move == Searcher().search(board.copy(), PLAYER_ONE, 3).move
@@ -0,0 +1,123 @@
+import os
+
+import pytest
+
+from checkers.game import Game
+from checkers.io.journal import MoveLog, recover, recover_games, read_records, encode_record, JournalError, \
+    MOVE, WAL_SUFFIX, SNAPSHOT_SUFFIX
+from checkers.io.sample_match import sample_game_cmd_generator
+from checkers.logic.legal_moves import encode_move
+from checkers.models import Board, Move
+
+OPENING = ["32-28", "19-23", "28x19", "14x23"]
+
+
+def _play(game: Game, cmds: list[str]):
+    for cmd in cmds:
+        game.play(cmd)
+
+
+def test_records():
+    data = encode_record(3, 1, MOVE, encode_move(Move(32, 28))) + encode_record(3, 2, MOVE, 7)
+
+    assert list(read_records(data)) == [(3, 1, MOVE, encode_move(Move(32, 28))), (3, 2, MOVE, 7)]
+    assert list(read_records(data[:-1])) == [(3, 1, MOVE, encode_move(Move(32, 28)))]  # Torn
+    assert list(read_records(data[:5] + b"\xff" + data[6:])) == []  # Corrupt
+
+
+def test_recover_after_crash(tmp_path):
+    log = MoveLog(str(tmp_path))
+    first, second = Game(log=log), Game(log=log)
+
+    _play(first, OPENING)
+    _play(second, OPENING[:2])
+    log.flush()
+
+    # Without closing the log (as in a crash)
+    _, state = recover(str(tmp_path))
+
+    assert set(state.games) == {first.game_id, second.game_id}
+    assert state.games[first.game_id].plies == 4
+
+    log.close()
+
+    with MoveLog(str(tmp_path)) as log:
+        games = recover_games(log)
+
+        assert games[first.game_id].board == first.board
+        assert games[second.game_id].board == second.board
+
+        # The recovered games keep logging
+        games[second.game_id].play("28x19")
+
+    with MoveLog(str(tmp_path)) as log:
+        assert recover_games(log)[second.game_id].board == games[second.game_id].board
+
+
+def test_torn_tail_is_ignored(tmp_path):
+    with MoveLog(str(tmp_path)) as log:
+        game = Game(log=log)
+        _play(game, OPENING)
+
+    segment, _ = recover(str(tmp_path))
+    wal = tmp_path / f"{segment:08d}{WAL_SUFFIX}"
+    wal.write_bytes(wal.read_bytes()[:-3])
+
+    _, state = recover(str(tmp_path))
+
+    assert state.games[game.game_id].plies == 3
+
+
+def test_snapshots(tmp_path):
+    cmds = [cmd for _, moves in sample_game_cmd_generator() for cmd in moves][:40]
+
+    with MoveLog(str(tmp_path), snapshot_every=8, commit_interval=0.) as log:
+        game = Game(log=log)
+
+        for cmd in cmds:
+            game.play(cmd)
+            log.flush()
+
+    files = os.listdir(tmp_path)
+
+    assert sum(name.endswith(SNAPSHOT_SUFFIX) for name in files) == 1
+    assert sum(name.endswith(WAL_SUFFIX) for name in files) == 1
+
+    with MoveLog(str(tmp_path)) as log:
+        assert recover_games(log)[game.game_id].board == game.board
+
+
+def test_finished_games_are_dropped(tmp_path):
+    with MoveLog(str(tmp_path)) as log:
+        won = Game(Board([32], [27]), log=log)
+        won.play("32x21")
+        ongoing = Game(log=log)
+
+    _, state = recover(str(tmp_path))
+
+    assert set(state.games) == {ongoing.game_id}
+
+
+def test_out_of_order(tmp_path):
+    with MoveLog(str(tmp_path)) as log:
+        game_id = log.start(Board([32], [1]))
+
+        with pytest.raises(JournalError):
+            log.record(game_id, 2, Move(32, 28))
+
+
+def test_group_commit(tmp_path, monkeypatch):
+    fsyncs = []
+    fsync = os.fsync
+    monkeypatch.setattr(os, "fsync", lambda fd: fsyncs.append(fd) or fsync(fd))
+
+    with MoveLog(str(tmp_path), commit_interval=0.05) as log:
+        fsyncs.clear()
+        game_ids = [log.start(Board([32], [1])) for _ in range(100)]
+
+        for game_id in game_ids:
+            log.record(game_id, 1, Move(32, 28))
+
+        log.flush()
+
+    assert len(fsyncs) < 10
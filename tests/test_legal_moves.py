@@ -0,0 +1,58 @@
+from checkers.game import default_board, parse_cmd, format_cmd
+from checkers.logic.legal_moves import get_legal_moves, apply_move, encode_move, decode_move
+from checkers.models import Board, Move, PLAYER_ONE, PLAYER_TWO, capture_series_to_moves
+
+
+def test_opening_moves():
+    assert get_legal_moves(default_board(), PLAYER_ONE) == [
+        Move(31, 27), Move(31, 26), Move(32, 28), Move(32, 27), Move(33, 29),
+        Move(33, 28), Move(34, 30), Move(34, 29), Move(35, 30)
+    ]
+    assert len(get_legal_moves(default_board(), PLAYER_TWO)) == 9
+
+
+def test_only_max_captures_are_legal():
+    board = Board([28, 44, 27], [22, 12, 13])
+
+    assert get_legal_moves(board, PLAYER_ONE) == [capture_series_to_moves([28, 17, 8, 19])]
+    assert get_legal_moves(board, PLAYER_TWO) == [capture_series_to_moves([22, 31]),
+                                                  capture_series_to_moves([22, 33])]
+
+
+def test_king_moves():
+    moves = get_legal_moves(Board([46], [], kings=[46]), PLAYER_ONE)
+
+    assert Move(46, 5) in moves
+    assert Move(46, 16) in moves
+    assert Move(46, 50) in moves
+
+
+def test_king_cannot_land_on_captured_piece():
+    moves = get_legal_moves(Board([46], [41], kings=[46]), PLAYER_ONE)
+
+    assert moves == [[Move(46, 37)], [Move(46, 32)], [Move(46, 28)], [Move(46, 23)],
+                     [Move(46, 19)], [Move(46, 14)], [Move(46, 10)], [Move(46, 5)]]
+
+
+def test_apply_move_coronates():
+    board = apply_move(Board([7], [40]), Move(7, 1))
+
+    assert board == Board([1], [40], kings=[1])
+
+
+def test_apply_move_leaves_original_untouched():
+    board = Board([28], [22])
+    apply_move(board, [Move(28, 17)])
+
+    assert board == Board([28], [22])
+
+
+def test_format_cmd():
+    for cmd in ("32-28", "28x17x8x19"):
+        assert format_cmd(parse_cmd(cmd)) == cmd
+
+
+def test_encode_move():
+    for move in (Move(32, 28), [Move(28, 17)], capture_series_to_moves([28, 17, 8, 19]),
+                 capture_series_to_moves([1, 12, 23, 34, 45, 34, 23, 12, 1])):
+        assert decode_move(encode_move(move)) == move
@@ -4,28 +4,6 @@ from checkers.logic.max_capture import is_max_capture, compute_max_capture
 from checkers.models import Board, capture_series_to_moves, PLAYER_ONE, PLAYER_TWO
 from checkers.utils.draw import draw_board_with_indices
 
-@pytest.fixture()
-def board_1():
-    """
-    .. code::
-
-        .  .01.  .02.  .03.  .04.  .05.
-        |  |[]|  |[]|  |[]|  |[]|  |[]|05
-      06|[]|  |[]|  |[]|  |[]|  |[]|  |
-        |  |[]|  |<>|  |<>|  |[]|  |[]|15
-      16|[]|  |[]|  |[]|  |[]|  |[]|  |
-        |  |[]|  |<>|  |[]|  |[]|  |[]|25
-      26|[]|  |⊂⊃|  |⊂⊃|  |[]|  |[]|  |
-        |  |[]|  |[]|  |[]|  |[]|  |[]|35
-     36|[]|  |[]|  |[]|  |[]|  |[]|  |
-       |  |[]|  |[]|  |[]|  |⊂⊃|  |[]|45
-     46|[]|  |[]|  |[]|  |[]|  |[]|  |
-       '46'  '47'  '48'  '49'  '50'  '
-
-    """
-
-    return Board([28, 44, 27], [22, 12, 13])
-
 
 def test_max_capture_with_normal(board_1):
     p1_max_capture = compute_max_capture(board_1, PLAYER_ONE)
@@ -0,0 +1,89 @@
+import random
+
+from checkers.engine.mcts import MCTS, _playout, _Buffers, FULL, UNEXPANDED
+from checkers.logic.batch import boards_to_array
+from checkers.logic.legal_moves import get_legal_moves
+from checkers.models import Board, Move, PLAYER_ONE, PLAYER_TWO
+
+
+def test_finds_winning_capture():
+    # Capturing 23 leaves player two without pieces
+    board = Board([28, 33], [23])
+    result = MCTS(board, PLAYER_ONE, seed=0).run(50)
+
+    assert result.move == [Move(28, 19)]
+    assert result.win_rate == 1.
+    assert result.playouts == 50
+    assert result.playouts_per_second > 0
+
+
+def test_no_legal_moves():
+    result = MCTS(Board([], [23]), PLAYER_ONE, seed=0).run(10)
+
+    assert result.move is None
+
+
+def test_playout_ends_when_side_cannot_move():
+    # Both men are on their last row, so neither can move
+    cells = boards_to_array([Board([1], [46])])[0].tolist()
+
+    assert _playout(cells, 1, random.Random(0), 200) == 0.
+    assert _playout(cells, -1, random.Random(0), 200) == 1.
+
+
+def test_tree_stays_bounded():
+    mcts = MCTS(Board([31, 32, 33, 34], [17, 18, 19, 20]), PLAYER_ONE, max_nodes=100, seed=0)
+    mcts.run(200)
+
+    assert len(mcts) <= 100
+    assert sum(mcts.visits[mcts.first_child[0]:mcts.first_child[0] + mcts.n_children[0]]) == 200
+
+
+def test_tree_reuse():
+    board = Board([31, 32, 33, 34], [17, 18, 19, 20])
+    mcts = MCTS(board, PLAYER_ONE, seed=0)
+    move = mcts.run(200).move
+    first = mcts.first_child[0]
+    child = next(c for c in range(first, first + mcts.n_children[0]) if mcts._move(c) == move)
+    visits = mcts.visits[child]
+
+    mcts.advance(move)
+
+    assert mcts.player is PLAYER_TWO
+    assert mcts.visits[0] == visits
+    assert mcts.n_children[0] == len(get_legal_moves(mcts.board, PLAYER_TWO))
+    assert sum(mcts.visits[1:1 + mcts.n_children[0]]) == visits
+
+
+def test_advance_unexplored_move():
+    mcts = MCTS(Board([31, 32], [17, 18]), PLAYER_ONE, seed=0)
+    mcts.advance(Move(32, 28))
+
+    assert len(mcts) == 1
+    assert mcts.player is PLAYER_TWO
+    assert mcts.board == Board([31, 28], [17, 18])
+
+
+def test_full_leaves_are_flagged():
+    mcts = MCTS(Board([31, 32, 33, 34], [17, 18, 19, 20]), PLAYER_ONE, max_nodes=20, seed=0)
+    mcts.run(100)
+
+    assert FULL in mcts.n_children
+    parents = set(mcts.parent[1:])
+
+    for node in range(len(mcts)):
+        if mcts.n_children[node] == FULL:
+            assert node not in parents
+
+        # A new leaf gets one playout; it's expanded (or flagged) the next time it's reached
+        if mcts.visits[node] > 1:
+            assert mcts.n_children[node] != UNEXPANDED
+
+
+def test_playout_reuses_buffers():
+    buffers = _Buffers()
+    cells = buffers.load(Board([31, 32, 33, 34], [17, 18, 19, 20]))
+
+    assert cells == boards_to_array([Board([31, 32, 33, 34], [17, 18, 19, 20])])[0].tolist()
+    assert _playout(cells, 1, random.Random(0), 200, buffers) in (0., .5, 1.)
+    assert buffers.cells is cells
@@ -0,0 +1,91 @@
+import random
+
+from checkers.engine.incremental import IncrementalEvaluation, track_evaluation, compute_terms
+from checkers.game import default_board, Game
+from checkers.logic.legal_moves import get_legal_moves, apply_move, make_move, unmake_move
+from checkers.logic.move_lists import MoveLists, track_move_lists, legal_moves
+from checkers.models import Board, Move, PLAYER_ONE, PLAYER_TWO
+
+
+def test_matches_full_generation():
+    rng = random.Random(0)
+
+    for _ in range(20):
+        board, player = default_board(), PLAYER_ONE
+        track_move_lists(board)
+        undos = []
+
+        while moves := get_legal_moves(board, player):
+            assert legal_moves(board, player) == moves
+
+            move = rng.choice(moves)
+
+            if rng.random() < 0.5:
+                board = apply_move(board, move)
+            else:
+                undos.append((board, make_move(board, move)))
+
+            player = not player
+
+        # Taking moves back also keeps the lists up to date
+        for board, undo in reversed(undos[-10:]):
+            unmake_move(board, undo)
+            assert legal_moves(board, PLAYER_ONE) == get_legal_moves(board, PLAYER_ONE)
+            assert legal_moves(board, PLAYER_TWO) == get_legal_moves(board, PLAYER_TWO)
+
+
+def test_only_dirty_pieces_are_regenerated(monkeypatch):
+    board = default_board()
+    move_lists = track_move_lists(board)
+    move_lists.legal_moves(PLAYER_ONE)
+
+    regenerated = []
+    generate_steps = MoveLists._refresh.__globals__["generate_steps"]
+    monkeypatch.setitem(MoveLists._refresh.__globals__, "generate_steps",
+                        lambda piece, occupied: regenerated.append(piece.idx) or generate_steps(piece, occupied))
+
+    board.apply_step(Move(32, 28))
+    move_lists.legal_moves(PLAYER_ONE)
+
+    # Player one's men within two diagonal steps of 32 or 28
+    assert sorted(regenerated) == [28, 33, 37, 38, 39, 41, 43]
+
+
+def test_captures_fall_back():
+    board = Board([32], [19])
+    move_lists = track_move_lists(board)
+
+    assert move_lists.legal_moves(PLAYER_ONE, lambda b, p: ["full"]) == [Move(32, 28), Move(32, 27)]
+
+    board.apply_step(Move(19, 23))
+
+    assert move_lists.can_capture(PLAYER_TWO) is False
+    assert move_lists.can_capture(PLAYER_ONE) is False
+
+    board.apply_step(Move(32, 28))
+
+    assert move_lists.legal_moves(PLAYER_TWO, lambda b, p: ["full"]) == ["full"]
+
+
+def test_shares_the_board_with_other_trackers():
+    board = default_board()
+    evaluation = track_evaluation(board)
+    move_lists = track_move_lists(board)
+
+    assert board.find_tracker(IncrementalEvaluation) is evaluation
+    assert board.find_tracker(MoveLists) is move_lists
+
+    board = apply_move(board, Move(32, 28))
+
+    assert board.find_tracker(IncrementalEvaluation).terms(PLAYER_ONE) == compute_terms(board, PLAYER_ONE)
+    assert legal_moves(board, PLAYER_TWO) == get_legal_moves(board, PLAYER_TWO)
+
+
+def test_game_validation():
+    game = Game(Board([32, 37], [28]))
+
+    assert game.move_lists.legal_moves(PLAYER_ONE) == [[Move(32, 23)]]
+
+    game.play("32x23")
+
+    assert game.move_lists.legal_moves(PLAYER_TWO) == []
@@ -0,0 +1,71 @@
+import dataclasses
+
+import pytest
+
+from checkers.game import parse_cmd
+from checkers.io.notation import tokenize, parse_move, parse_moves, format_move, find_move, NotationError
+from checkers.logic.legal_moves import get_legal_moves
+from checkers.models import Board, Move, PLAYER_ONE
+
+
+def test_tokenize():
+    assert list(tokenize("01.32-28 19-23 2... 28x19 1-1 foo")) == [
+        ("number", "01."), ("step", "32-28"), ("step", "19-23"), ("number", "2..."), ("capture", "28x19"),
+        ("result", "1-1"), ("unknown", "foo"),
+    ]
+
+
+def test_parse_move():
+    assert parse_move("32-28") == Move(32, 28)
+    assert parse_move(" 28x17x8 ") == [Move(28, 17), Move(17, 8)]
+
+
+def test_parsed_moves_cant_be_modified():
+    # Parses are cached, so a modification would leak into later ones
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        parse_move("32-28").end = 27
+
+    assert parse_move("32-28") == Move(32, 28)
+
+
+@pytest.mark.parametrize("token", ["", "32", "32-", "32-28-23", "28x", "x28", "0-5", "51x40", "32_28", "123-4"])
+def test_parse_malformed(token):
+    with pytest.raises(NotationError):
+        parse_move(token)
+
+    with pytest.raises(NotationError):
+        parse_cmd(token)
+
+
+def test_parse_moves():
+    moves, result = parse_moves("1. 32-28 19-23 2. 28x19 14x23 2-0")
+
+    assert moves == [Move(32, 28), Move(19, 23), [Move(28, 19)], [Move(14, 23)]]
+    assert result == "2-0"
+
+    with pytest.raises(NotationError):
+        parse_moves("1. 32-28 19-23 2. 28y19")
+
+
+def test_minimal_notation():
+    board = Board([14, 17], [44, 28, 41, 20, 27], kings=[14, 17])
+    legal_moves = get_legal_moves(board, PLAYER_ONE)
+    notations = sorted(format_move(m, legal_moves) for m in legal_moves)
+
+    assert notations == ["17x33x10", "17x39x10"]
+    assert sorted(format_move(m) for m in legal_moves) == ["17x33x50x10", "17x39x50x10"]
+
+    for move in legal_moves:
+        assert find_move(format_move(move, legal_moves), legal_moves) == move
+
+    assert find_move("17x10", legal_moves) is None
+    assert find_move("17x50x10", legal_moves) is None
+
+
+def test_unambiguous_capture_is_shortened():
+    board = Board([28], [23, 13])
+    legal_moves = get_legal_moves(board, PLAYER_ONE)
+
+    assert legal_moves == [[Move(28, 19), Move(19, 8)]]
+    assert format_move(legal_moves[0], legal_moves) == "28x8"
+    assert find_move("28x8", legal_moves) == legal_moves[0]
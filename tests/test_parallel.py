@@ -0,0 +1,38 @@
+from checkers.engine.parallel import SharedTranspositionTable, parallel_search
+from checkers.engine.search import TTEntry, Bound, WIN_SCORE, search
+from checkers.logic.legal_moves import get_legal_moves
+from checkers.models import Board, Move, PLAYER_ONE, capture_series_to_moves
+
+
+def test_shared_transposition_table():
+    tt = SharedTranspositionTable(64)
+
+    try:
+        tt.store(-12345, TTEntry(3, -WIN_SCORE, Bound.LOWER, capture_series_to_moves([28, 17, 8])))
+        tt.store(99, TTEntry(1, 42, Bound.EXACT, None))
+
+        other = SharedTranspositionTable(64, name=tt.name)
+        assert other.get(-12345) == TTEntry(3, -WIN_SCORE, Bound.LOWER, capture_series_to_moves([28, 17, 8]))
+        assert other.get(99) == TTEntry(1, 42, Bound.EXACT, None)
+        assert other.get(100) is None
+        other.close()
+
+        # Keep the deeper entry for the same position
+        tt.store(99, TTEntry(0, 7, Bound.UPPER, Move(32, 28)))
+        assert tt.get(99).depth == 1
+        assert len(tt) == 2
+    finally:
+        tt.close()
+        tt.unlink()
+
+
+def test_parallel_search():
+    board = Board([32, 33, 38], [18, 19, 13])
+    result = parallel_search(board, PLAYER_ONE, 2, workers=2)
+
+    assert len(result.workers) == 2
+    assert result.result.depth == 2
+    assert all(w.depth == 2 for w in result.workers)
+    assert result.result.score == search(board, PLAYER_ONE, 2).score
+    assert result.result.move in get_legal_moves(board, PLAYER_ONE)
+    assert result.nodes == sum(w.nodes for w in result.workers) > 0
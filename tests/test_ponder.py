@@ -0,0 +1,43 @@
+from checkers.engine.ponder import PonderingEngine
+from checkers.engine.search import search
+from checkers.logic.legal_moves import apply_move, get_legal_moves
+from checkers.models import Board, PLAYER_ONE, PLAYER_TWO
+
+
+def test_ponder_hit():
+    engine = PonderingEngine(depth=3)
+    board = Board([32, 33, 38], [18, 19, 13])
+
+    result = engine.choose_move(board, PLAYER_ONE)
+    board = apply_move(apply_move(board, result.pv[0]), result.pv[1])
+    hit = engine.choose_move(board, PLAYER_ONE)
+    engine.stop()
+
+    assert (engine.ponder_hits, engine.ponder_misses) == (1, 0)
+    assert hit.score == search(board, PLAYER_ONE, 3).score
+
+
+def test_ponder_miss():
+    engine = PonderingEngine(depth=3)
+    board = Board([32, 33, 38], [18, 19, 13])
+
+    result = engine.choose_move(board, PLAYER_ONE)
+    board = apply_move(board, result.pv[0])
+    reply = next(m for m in get_legal_moves(board, PLAYER_TWO) if m != result.pv[1])
+    board = apply_move(board, reply)
+    miss = engine.choose_move(board, PLAYER_ONE)
+    engine.stop()
+
+    assert (engine.ponder_hits, engine.ponder_misses) == (0, 1)
+    assert miss.score == search(board, PLAYER_ONE, 3).score
+    assert not engine.searcher.stop_event.is_set()
+
+
+def test_stop_cancels_pondering():
+    engine = PonderingEngine(depth=6)
+    engine.choose_move(Board([32, 33], [18, 19]), PLAYER_ONE)
+    pondering = engine._pondering
+    engine.stop()
+
+    assert not pondering.thread.is_alive()
+    assert engine._pondering is None
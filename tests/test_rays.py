@@ -0,0 +1,147 @@
+import functools
+import itertools
+import random
+
+import pytest
+from pydantic import ValidationError
+
+from checkers.logic.attacks import get_analysis
+from checkers.logic.legal_moves import _generate_steps
+from checkers.logic.max_capture import compute_max_capture
+from checkers.logic.rays import RAYS, scan, RayScan
+from checkers.logic.rules import is_valid_king_step, is_valid_normal_step, get_valid_normal_capture, get_valid_king_capture
+from checkers.models import Board, Move, Piece, PLAYER_ONE, PLAYER_TWO
+from checkers.models.position import TileIndexError, move_ur, move_dr, move_u, move_r
+
+
+# -- The predicate-based generators the ray tables replaced (as a reference) --
+
+def get_normal_moves():
+    return itertools.product((move_ur, move_dr), (2, -2))
+
+
+def get_normal_steps():
+    return itertools.product((move_ur, move_dr), (1, -1))
+
+
+def get_king_moves():
+    return itertools.product((move_ur, move_dr, move_u, move_r),
+                             itertools.chain(range(-11, 0), range(1, 11)))
+
+
+def _generate_captures(get_tiles, get_valid_capture, board, start, player):
+    for move, amt in get_tiles():
+        try:
+            end = move(start, amt)
+            if capture := get_valid_capture(board, Move(start, end), player=player):
+                yield end, capture
+
+        except (TileIndexError, ValidationError):
+            pass
+
+
+_generate_normal_captures = functools.partial(_generate_captures, get_normal_moves, get_valid_normal_capture)
+_generate_king_captures = functools.partial(_generate_captures, get_king_moves, get_valid_king_capture)
+
+
+def _random_boards(n: int, seed: int = 0):
+    rng = random.Random(seed)
+
+    for _ in range(n):
+        squares = rng.sample(range(1, 51), rng.randint(2, 12))
+        half = len(squares) // 2
+        yield Board(squares[:half], squares[half:], kings=rng.sample(squares, rng.randint(1, len(squares))))
+
+
+def test_rays():
+    assert RAYS[28] == ((22, 17, 11, 6), (23, 19, 14, 10, 5), (32, 37, 41, 46), (33, 39, 44, 50),
+                        (18, 8), (38, 48), (27, 26), (29, 30))
+    assert RAYS[46][1] == (41, 37, 32, 28, 23, 19, 14, 10, 5)
+
+
+def test_scan():
+    occupied = (1 << (19 - 1)) | (1 << (5 - 1))
+
+    assert scan(28, 1, occupied) == RayScan((23,), 19, (14, 10))
+    assert scan(28, 0, occupied) == RayScan((22, 17, 11, 6), None, ())
+
+
+@pytest.mark.parametrize("board", list(_random_boards(6)))
+def test_jumps_match_rules(board):
+    analysis = get_analysis(board)
+    occupied = {p.idx for p in board}
+
+    for piece in board:
+        generate = _generate_king_captures if piece.is_king else _generate_normal_captures
+        expected = [(end, captured) for end, captured in generate(board, piece.idx, piece.player)
+                    if end not in occupied]
+
+        assert sorted(analysis.jumps_from(piece.idx, piece.player, piece.is_king)) == sorted(expected)
+
+
+@pytest.mark.parametrize("board", list(_random_boards(6, seed=1)))
+def test_king_steps_match_rules(board):
+    for piece in board:
+        king = Piece(piece.idx, piece.player, True)
+        expected = set()
+
+        for move, amt in get_king_moves():
+            try:
+                step = Move(king.idx, move(king.idx, amt))
+            except (TileIndexError, ValidationError):
+                continue
+
+            if is_valid_king_step(board, step):
+                expected.add(step.end)
+
+        assert {step.end for step in _generate_steps(board, king)} == expected
+
+
+@pytest.mark.parametrize("board", list(_random_boards(6, seed=2)))
+def test_normal_steps_match_rules(board):
+    for piece in board:
+        man = Piece(piece.idx, piece.player, False)
+        expected = set()
+
+        for move, amt in get_normal_steps():
+            try:
+                step = Move(man.idx, move(man.idx, amt))
+            except (TileIndexError, ValidationError):
+                continue
+
+            if is_valid_normal_step(board, step):
+                expected.add(step.end)
+
+        assert {step.end for step in _generate_steps(board, man)} == expected
+
+
+def _baseline_max_capture(board, player, empty_landings_only=False):
+    """``compute_max_capture`` as of the baseline, which let kings land on
+    the piece they capture (optionally with those landings dropped)."""
+    occupied = {p.idx for p in board}
+
+    @functools.lru_cache(maxsize=None)
+    def jumps(idx, is_king):
+        generate = _generate_king_captures if is_king else _generate_normal_captures
+        return [(end, captured) for end, captured in generate(board, idx, player)
+                if not (empty_landings_only and end in occupied)]
+
+    def longest(idx, is_king, captured):
+        return max((1 + longest(end, is_king, (*captured, newly_captured))
+                    for end, newly_captured in jumps(idx, is_king) if newly_captured not in captured), default=0)
+
+    return max((longest(p.idx, p.is_king, ()) for p in board if p.player is player), default=0)
+
+
+def test_kings_dont_land_on_captured_pieces():
+    # 19 blocks the square behind 23. The baseline counted 28x23 as a capture.
+    board = Board([28], [23, 19], kings=[28])
+
+    assert _baseline_max_capture(board, PLAYER_ONE) == 1
+    assert compute_max_capture(board, PLAYER_ONE) == 0
+
+
+@pytest.mark.parametrize("board", list(_random_boards(8, seed=3)))
+def test_max_capture_matches_baseline(board):
+    for player in (PLAYER_ONE, PLAYER_TWO):
+        assert compute_max_capture(board, player) == _baseline_max_capture(board, player, empty_landings_only=True)
@@ -0,0 +1,85 @@
+import io
+
+from click.testing import CliRunner
+
+from checkers.game import default_board
+from checkers.io.archive import ArchivedGame, write_games, read_games
+from checkers.io.repair import repair_game, repair_games, rank_candidates, write_repairs, main, Correction
+from checkers.io.sample_match import sample_game_cmd_generator
+from checkers.logic.legal_moves import get_legal_moves
+from checkers.models import Board, Move, PLAYER_ONE
+from checkers.utils.stringx import edit_distance
+
+SAMPLE = [cmd for _, moves in sample_game_cmd_generator() for cmd in moves if cmd != "exit"]
+OPENING = ["32-28", "19-23", "28x19", "14x23", "37-32"]
+
+
+def test_edit_distance():
+    assert edit_distance("32-28", "32-28") == 0
+    assert edit_distance("32-82", "32-28") == 2
+    assert edit_distance("", "abc") == 3
+    assert edit_distance("28x19", "28x17x19") == 3
+
+
+def test_rank_candidates():
+    board = default_board()
+    legal_moves = get_legal_moves(board, PLAYER_ONE)
+
+    assert rank_candidates(board, "32-23", legal_moves)[0] == (1, Move(32, 28))
+    # Equally far from 31-27 and 32-27, but it names 32
+    assert rank_candidates(board, "032-37", legal_moves)[0] == (1, Move(32, 27))
+
+
+def test_repairs_typos():
+    recorded = list(OPENING)
+    recorded[0], recorded[2] = "32-23", "28x91"
+    repaired = repair_game(ArchivedGame(recorded, {"Result": "0-2"}))
+
+    assert repaired.is_repaired
+    assert repaired.game.moves == OPENING
+    assert repaired.game.headers == {"Result": "0-2"}
+    assert repaired.corrections == [Correction(0, "32-23", "32-28", 1), Correction(2, "28x91", "28x19", 2)]
+
+
+def test_lookahead_rejects_closer_candidates():
+    # 32-28 ranks first for "32-29", but then player one would have to capture instead of playing 27-22
+    repaired = repair_game(ArchivedGame(["32-29", "19-23", "27-22"]))
+
+    assert rank_candidates(default_board(), "32-29", get_legal_moves(default_board(), PLAYER_ONE))[0][1] == Move(32, 28)
+    assert repaired.corrections[0].replacement == "32-27"
+    assert repaired.game.moves == ["32-27", "19-23", "27-22"]
+
+
+def test_non_maximal_capture():
+    # 32x21 captures one piece, 32x21x12 (the only legal move) two
+    board = Board([32], [27, 17, 8])
+    legal_moves = get_legal_moves(board, PLAYER_ONE)
+
+    assert rank_candidates(board, "32x21", legal_moves)[0][1] == legal_moves[0]
+
+
+def test_sample_match_is_reported():
+    repaired = repair_game(ArchivedGame(SAMPLE))
+
+    assert not repaired.is_repaired
+    assert repaired.failed_ply == 95
+    assert repaired.game.moves == SAMPLE
+
+    report = io.StringIO()
+    assert write_repairs([repaired], io.StringIO(), report) == (0, 1)
+    assert report.getvalue() == "Game 1, turn 48 (ply 95): couldn't repair 31x48x34\n"
+
+
+def test_bulk_repair(tmp_path):
+    games = [ArchivedGame(["32-23", *OPENING[1:]]), ArchivedGame(OPENING), ArchivedGame(SAMPLE)] * 2
+
+    assert list(repair_games(iter(games), workers=2, chunk_size=1)) == [repair_game(game) for game in games]
+
+    archive, out, report = tmp_path / "games.pdn", tmp_path / "repaired.pdn", tmp_path / "report.txt"
+    write_games(str(archive), games)
+    result = CliRunner().invoke(main, [str(archive), "--out", str(out), "--report", str(report), "--workers", "1"])
+
+    assert result.exit_code == 0, result.output
+    assert "2 corrections, 2 games left unrepaired" in result.output
+    assert [game.moves for game in read_games(str(out))][:2] == [OPENING, OPENING]
+    assert report.read_text().count("\n") == 4
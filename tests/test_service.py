@@ -0,0 +1,133 @@
+import json
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from checkers.engine.search import search
+from checkers.game import default_board
+from checkers.io.fen import format_fen
+from checkers.io.notation import format_move
+from checkers.io.service import start_service, percentile, LatencyStats, VALIDATE
+from checkers.logic.cache import PositionCache
+from checkers.logic.legal_moves import get_legal_moves
+from checkers.models import Board, PLAYER_ONE, PLAYER_TWO
+
+START = format_fen(default_board(), PLAYER_ONE)
+CAPTURE = "W:W28:B23,13"  # 28x19x8 is the only (maximum) capture
+
+
+@pytest.fixture(scope="module")
+def service():
+    server = start_service(workers=2, max_delay=0.005)
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _post(service, endpoint: str, body) -> tuple[int, dict]:
+    request = urllib.request.Request(f"{service.url}/{endpoint}", data=json.dumps(body).encode("utf-8"),
+                                     headers={"Content-Type": "application/json"})
+    try:
+        with urllib.request.urlopen(request, timeout=30) as response:
+            return response.status, json.load(response)
+    except urllib.error.HTTPError as e:
+        return e.code, json.load(e)
+
+
+def test_validate(service):
+    assert _post(service, "validate", {"fen": START, "move": "32-28"}) == (200, {"legal": True, "move": "32-28"})
+    assert _post(service, "validate", {"fen": START, "move": "32-23"}) == (200, {"legal": False})
+    assert _post(service, "validate", {"fen": START, "move": "hello"}) == (200, {"legal": False})
+    assert _post(service, "validate", {"fen": CAPTURE, "move": "28x8"}) == (200, {"legal": True, "move": "28x8"})
+    assert _post(service, "validate", {"fen": CAPTURE, "move": "28x19"}) == (200, {"legal": False})
+
+
+def test_legal_moves(service):
+    board, player = default_board(), PLAYER_ONE
+    expected = get_legal_moves(board, player)
+
+    status, data = _post(service, "legal-moves", {"fen": START})
+
+    assert status == 200
+    assert sorted(data["moves"]) == sorted(format_move(m, expected) for m in expected)
+
+
+def test_best_move(service):
+    status, data = _post(service, "best-move", {"fen": CAPTURE, "depth": 2})
+
+    assert status == 200
+    assert data["move"] == "28x8"
+    assert data["depth"] == 2
+
+    board = Board([32, 31], [12])
+    status, data = _post(service, "best-move", {"fen": format_fen(board, PLAYER_TWO), "depth": 3})
+    assert data["score"] == search(board, PLAYER_TWO, 3).score
+
+
+@pytest.mark.parametrize("endpoint, body", [
+    ("validate", {"fen": START}),
+    ("validate", {"fen": "X:W1:B2", "move": "1-6"}),
+    ("legal-moves", [1, 2]),
+    ("best-move", {"fen": START, "depth": 100}),
+    ("best-move", {"fen": START, "seconds": -1}),
+])
+def test_bad_requests(service, endpoint, body):
+    status, data = _post(service, endpoint, body)
+
+    assert status == 400
+    assert "error" in data
+
+
+def test_unknown_endpoint(service):
+    assert _post(service, "hello", {"fen": START})[0] == 404
+
+
+def test_concurrent_requests_are_batched(service):
+    batches = service.batcher.batches
+    fens = [format_fen(board, player) for board in (default_board(), Board([28], [23, 13]), Board([46], [5]))
+            for player in (PLAYER_ONE, PLAYER_TWO)]
+    bodies = [fens[i % len(fens)] for i in range(48)]
+
+    with ThreadPoolExecutor(16) as executor:
+        results = list(executor.map(lambda fen: _post(service, "legal-moves", {"fen": fen}), bodies))
+
+    assert all(status == 200 for status, _ in results)
+    assert service.batcher.batches - batches < len(bodies)
+
+    for fen, (_, data) in zip(bodies, results):
+        assert data == results[bodies.index(fen)][1]
+
+    with urllib.request.urlopen(f"{service.url}/stats", timeout=30) as response:
+        stats = json.load(response)
+
+    assert stats["latency"]["legal-moves"]["count"] >= len(bodies)
+    assert stats["latency"]["legal-moves"]["p50_ms"] <= stats["latency"]["legal-moves"]["p99_ms"]
+    assert stats["cache"]["hits"] > 0
+
+
+def test_percentiles():
+    assert percentile([1., 2., 3., 4.], 50) == 2.
+    assert percentile([1., 2., 3., 4.], 99) == 4.
+    assert percentile([5.], 50) == 5.
+
+    latency = LatencyStats(window=2)
+
+    for seconds in (0.1, 0.001, 0.003):
+        latency.record(VALIDATE, seconds)
+
+    assert latency.summary() == {VALIDATE: {"count": 3, "p50_ms": 1., "p99_ms": 3.}}
+
+
+def test_legal_moves_many():
+    cache = PositionCache()
+    positions = [(default_board(), PLAYER_ONE), (Board([28], [23, 13]), PLAYER_ONE), (default_board(), PLAYER_ONE)]
+    results = cache.legal_moves_many(positions)
+
+    for (board, player), moves in zip(positions, results):
+        assert moves == get_legal_moves(board, player)
+
+    assert (cache.stats.hits, cache.stats.misses) == (0, 3)
+    assert cache.legal_moves(default_board(), PLAYER_ONE) == results[0]
+    assert cache.stats.hits == 1
@@ -0,0 +1,56 @@
+import numpy as np
+from click.testing import CliRunner
+
+from checkers.io.archive import ArchivedGame, write_games
+from checkers.io.stats import ArchiveStats, collect_stats, archive_stats, read_stats, main, phase_of, \
+    OPENING, MIDDLEGAME, ENDGAME, DRAW_REASONS, RESULT_NAMES
+from checkers.game import default_board
+from checkers.models import Board
+
+GAME = ArchivedGame(["32-28", "19-23", "28x19", "14x23", "37-32"], {"Result": "0-2"})
+ILLEGAL = ArchivedGame(["32-28", "19-23", "28-22", "14x23"], {"Result": "1-1"})
+
+
+def test_collect_stats():
+    stats = collect_stats([GAME, ILLEGAL])
+
+    assert int(stats.games) == 2
+    assert int(stats.incomplete) == 1
+    assert stats.positions.tolist() == [7, 0, 0]
+    assert stats.heatmaps[OPENING].sum() == 5 * 40 + 39 + 38
+    assert stats.heatmaps[OPENING, 0, 31] == 2  # Player one's man on 32 (before 32-28 in both games)
+    assert stats.capture_lengths[:3].tolist() == [5, 2, 0]
+    assert stats.game_lengths[[2, 5]].tolist() == [1, 1]
+    assert stats.results[[RESULT_NAMES.index("0-2"), RESULT_NAMES.index("1-1")]].tolist() == [1, 1]
+    assert stats.draw_reasons[DRAW_REASONS.index("OTHER_DRAW")] == 1
+
+
+def test_phases():
+    assert phase_of(default_board()) == OPENING
+    assert phase_of(Board(list(range(31, 41)), list(range(1, 11)))) == MIDDLEGAME
+    assert phase_of(Board([31, 32], [1])) == ENDGAME
+    assert phase_of(Board(list(range(31, 51)), list(range(1, 21)), kings=[1])) == ENDGAME
+
+
+def test_merge_matches_single_pass():
+    games = [GAME, ILLEGAL] * 3
+    single = collect_stats(games)
+    parallel = archive_stats(iter(games), workers=2, chunk_size=1)
+
+    assert all(np.array_equal(getattr(single, name), getattr(parallel, name)) for name in vars(single))
+
+    merged = ArchiveStats().merge(collect_stats(games[:2])).merge(collect_stats(games[2:]))
+    assert all(np.array_equal(getattr(single, name), getattr(merged, name)) for name in vars(single))
+
+
+def test_summary_file(tmp_path):
+    archive, out = tmp_path / "games.pdn", tmp_path / "summary.json"
+    write_games(str(archive), [GAME, ILLEGAL])
+
+    result = CliRunner().invoke(main, [str(archive), "--out", str(out), "--workers", "1"])
+
+    assert result.exit_code == 0, result.output
+    assert "2 games, 7 positions" in result.output
+
+    stats, expected = read_stats(str(out)), collect_stats([GAME, ILLEGAL])
+    assert all(np.array_equal(getattr(stats, name), value) for name, value in vars(expected).items())
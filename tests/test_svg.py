@@ -0,0 +1,60 @@
+import os
+import xml.etree.ElementTree as ET
+
+from checkers.game import default_board, parse_cmd
+from checkers.models import Board, Move
+from checkers.utils.svg import SvgRenderer, Diagram, render_svg, write_diagrams
+
+SVG = "{http://www.w3.org/2000/svg}"
+
+
+def _uses(svg: str) -> list[tuple[str, str, str]]:
+    root = ET.fromstring(svg)
+    return [(use.get("href"), use.get("x"), use.get("y")) for use in root.findall(f"{SVG}use")]
+
+
+def test_templates_are_defined_once():
+    svg = render_svg(default_board())
+    root = ET.fromstring(svg)
+    defs = root.find(f"{SVG}defs")
+
+    assert {g.get("id") for g in defs.findall(f"{SVG}g")} == {"board", "m1", "k1", "m2", "k2"}
+    assert len(defs.findall(f".//{SVG}text")) == 50
+
+    # The board, then one placement per piece
+    uses = _uses(svg)
+    assert uses[0] == ("#board", None, None)
+    assert sorted(href for href, _, _ in uses[1:]) == ["#m1"] * 20 + ["#m2"] * 20
+
+
+def test_placements():
+    renderer = SvgRenderer()
+
+    # Square 1 is the second square of the top row, 50 the last but one of the bottom row
+    assert _uses(renderer.render(Board([1], [50], kings=[50])))[1:] == [("#m1", "60", "20"), ("#k2", "340", "380")]
+
+
+def test_arrows():
+    renderer = SvgRenderer()
+    board = Board([28], [23, 13])
+    step = ET.fromstring(renderer.render(board, [Move(28, 22)]))
+    capture = ET.fromstring(renderer.render(board, [parse_cmd("28x19x8")]))
+
+    assert step.find(f"{SVG}line").get("marker-end") == "url(#arrow)"
+    assert capture.find(f"{SVG}polyline").get("points") == "180,220 260,140 180,60"
+    assert sorted((use.get("x"), use.get("y")) for use in capture.findall(f"{SVG}use")
+                  if use.get("href") == "#hit") == [("220", "100"), ("220", "180")]
+
+
+def test_write_diagrams(tmp_path):
+    diagrams = [Diagram(default_board(), [Move(32, 28)]), Diagram(Board([28], [23, 13]), name="capture.svg")]
+
+    for workers in (None, 2):
+        out_dir = tmp_path / str(workers)
+        paths = write_diagrams(iter(diagrams), str(out_dir), workers=workers, chunk_size=1)
+
+        assert [os.path.basename(path) for path in paths] == ["000000.svg", "capture.svg"]
+
+        for path, diagram in zip(paths, diagrams):
+            with open(path, encoding="utf-8") as f:
+                assert f.read() == render_svg(diagram.board, diagram.moves)
@@ -0,0 +1,63 @@
+import json
+
+import numpy as np
+
+from checkers.io.archive import ArchivedGame
+from checkers.io.training import encode_games, augment, export, load_shard, encode_position, move_index, \
+    SQUARE_ROTATION, MOVE_ROTATION, ShardWriter
+from checkers.models import Board, Move
+
+GAME = ArchivedGame(["32-28", "19-23", "28x19", "14x23", "37-32"], {"Result": "0-2"})
+
+
+def test_encode_games():
+    samples = encode_games([GAME], with_augmentation=False)
+
+    assert samples["positions"].shape == (5, 4, 50)
+    assert samples["side"].tolist() == [1, 0, 1, 0, 1]
+    assert samples["legal"][0].sum() == 9
+    assert samples["move"][0] == move_index(Move(32, 28))
+    assert samples["outcome"].tolist() == [-1] * 5
+
+
+def test_stops_at_illegal_moves():
+    samples = encode_games([ArchivedGame(["32-28", "19-23", "28-22", "14x23"])], with_augmentation=False)
+
+    assert len(samples["move"]) == 2
+    assert samples["outcome"].tolist() == [0, 0]
+
+
+def test_augmentation():
+    samples = encode_games([GAME], with_augmentation=False)
+    mirrored = augment(samples)
+
+    assert all(np.array_equal(augment(mirrored)[name], samples[name]) for name in samples if name != "keys")
+    assert np.array_equal(mirrored["positions"][0], encode_position(Board(list(range(31, 51)), list(range(1, 21)))))
+    assert mirrored["move"][0] == move_index(Move(19, 23))
+    assert np.array_equal(SQUARE_ROTATION[SQUARE_ROTATION], np.arange(50))
+    assert np.array_equal(MOVE_ROTATION[MOVE_ROTATION], np.arange(2500))
+
+
+def test_export(tmp_path):
+    manifest = export([GAME, GAME], tmp_path, shard_size=4, workers=1, chunk_size=1)
+
+    assert manifest["samples"] == 10
+    assert manifest["duplicates"] == 10
+    assert [s["count"] for s in manifest["shards"]] == [4, 4, 2]
+    assert json.loads((tmp_path / "manifest.json").read_text()) == manifest
+
+    shard = load_shard(tmp_path, 0)
+    assert isinstance(shard["legal"], np.memmap)
+    assert shard["positions"].shape == (4, 4, 50)
+
+
+def test_dedup_memory_is_bounded(tmp_path):
+    samples = encode_games([GAME])
+
+    for max_seen, duplicates in ((10, 10), (4, 0)):
+        writer = ShardWriter(str(tmp_path / str(max_seen)), max_seen=max_seen)
+        writer.add(samples)
+        writer.add(samples)
+
+        assert len(writer.seen) == max_seen
+        assert writer.duplicates == duplicates